@@ -0,0 +1,38 @@
+"""add search_statuses table (shared live search progress)
+
+Revision ID: a8b9c0d1e2f3
+Revises: f7a8b9c0d1e2
+Create Date: 2026-10-16 14:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8b9c0d1e2f3'
+down_revision: Union[str, None] = 'f7a8b9c0d1e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('search_statuses',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('profile_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.JSON(), nullable=False),
+        sa.Column('log', sa.JSON(), nullable=False),
+        sa.Column('stop_requested', sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_search_statuses_id'), 'search_statuses', ['id'], unique=False)
+    op.create_index(op.f('ix_search_statuses_profile_id'), 'search_statuses', ['profile_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_search_statuses_profile_id'), table_name='search_statuses')
+    op.drop_index(op.f('ix_search_statuses_id'), table_name='search_statuses')
+    op.drop_table('search_statuses')
@@ -0,0 +1,35 @@
+"""add scheduler_leases table (single scheduler leader across workers)
+
+Revision ID: b9c0d1e2f3a4
+Revises: a8b9c0d1e2f3
+Create Date: 2026-10-16 16:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9c0d1e2f3a4'
+down_revision: Union[str, None] = 'a8b9c0d1e2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('scheduler_leases',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('holder', sa.String(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_scheduler_leases_id'), 'scheduler_leases', ['id'], unique=False)
+    op.create_index(op.f('ix_scheduler_leases_name'), 'scheduler_leases', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_scheduler_leases_name'), table_name='scheduler_leases')
+    op.drop_index(op.f('ix_scheduler_leases_id'), table_name='scheduler_leases')
+    op.drop_table('scheduler_leases')
@@ -0,0 +1,25 @@
+"""add search_profiles.search_plan (reused by incremental scheduled runs)
+
+Revision ID: c0d1e2f3a4b5
+Revises: b9c0d1e2f3a4
+Create Date: 2026-10-16 18:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0d1e2f3a4b5'
+down_revision: Union[str, None] = 'b9c0d1e2f3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('search_profiles', sa.Column('search_plan', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('search_profiles', 'search_plan')
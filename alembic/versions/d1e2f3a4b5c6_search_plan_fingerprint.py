@@ -0,0 +1,29 @@
+"""add search plan fingerprint, pin flag and generation time to search_profiles
+
+Revision ID: d1e2f3a4b5c6
+Revises: c0d1e2f3a4b5
+Create Date: 2026-10-16 19:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1e2f3a4b5c6'
+down_revision: Union[str, None] = 'c0d1e2f3a4b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('search_profiles', sa.Column('search_plan_fingerprint', sa.String(length=64), nullable=True))
+    op.add_column('search_profiles', sa.Column('search_plan_pinned', sa.Boolean(), nullable=False, server_default=sa.false()))
+    op.add_column('search_profiles', sa.Column('search_plan_generated_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('search_profiles', 'search_plan_generated_at')
+    op.drop_column('search_profiles', 'search_plan_pinned')
+    op.drop_column('search_profiles', 'search_plan_fingerprint')
@@ -0,0 +1,49 @@
+"""make (platform, platform_job_id) unique on scraped_jobs
+
+Revision ID: d5e6f7a8b9c0
+Revises: c4d5e6f7a8b9
+Create Date: 2026-10-16 10:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e6f7a8b9c0'
+down_revision: Union[str, None] = 'c4d5e6f7a8b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Concurrent saves could create duplicate shared rows; point all user jobs
+    # at the oldest copy and drop the rest before adding the unique index.
+    op.execute(
+        """
+        UPDATE jobs SET scraped_job_id = (
+            SELECT MIN(dup.id) FROM scraped_jobs AS orig
+            JOIN scraped_jobs AS dup
+              ON dup.platform = orig.platform AND dup.platform_job_id = orig.platform_job_id
+            WHERE orig.id = jobs.scraped_job_id
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM scraped_jobs WHERE id NOT IN (
+            SELECT keep_id FROM (
+                SELECT MIN(id) AS keep_id FROM scraped_jobs GROUP BY platform, platform_job_id
+            ) AS keep
+        )
+        """
+    )
+    op.create_index(
+        'uq_scraped_jobs_platform_job', 'scraped_jobs',
+        ['platform', 'platform_job_id'], unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_scraped_jobs_platform_job', table_name='scraped_jobs')
@@ -0,0 +1,99 @@
+"""full-text index on scraped_jobs (tsvector + GIN / SQLite FTS5)
+
+Revision ID: e6f7a8b9c0d1
+Revises: d5e6f7a8b9c0
+Create Date: 2026-10-16 12:00:00.000000
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6f7a8b9c0d1'
+down_revision: Union[str, None] = 'd5e6f7a8b9c0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# The DDL is a snapshot of backend/db/fulltext.py at this revision, so later
+# changes to the application module do not alter what this migration does.
+
+SQLITE_CREATE = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS scraped_jobs_fts USING fts5(
+        title, company, description,
+        content='scraped_jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scraped_jobs_fts_ai AFTER INSERT ON scraped_jobs BEGIN
+        INSERT INTO scraped_jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scraped_jobs_fts_ad AFTER DELETE ON scraped_jobs BEGIN
+        INSERT INTO scraped_jobs_fts(scraped_jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS scraped_jobs_fts_au AFTER UPDATE ON scraped_jobs BEGIN
+        INSERT INTO scraped_jobs_fts(scraped_jobs_fts, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+        INSERT INTO scraped_jobs_fts(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    # Index rows that existed before the table was created
+    "INSERT INTO scraped_jobs_fts(scraped_jobs_fts) VALUES ('rebuild')",
+]
+
+SQLITE_DROP = [
+    "DROP TRIGGER IF EXISTS scraped_jobs_fts_ai",
+    "DROP TRIGGER IF EXISTS scraped_jobs_fts_ad",
+    "DROP TRIGGER IF EXISTS scraped_jobs_fts_au",
+    "DROP TABLE IF EXISTS scraped_jobs_fts",
+]
+
+# 'simple' config: listings are in EN/DE/FR/IT, so no language-specific stemming
+POSTGRES_CREATE = [
+    """
+    ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_scraped_jobs_search_vector ON scraped_jobs USING GIN (search_vector)",
+]
+
+POSTGRES_DROP = [
+    "DROP INDEX IF EXISTS ix_scraped_jobs_search_vector",
+    "ALTER TABLE scraped_jobs DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        for statement in POSTGRES_CREATE:
+            op.execute(statement)
+    elif dialect == 'sqlite':
+        try:
+            for statement in SQLITE_CREATE:
+                op.execute(statement)
+        except Exception as e:
+            # e.g. Python built against a SQLite without FTS5; local search uses ILIKE
+            logger.warning(f"SQLite FTS5 unavailable, skipping the full-text index: {e}")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    statements = SQLITE_DROP if dialect == 'sqlite' else POSTGRES_DROP if dialect == 'postgresql' else []
+    for statement in statements:
+        op.execute(statement)
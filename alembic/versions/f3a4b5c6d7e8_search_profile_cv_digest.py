@@ -0,0 +1,27 @@
+"""add cached CV digest to search_profiles
+
+Revision ID: f3a4b5c6d7e8
+Revises: e2f3a4b5c6d7
+Create Date: 2026-10-16 21:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a4b5c6d7e8'
+down_revision: Union[str, None] = 'e2f3a4b5c6d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('search_profiles', sa.Column('cv_digest', sa.JSON(), nullable=True))
+    op.add_column('search_profiles', sa.Column('cv_digest_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('search_profiles', 'cv_digest_hash')
+    op.drop_column('search_profiles', 'cv_digest')
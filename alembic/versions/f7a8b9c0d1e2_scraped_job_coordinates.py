@@ -0,0 +1,29 @@
+"""add latitude/longitude to scraped_jobs
+
+Revision ID: f7a8b9c0d1e2
+Revises: e6f7a8b9c0d1
+Create Date: 2026-10-16 13:00:00.000000
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a8b9c0d1e2'
+down_revision: Union[str, None] = 'e6f7a8b9c0d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('scraped_jobs', sa.Column('latitude', sa.Float(), nullable=True))
+    op.add_column('scraped_jobs', sa.Column('longitude', sa.Float(), nullable=True))
+    op.create_index('ix_scraped_jobs_lat_lon', 'scraped_jobs', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scraped_jobs_lat_lon', table_name='scraped_jobs')
+    op.drop_column('scraped_jobs', 'longitude')
+    op.drop_column('scraped_jobs', 'latitude')
@@ -1,8 +1,9 @@
-from fastapi import Depends, HTTPException
+from typing import Callable, Optional
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from backend.db.base import get_db
-from backend.services.auth import decode_access_token
+from backend.db.base import get_db, get_session_factory
+from backend.services.auth import decode_access_token, decode_stream_token
 from backend.models import User
 import os
 from slowapi import Limiter
@@ -14,6 +15,9 @@ limiter = Limiter(key_func=get_remote_address, enabled=not is_testing)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 def get_current_user_id(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> int:
+    return _user_id_from_token(token, db)
+
+def _user_id_from_token(token: str, db: Session) -> int:
     try:
         payload = decode_access_token(token)
     except Exception:
@@ -30,6 +34,31 @@ def get_current_user_id(token: str = Depends(oauth2_scheme), db: Session = Depen
          raise HTTPException(status_code=401, detail="User not found")
     return user.id
 
+def get_stream_user_id(
+    request: Request,
+    stream_token: Optional[str] = None,
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+) -> int:
+    """User of a status stream, resolved without holding a session for the stream's life.
+
+    Browsers pass a ``stream_token`` in the URL (EventSource cannot set
+    headers); other clients may send the usual Bearer access token.
+    """
+    if stream_token:
+        user_id = decode_stream_token(stream_token)
+        if user_id is None:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        return user_id
+
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    db = session_factory()
+    try:
+        return _user_id_from_token(token, db)
+    finally:
+        db.close()
+
 def get_job_service(db: Session = Depends(get_db)):
     from backend.services.job_service import get_job_service
     return get_job_service(db)
@@ -2,7 +2,7 @@ from typing import List
 from fastapi import APIRouter, Depends
 from backend.api.deps import get_current_user_id, get_profile_service
 from backend.services.profile_service import ProfileService
-from backend.schemas import SearchProfile, SearchProfileCreate, ScheduleToggle
+from backend.schemas import SearchProfile, SearchProfileCreate, ScheduleToggle, SearchPlan, SearchPlanUpdate
 
 router = APIRouter()
 
@@ -40,3 +40,28 @@ def toggle_schedule(
 ):
     return profile_service.toggle_schedule(user_id, profile_id, schedule)
 
+@router.get("/{profile_id}/plan", response_model=SearchPlan)
+def read_search_plan(
+    profile_id: int,
+    user_id: int = Depends(get_current_user_id),
+    profile_service: ProfileService = Depends(get_profile_service)
+):
+    return profile_service.get_search_plan(user_id, profile_id)
+
+@router.put("/{profile_id}/plan", response_model=SearchPlan)
+def update_search_plan(
+    profile_id: int,
+    plan_in: SearchPlanUpdate,
+    user_id: int = Depends(get_current_user_id),
+    profile_service: ProfileService = Depends(get_profile_service)
+):
+    return profile_service.update_search_plan(user_id, profile_id, plan_in)
+
+@router.delete("/{profile_id}/plan", response_model=SearchPlan)
+def clear_search_plan(
+    profile_id: int,
+    user_id: int = Depends(get_current_user_id),
+    profile_service: ProfileService = Depends(get_profile_service)
+):
+    return profile_service.clear_search_plan(user_id, profile_id)
+
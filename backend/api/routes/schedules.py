@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends
 from typing import Dict, Any, List
 
 from backend.api.deps import get_current_user_id
-from backend.services.scheduler import get_scheduler, get_all_schedules
+from backend.services.scheduler import get_scheduler, get_all_schedules, is_leader
+from backend.services.search_service import search_governor
 
 router = APIRouter()
 
@@ -15,6 +16,10 @@ def get_scheduler_status(
     scheduler = get_scheduler()
     return {
         "running": scheduler.running if scheduler else False,
+        # Only the leader process triggers runs; the others stand by
+        "leader": is_leader(),
+        "searches_running": search_governor.running,
+        "searches_queued": search_governor.queued,
         "jobs_scheduled": len(scheduler.get_jobs()) if scheduler and scheduler.running else 0,
     }
 
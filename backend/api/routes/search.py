@@ -1,12 +1,18 @@
+import asyncio
 import logging
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, BackgroundTasks, UploadFile, File, HTTPException
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, BackgroundTasks, UploadFile, File, Header, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
-from backend.db.base import get_db
+from backend.core.config import settings
+from backend.db.base import get_db, get_session_factory
 from backend.repositories.profile_repository import ProfileRepository
-from backend.api.deps import get_current_user_id
+from backend.api.deps import get_current_user_id, get_stream_user_id
+from backend.services.auth import create_stream_token
 from backend.services.search_status import get_status
 from backend.services.utils import extract_text_from_file
 
@@ -88,8 +94,10 @@ async def start_search(
     return {"message": "Search started", "profile_id": profile.id}
 
 
+# Sync route: the DB write and the status backend's stop signal (a flush and
+# an UPDATE with the database backend) run in the threadpool, not on the loop
 @router.post("/stop/{profile_id}")
-async def stop_search(
+def stop_search(
     profile_id: int,
     db: Session = Depends(get_db),
     user_id: int = Depends(get_current_user_id),
@@ -100,19 +108,42 @@ async def stop_search(
     if not profile or profile.user_id != user_id:
         raise HTTPException(status_code=403, detail="Unauthorized profile access")
         
+    # The DB flag reaches searches running in other processes
     profile.is_stopped = True
     profile_repo.update(profile, {"is_stopped": True})
     
     # Also update the in-memory status so frontend sees it immediately
-    from backend.services.search_status import update_status, cancel_task
+    from backend.services.search_status import update_status, request_stop
     update_status(profile_id, state="stopped", error="Search stopped by user.")
     
-    # Explicitly cancel the background task if it exists
-    cancel_task(profile_id)
+    # Signal the search running in this process; it stops launching queries
+    # and analyses and flushes what was already analyzed
+    request_stop(profile_id)
     
     return {"message": "Search stopped successfully"}
 
 
+# ── status streams ───────────────────────────────────────────────────────
+# Streams stay open for minutes: they check access in a short-lived session
+# instead of holding one from get_db for their whole life.
+
+def _owns_profile(session_factory: Callable[[], Session], user_id: int, profile_id: int) -> bool:
+    db = session_factory()
+    try:
+        profile = ProfileRepository(db).get(profile_id)
+        return profile is not None and profile.user_id == user_id
+    finally:
+        db.close()
+
+
+def _event_stream(events) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/status/all")
 def get_all_search_statuses(
     user_id: int = Depends(get_current_user_id),
@@ -120,6 +151,39 @@ def get_all_search_statuses(
     from backend.services.search_status import get_all_statuses
     return get_all_statuses()
 
+
+@router.post("/status/stream-token")
+def create_status_stream_token(
+    user_id: int = Depends(get_current_user_id),
+):
+    """Short-lived token for opening status streams from a browser ``EventSource``."""
+    return {
+        "stream_token": create_stream_token(user_id),
+        "expires_in": settings.SEARCH_STATUS_STREAM_TOKEN_SECONDS,
+    }
+
+
+@router.get("/status/all/stream")
+async def stream_all_search_statuses(
+    request: Request,
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+    user_id: int = Depends(get_stream_user_id),
+):
+    """Server-sent events with the status deltas of all of the user's profiles."""
+    from backend.services.status_stream import all_status_events
+
+    async def owns(profile_id: int) -> bool:
+        return await asyncio.to_thread(_owns_profile, session_factory, user_id, profile_id)
+
+    events = all_status_events(
+        owns,
+        poll_interval=settings.SEARCH_STATUS_STREAM_POLL_MS / 1000,
+        heartbeat=settings.SEARCH_STATUS_STREAM_HEARTBEAT_SECONDS,
+        is_disconnected=request.is_disconnected,
+    )
+    return _event_stream(events)
+
+
 @router.get("/status/{profile_id}")
 def get_search_status(
     profile_id: int,
@@ -127,3 +191,40 @@ def get_search_status(
 ):
     """Get the current status of a background search for the given profile."""
     return get_status(profile_id)
+
+
+@router.get("/status/{profile_id}/stream")
+async def stream_search_status(
+    profile_id: int,
+    request: Request,
+    last_event_id: Optional[str] = None,
+    last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+    user_id: int = Depends(get_stream_user_id),
+):
+    """Server-sent events with status deltas and new log lines.
+
+    Reconnecting clients resume via the ``Last-Event-ID`` header (or the
+    ``last_event_id`` query parameter) and only receive what they missed.
+    """
+    if not await asyncio.to_thread(_owns_profile, session_factory, user_id, profile_id):
+        raise HTTPException(status_code=403, detail="Unauthorized profile access")
+
+    from backend.services.status_stream import status_events
+    events = status_events(
+        profile_id,
+        last_event_id=last_event_id_header or last_event_id,
+        poll_interval=settings.SEARCH_STATUS_STREAM_POLL_MS / 1000,
+        heartbeat=settings.SEARCH_STATUS_STREAM_HEARTBEAT_SECONDS,
+        is_disconnected=request.is_disconnected,
+    )
+    return _event_stream(events)
+
+
+@router.get("/llm-cache/stats")
+def get_llm_cache_stats(
+    user_id: int = Depends(get_current_user_id),
+):
+    """Hit/miss counters of the persistent LLM response cache."""
+    from backend.services.llm_service import llm_service
+    return llm_service.cache_stats()
@@ -1,4 +1,4 @@
-from typing import List, Union, Any, Optional
+from typing import Dict, List, Union, Any, Optional
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -51,6 +51,20 @@ class Settings(BaseSettings):
     LLM_THINKING: bool = False
     LLM_THINKING_LEVEL: str = "OFF"
 
+    # Keep-alive connection pool shared by all calls of a cached provider
+    LLM_HTTP_MAX_CONNECTIONS: int = 100
+    LLM_HTTP_MAX_KEEPALIVE: int = 20
+    LLM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    # In-flight calls per model, shared by every search (0 = unlimited)
+    LLM_MAX_CONCURRENT_CALLS: int = 16
+
+    # Persistent response cache (steps listed here are answered from the DB
+    # when an identical prompt was already sent to the same model)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_STEPS: str = "relevance,match,digest"
+    LLM_CACHE_TTL_HOURS: int = 24 * 14
+    LLM_CACHE_MAX_ENTRIES: int = 50000
+
     # ─── Per-step LLM overrides (all optional — empty/zero = use global) ───────
     #
     # Step: PLAN  (generate_search_plan)
@@ -74,6 +88,10 @@ class Settings(BaseSettings):
     LLM_RELEVANCE_MAX_TOKENS: int = 0
     LLM_RELEVANCE_THINKING: bool = False
     LLM_RELEVANCE_THINKING_LEVEL: str = ""
+    # Titles classified per relevance call; chunks shrink further so that the
+    # expected answer (≈ TOKENS_PER_TITLE each) fits into max_tokens
+    LLM_RELEVANCE_BATCH_SIZE: int = 25
+    LLM_RELEVANCE_TOKENS_PER_TITLE: int = 60
 
     # Step: MATCH  (analyze_job_match)
     LLM_MATCH_PROVIDER: str = ""
@@ -85,10 +103,120 @@ class Settings(BaseSettings):
     LLM_MATCH_MAX_TOKENS: int = 0
     LLM_MATCH_THINKING: bool = False
     LLM_MATCH_THINKING_LEVEL: str = ""
+    # Prompt budgets in estimated tokens (0 = send everything): a longer CV is
+    # replaced by a digest, generated once per CV content; job descriptions
+    # are trimmed once per job when it is normalized
+    LLM_MATCH_CV_TOKEN_BUDGET: int = 600
+    LLM_MATCH_JOB_TOKEN_BUDGET: int = 800
+
+    # Step: DIGEST  (agenerate_cv_digest — condenses a long CV for matching)
+    LLM_DIGEST_PROVIDER: str = ""
+    LLM_DIGEST_MODEL: str = ""
+    LLM_DIGEST_API_KEY: str = ""
+    LLM_DIGEST_BASE_URL: str = ""
+    LLM_DIGEST_TEMPERATURE: float = 0.0
+    LLM_DIGEST_TOP_P: float = 0.0
+    LLM_DIGEST_MAX_TOKENS: int = 0
+    LLM_DIGEST_THINKING: bool = False
+    LLM_DIGEST_THINKING_LEVEL: str = ""
 
     # Scraping
     JOB_ROOM_USER_AGENT: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 
+    # Job-Room harvest mode: fetch every result page (not just the first),
+    # up to MAX_RESULTS listings per query, HARVEST_CONCURRENCY pages at a time
+    JOB_ROOM_HARVEST_ENABLED: bool = False
+    JOB_ROOM_HARVEST_MAX_RESULTS: int = 500
+    JOB_ROOM_HARVEST_CONCURRENCY: int = 3
+    # Keep-alive pool of the shared Job-Room session (one per app, reused by
+    # every search together with its CSRF token)
+    JOB_ROOM_HTTP_MAX_CONNECTIONS: int = 20
+    JOB_ROOM_HTTP_MAX_KEEPALIVE: int = 10
+    JOB_ROOM_HTTP_KEEPALIVE_EXPIRY: float = 30.0
+
+    # SwissDevJobs jobsLight feed: seconds a downloaded snapshot is reused
+    # before it is revalidated (ETag / If-Modified-Since)
+    SWISSDEVJOBS_FEED_MAX_AGE_SECONDS: float = 300.0
+    # Parallel job-detail requests per SwissDevJobs query
+    SWISSDEVJOBS_DETAIL_CONCURRENCY: int = 8
+
+    # ─── Search execution ──────────────────────────────────────────────────────
+    # Max in-flight requests per job provider; overrides use "name:limit,…"
+    SEARCH_PROVIDER_CONCURRENCY: int = 4
+    SEARCH_PROVIDER_CONCURRENCY_OVERRIDES: Optional[str] = "swissdevjobs:2,local_db:1"
+
+    @staticmethod
+    def _parse_limits(overrides: Optional[str]) -> Dict[str, int]:
+        limits: Dict[str, int] = {}
+        for item in (overrides or "").split(","):
+            name, _, value = item.partition(":")
+            if name.strip() and value.strip().isdigit():
+                limits[name.strip()] = int(value.strip())
+        return limits
+
+    @property
+    def provider_concurrency_limits(self) -> Dict[str, int]:
+        return self._parse_limits(self.SEARCH_PROVIDER_CONCURRENCY_OVERRIDES)
+
+    # Same, but shared by every search running in the process (0 = unlimited)
+    SEARCH_GLOBAL_PROVIDER_CONCURRENCY: int = 8
+    SEARCH_GLOBAL_PROVIDER_CONCURRENCY_OVERRIDES: Optional[str] = "swissdevjobs:4,local_db:2"
+
+    @property
+    def global_provider_concurrency_limits(self) -> Dict[str, int]:
+        return self._parse_limits(self.SEARCH_GLOBAL_PROVIDER_CONCURRENCY_OVERRIDES)
+
+    # Streaming pipeline (fetch → dedup → relevance → match → persist)
+    SEARCH_PIPELINE_QUEUE_SIZE: int = 100
+    SEARCH_ANALYSIS_CONCURRENCY: int = 10
+    # How long a relevance worker waits to fill a title batch
+    SEARCH_RELEVANCE_BATCH_WAIT_MS: int = 50
+    # Analyzed jobs are written in bulk every N rows or T ms, whichever first
+    SEARCH_PERSIST_BATCH_SIZE: int = 50
+    SEARCH_PERSIST_FLUSH_MS: int = 500
+    # Listings whose normalized form (clean text, parsed fields, match
+    # summary) is kept in memory for reuse by later runs and profiles
+    SEARCH_NORMALIZED_JOB_CACHE_SIZE: int = 5000
+    # How often a running search re-reads the DB stop flag (cross-process stops)
+    SEARCH_STOP_POLL_SECONDS: float = 2.0
+    # On shutdown, running searches are asked to stop and get this long to
+    # save what they analyzed before they are cancelled
+    SEARCH_SHUTDOWN_GRACE_SECONDS: float = 30.0
+    # Where live search progress is kept: "memory" (single process) or "db"
+    # (shared by all worker processes; writes are coalesced every FLUSH_MS)
+    SEARCH_STATUS_BACKEND: str = "memory"
+    SEARCH_STATUS_FLUSH_MS: int = 500
+    # Status event streams wake on every change made by this process; POLL_MS
+    # is the fallback re-read that picks up changes from other processes (db
+    # backend). HEARTBEAT is the idle time before a keep-alive comment, and
+    # TOKEN_SECONDS the lifetime of the URL token EventSource connects with
+    SEARCH_STATUS_STREAM_POLL_MS: int = 5000
+    SEARCH_STATUS_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    SEARCH_STATUS_STREAM_TOKEN_SECONDS: int = 300
+
+    # ─── Scheduler ─────────────────────────────────────────────────────────────
+    # Scheduled searches are kept in a job store ("db": shared apscheduler_jobs
+    # table, "memory": per process) and triggered only by the process holding
+    # the scheduler lease; the lease expires TTL seconds after its last renewal
+    SCHEDULER_JOBSTORE: str = "db"
+    SCHEDULER_LEASE_TTL_SECONDS: float = 60.0
+    # Scheduled searches beyond this many wait in a FIFO queue (0 = unlimited);
+    # a schedule's first start is delayed by a random 0..JITTER seconds (later
+    # runs keep that offset) so schedules sharing an interval do not fire at once
+    SCHEDULER_MAX_CONCURRENT_SEARCHES: int = 2
+    SCHEDULER_START_JITTER_SECONDS: int = 600
+    # Scheduled re-runs reuse the saved plan and only fetch postings newer
+    # than the previous run (False = every run is a full search)
+    SCHEDULER_INCREMENTAL: bool = True
+
+    # Local title pre-filter: titles containing a plan query (words matching
+    # at ≥ ACCEPT_ABOVE) are kept without an LLM call; the rest goes to the
+    # LLM. Titles scoring below REJECT_BELOW against the role/plan vocabulary
+    # are dropped (0 = never reject locally; synonyms and translations score low)
+    SEARCH_PREFILTER_ENABLED: bool = True
+    SEARCH_PREFILTER_REJECT_BELOW: float = 0.0
+    SEARCH_PREFILTER_ACCEPT_ABOVE: float = 0.85
+
     # Logging
     LOG_LEVEL: str = "INFO"
 
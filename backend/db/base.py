@@ -25,3 +25,7 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_session_factory():
+    """For handlers that must not hold a session for the whole request (streams)."""
+    return SessionLocal
@@ -0,0 +1,155 @@
+"""
+Full-text index over ``scraped_jobs`` (title, company, description).
+
+- PostgreSQL: a generated, weighted ``search_vector`` tsvector column with a
+  GIN index.
+- SQLite: an external-content FTS5 table ``scraped_jobs_fts`` kept in sync by
+  triggers.
+
+The objects are created by the Alembic migration and, for databases built
+with ``create_all`` (tests, quick local setups), by the table DDL events
+registered on ``ScrapedJob``.  Other dialects — or a SQLite build without
+FTS5 — simply have no index and the local search falls back to ``ILIKE``.
+"""
+
+import logging
+import re
+import weakref
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+FTS_TABLE = "scraped_jobs_fts"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Title matches outrank company matches, which outrank description matches
+SQLITE_BM25_WEIGHTS = (10.0, 5.0, 1.0)
+
+_SQLITE_CREATE = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, company, description,
+        content='scraped_jobs', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON scraped_jobs BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON scraped_jobs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE ON scraped_jobs BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, company, description)
+        VALUES ('delete', old.id, old.title, old.company, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, company, description)
+        VALUES (new.id, new.title, new.company, new.description);
+    END
+    """,
+    # Index rows that existed before the table was created
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+_SQLITE_DROP = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+# 'simple' config: listings are in EN/DE/FR/IT, so no language-specific stemming
+_POSTGRES_CREATE = [
+    f"""
+    ALTER TABLE scraped_jobs ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(company, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    f"CREATE INDEX IF NOT EXISTS ix_scraped_jobs_{SEARCH_VECTOR_COLUMN} "
+    f"ON scraped_jobs USING GIN ({SEARCH_VECTOR_COLUMN})",
+]
+
+_POSTGRES_DROP = [
+    f"DROP INDEX IF EXISTS ix_scraped_jobs_{SEARCH_VECTOR_COLUMN}",
+    f"ALTER TABLE scraped_jobs DROP COLUMN IF EXISTS {SEARCH_VECTOR_COLUMN}",
+]
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Engines on which the index was found, so the check runs once per engine
+_available: "weakref.WeakSet[Engine]" = weakref.WeakSet()
+
+
+def create_fulltext_index(connection: Connection) -> None:
+    """Create the dialect's full-text objects (no-op where unsupported)."""
+    dialect = connection.dialect.name
+    statements = _SQLITE_CREATE if dialect == "sqlite" else _POSTGRES_CREATE if dialect == "postgresql" else []
+    try:
+        for statement in statements:
+            connection.execute(text(statement))
+    except Exception as e:
+        if dialect != "sqlite":
+            raise
+        # e.g. Python built against a SQLite without FTS5
+        logger.warning(f"[Full-text] SQLite FTS5 unavailable, local search will use ILIKE: {e}")
+
+
+def drop_fulltext_index(connection: Connection) -> None:
+    dialect = connection.dialect.name
+    statements = _SQLITE_DROP if dialect == "sqlite" else _POSTGRES_DROP if dialect == "postgresql" else []
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+def fulltext_backend(engine: Engine) -> Optional[str]:
+    """``"fts5"``, ``"tsvector"`` or ``None`` if *engine* has no full-text index."""
+    dialect = engine.dialect.name
+    backend = {"sqlite": "fts5", "postgresql": "tsvector"}.get(dialect)
+    if backend is None or engine in _available:
+        return backend
+
+    if dialect == "sqlite":
+        probe = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+        params = {"name": FTS_TABLE}
+    else:
+        probe = text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_name = 'scraped_jobs' AND column_name = :name"
+        )
+        params = {"name": SEARCH_VECTOR_COLUMN}
+    try:
+        with engine.connect() as conn:
+            found = conn.execute(probe, params).first() is not None
+    except Exception as e:
+        logger.warning(f"[Full-text] Could not probe for the full-text index: {e}")
+        return None
+
+    # Only positive results are remembered: the index may be created later
+    if found:
+        _available.add(engine)
+    return backend if found else None
+
+
+def query_words(query: str) -> List[str]:
+    """Words of a free-text query, stripped of the search syntax of either backend."""
+    return _WORD_RE.findall(query or "")
+
+
+def sqlite_match_expression(words: List[str]) -> str:
+    # Every word must match as a prefix of some indexed token
+    return " ".join(f'"{w}"*' for w in words)
+
+
+def postgres_tsquery(words: List[str]) -> str:
+    return " & ".join(f"{w.lower()}:*" for w in words)
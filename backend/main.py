@@ -32,16 +32,41 @@ async def lifespan(app: FastAPI):
     # Startup: create DB tables
     # Moved to backend/pre_start.py to avoid race conditions with multiple workers
 
+    # Startup: shared job providers (pooled clients, one Job-Room CSRF token),
+    # opened before the scheduler can start a search that uses them
+    from backend.providers.jobs.registry import open_provider_registry, close_provider_registry
+    from backend.services.search_service import build_shared_providers
+
+    open_provider_registry(build_shared_providers)
+
     # Startup: start scheduler
-    from backend.services.scheduler import start_scheduler, stop_scheduler
+    from backend.services.scheduler import start_scheduler, pause_scheduler, stop_scheduler
 
     start_scheduler()
 
     yield
 
-    # Shutdown: stop scheduler
+    # Shutdown: start no new scheduled searches, and let running ones
+    # (scheduled or started from the API) stop and save their results
+    from backend.services.search_status import stop_active_searches
+
+    pause_scheduler()
+    await stop_active_searches(settings.SEARCH_SHUTDOWN_GRACE_SECONDS)
     stop_scheduler()
 
+    # Shutdown: close the shared job providers' HTTP clients
+    await close_provider_registry()
+
+    # Shutdown: write out buffered search status updates
+    from backend.services.search_status import close_status_backend
+
+    close_status_backend()
+
+    # Shutdown: release pooled LLM connections
+    from backend.providers.llm.factory import close_providers
+
+    await close_providers()
+
 
 # ─── App ───
 app = FastAPI(
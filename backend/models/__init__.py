@@ -1,4 +1,7 @@
 from backend.models.user import User
 from backend.models.search_profile import SearchProfile
 from backend.models.job import Job, ScrapedJob
+from backend.models.llm_cache import LLMCacheEntry
+from backend.models.search_status import SearchStatusRecord
 from backend.models.base_model import BaseModel
+from backend.models.scheduler_lease import SchedulerLease
@@ -1,10 +1,17 @@
-from sqlalchemy import Column, String, Boolean, Float, Text, DateTime, ForeignKey, JSON, Integer
+from sqlalchemy import Column, String, Boolean, Float, Text, DateTime, ForeignKey, JSON, Integer, Index, event
 from sqlalchemy.orm import relationship
+from backend.db.fulltext import create_fulltext_index, drop_fulltext_index
 from backend.models.base_model import BaseModel, TimestampMixin
 
 
 class ScrapedJob(BaseModel, TimestampMixin):
     __tablename__ = "scraped_jobs"
+    __table_args__ = (
+        # Conflict target for bulk upserts — one shared row per platform listing
+        Index("uq_scraped_jobs_platform_job", "platform", "platform_job_id", unique=True),
+        # Bounding-box pre-filter for radius searches
+        Index("ix_scraped_jobs_lat_lon", "latitude", "longitude"),
+    )
 
     platform = Column(String, index=True, nullable=False)
     platform_job_id = Column(String, index=True, nullable=False)
@@ -13,6 +20,8 @@ class ScrapedJob(BaseModel, TimestampMixin):
     company = Column(String, index=True, nullable=False)
     description = Column(Text)
     location = Column(String, index=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
     
     # Generic URLs
     external_url = Column(String, index=True, nullable=False)
@@ -24,6 +33,9 @@ class ScrapedJob(BaseModel, TimestampMixin):
     
     # For provider-specific details (JobRoom, SwissDevJobs, etc)
     raw_metadata = Column(JSON, nullable=True)
+
+    # Compact job description used in match prompts, built once per job
+    summary = Column(JSON, nullable=True)
     
     # Keep track of where it originally came from (optional but useful)
     source_query = Column(String)
@@ -32,6 +44,12 @@ class ScrapedJob(BaseModel, TimestampMixin):
     user_jobs = relationship("Job", back_populates="scraped_job", cascade="all, delete-orphan")
 
 
+# Full-text objects live outside the ORM metadata (FTS5 table / generated
+# tsvector column); keep them in step with create_all / drop_all.
+event.listen(ScrapedJob.__table__, "after_create", lambda target, connection, **kw: create_fulltext_index(connection))
+event.listen(ScrapedJob.__table__, "before_drop", lambda target, connection, **kw: drop_fulltext_index(connection))
+
+
 class Job(BaseModel, TimestampMixin):
     __tablename__ = "jobs"
 
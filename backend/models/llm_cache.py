@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, DateTime, JSON
+from backend.models.base_model import BaseModel, TimestampMixin
+
+
+class LLMCacheEntry(BaseModel, TimestampMixin):
+    __tablename__ = "llm_response_cache"
+
+    # sha256 of (step, model_id, system_prompt, user_prompt)
+    key = Column(String(64), unique=True, index=True, nullable=False)
+    step = Column(String, index=True, nullable=False)
+    model_id = Column(String, nullable=False)
+
+    response = Column(JSON, nullable=False)
+
+    expires_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    last_accessed_at = Column(DateTime(timezone=True), index=True, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, DateTime, String
+from backend.models.base_model import BaseModel
+
+
+class SchedulerLease(BaseModel):
+    """Time-limited leadership claim; one row per lease name."""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, unique=True, index=True, nullable=False)
+    # Process currently holding the lease ("host:pid:nonce")
+    holder = Column(String, nullable=False)
+    # The lease is free to take once this has passed without a renewal
+    expires_at = Column(DateTime(timezone=True), nullable=False)
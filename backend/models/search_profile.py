@@ -31,6 +31,18 @@ class SearchProfile(BaseModel, TimestampMixin):
     schedule_enabled = Column(Boolean, default=False)
     schedule_interval_hours = Column(Integer, default=24)
     last_scheduled_run = Column(DateTime(timezone=True), nullable=True)
+    # Queries ({query, domain}) of the saved search plan, reused while the
+    # fingerprint of its inputs matches (or always, when pinned)
+    search_plan = Column(JSON, nullable=True)
+    search_plan_fingerprint = Column(String(64), nullable=True)
+    search_plan_pinned = Column(Boolean, default=False, nullable=False)
+    search_plan_generated_at = Column(DateTime(timezone=True), nullable=True)
+    # Start of the last scheduled run that finished without errors or a
+    # stop; incremental runs fetch postings published since then
+    search_completed_through = Column(DateTime(timezone=True), nullable=True)
+    # Condensed CV sent in match prompts, valid while the CV hash matches
+    cv_digest = Column(JSON, nullable=True)
+    cv_digest_hash = Column(String(64), nullable=True)
     
     # Advanced / Extensible preferences
     advanced_preferences = Column(JSON, nullable=True)
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Boolean, JSON
+from backend.models.base_model import BaseModel, TimestampMixin
+
+
+class SearchStatusRecord(BaseModel, TimestampMixin):
+    """Live progress of a search, shared by every worker process."""
+    __tablename__ = "search_statuses"
+
+    profile_id = Column(Integer, unique=True, index=True, nullable=False)
+
+    # Status fields (state, counters, …) without the log
+    status = Column(JSON, nullable=False)
+    # Most recent log entries, oldest first
+    log = Column(JSON, nullable=False)
+
+    # Set by a stop request from any process; read by the running search
+    stop_requested = Column(Boolean, default=False, nullable=False)
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import nullcontext
+from typing import AsyncContextManager, AsyncIterator, Callable, List, Optional
 from backend.providers.jobs.models import JobListing, JobSearchRequest, ProviderInfo
 
 class JobProvider(ABC):
@@ -19,3 +20,19 @@ class JobProvider(ABC):
         """Search for jobs."""
         pass
 
+
+    async def iter_search(
+        self,
+        request: JobSearchRequest,
+        page_slot: Optional[Callable[[], AsyncContextManager]] = None,
+    ) -> AsyncIterator[List[JobListing]]:
+        """Yield search results page by page.
+
+        Every request is made inside a ``page_slot()`` (when given), so the
+        caller's concurrency limits count pages, not calls.  The default
+        yields the single page returned by ``search``; providers that can
+        fetch more pages override this.
+        """
+        async with page_slot() if page_slot else nullcontext():
+            response = await self.search(request)
+        yield list(response.items)
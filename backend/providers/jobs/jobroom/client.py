@@ -8,10 +8,14 @@ Production-grade client for job-room.ch with:
 - Multiple execution modes
 """
 
+import asyncio
 import logging
 import time
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Any, cast
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, List, Optional, cast
+
+import httpx
 
 from backend.providers.jobs.exceptions import (
     ProviderError,
@@ -46,6 +50,7 @@ from backend.providers.jobs.jobroom.constants import (
     API_BASE,
     BASE_URL,
     LANGUAGE_PARAMS,
+    MAX_PAGE_SIZE,
     SEARCH_ENDPOINT,
 )
 from backend.providers.jobs.jobroom.mapper import BFSLocationMapper
@@ -63,6 +68,10 @@ class JobRoomProvider(BaseJobProvider):
     job portal data. Supports all available filters and handles the
     Angular CSRF security mechanism.
 
+    In harvest mode (``harvest=True``) ``iter_search`` reads ``total_count``
+    from the first page and fetches the remaining pages concurrently, up to
+    ``harvest_max_results`` listings.
+
     Usage:
         async with JobRoomProvider() as provider:
             response = await provider.search(JobSearchRequest(
@@ -80,13 +89,20 @@ class JobRoomProvider(BaseJobProvider):
         mode: ExecutionMode = ExecutionMode.STEALTH,
         proxy_pool: ProxyPool | None = None,
         include_raw_data: bool = False,
+        harvest: bool = False,
+        harvest_max_results: int = 500,
+        harvest_concurrency: int = 3,
+        http_limits: httpx.Limits | None = None,
     ):
         self._mode = mode
         self._proxy_pool = proxy_pool
         self._include_raw_data = include_raw_data
         self._session: ScraperSession | None = None
         self._mapper = BFSLocationMapper()
-        self._csrf_initialized = False
+        self._http_limits = http_limits
+        self._harvest = harvest
+        self._harvest_max_results = max(1, harvest_max_results)
+        self._harvest_concurrency = max(1, harvest_concurrency)
 
     @property
     def name(self) -> str:
@@ -133,19 +149,18 @@ class JobRoomProvider(BaseJobProvider):
                 mode=self._mode,
                 proxy_pool=self._proxy_pool,
                 base_url=BASE_URL,
+                limits=self._http_limits,
             )
             await self._session.start()
 
-        if self._session and not self._csrf_initialized:
-            await self._session.refresh_csrf_token(BASE_URL)
-            self._csrf_initialized = True
+        # Fetched once per session and shared by concurrent searches
+        await self._session.ensure_csrf_token(BASE_URL)
 
     async def close(self) -> None:
         """Close provider resources."""
         if self._session:
             await self._session.close()
             self._session = None
-            self._csrf_initialized = False
 
     # =========================================================================
     # Search Implementation
@@ -204,6 +219,68 @@ class JobRoomProvider(BaseJobProvider):
             logger.error(f"Search failed: {e}")
             raise ProviderError(self.name, f"Search failed: {e}") from e
 
+    async def iter_search(
+        self,
+        request: JobSearchRequest,
+        page_slot: Optional[Callable[[], AsyncContextManager]] = None,
+    ) -> AsyncIterator[List[JobListing]]:
+        """Yield result pages; in harvest mode fetch all pages up to the cap.
+
+        Each page request holds a ``page_slot()``, so harvested pages count
+        against the caller's per-provider limits like any other request.
+        """
+        slot = page_slot or nullcontext
+        if not self._harvest:
+            async with slot():
+                response = await self.search(request)
+            yield list(response.items)
+            return
+
+        cap = self._harvest_max_results
+        request = request.model_copy(update={"page": 0, "page_size": MAX_PAGE_SIZE})
+        async with slot():
+            first = await self.search(request)
+
+        yielded = min(len(first.items), cap)
+        yield list(first.items[:cap])
+
+        total_pages = (min(first.total_count, cap) + request.page_size - 1) // request.page_size
+        if total_pages <= 1 or yielded >= cap:
+            return
+
+        logger.info(
+            f"[{self.name}] Harvesting {total_pages - 1} more pages for '{request.query}' "
+            f"({first.total_count} results, cap {cap})"
+        )
+        semaphore = asyncio.Semaphore(self._harvest_concurrency)
+
+        async def fetch_page(page: int) -> JobSearchResponse:
+            async with semaphore, slot():
+                return await self.search(request.model_copy(update={"page": page}))
+
+        tasks = [asyncio.create_task(fetch_page(page)) for page in range(1, total_pages)]
+        try:
+            # Pages are fetched concurrently but yielded in page order (newest
+            # first), so callers may stop at a page holding nothing new
+            for task in tasks:
+                try:
+                    response = await task
+                except ProviderError as e:
+                    # A failed page only loses its own listings
+                    logger.warning(f"[{self.name}] Harvest page failed: {e}")
+                    continue
+
+                items = response.items[:cap - yielded]
+                if items:
+                    yielded += len(items)
+                    yield list(items)
+                if yielded >= cap:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     # =========================================================================
     # Job Details Implementation
     # =========================================================================
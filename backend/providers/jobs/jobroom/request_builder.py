@@ -1,5 +1,7 @@
 import logging
-from typing import Any
+import math
+from datetime import datetime, timezone
+from typing import Any, Optional
 
 from backend.providers.jobs.models import ContractType, JobSearchRequest, SortOrder
 from backend.providers.jobs.jobroom.constants import SEARCH_ENDPOINT, LANGUAGE_PARAMS
@@ -8,6 +10,19 @@ from backend.providers.jobs.jobroom.mapper import BFSLocationMapper
 logger = logging.getLogger(__name__)
 
 
+def online_since_days(request: JobSearchRequest) -> Optional[int]:
+    """``onlineSince`` (whole days): the posting window, narrowed by ``posted_since``."""
+    days = request.posted_within_days
+    if request.posted_since is None:
+        return days
+    since = request.posted_since
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    elapsed = (datetime.now(timezone.utc) - since).total_seconds() / 86400
+    since_days = max(1, math.ceil(elapsed))
+    return since_days if days is None else min(days, since_days)
+
+
 def build_search_payload(request: JobSearchRequest, mapper: BFSLocationMapper) -> dict[str, Any]:
     """Build the API request payload with all filters for job-room.ch."""
     communal_codes = list(request.communal_codes)
@@ -52,7 +67,7 @@ def build_search_payload(request: JobSearchRequest, mapper: BFSLocationMapper) -
         "workloadPercentageMax": request.workload_max,
         "permanent": permanent,
         "companyName": request.company_name,
-        "onlineSince": request.posted_within_days,
+        "onlineSince": online_since_days(request),
         "displayRestricted": request.display_restricted,
         "professionCodes": [
             {"type": "AVAM", "value": code} for code in request.profession_codes
@@ -1,8 +1,8 @@
 import logging
 import time
-from typing import List
+from typing import List, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import and_, func, literal_column, or_, select, table
 
 from backend.providers.jobs.base import JobProvider
 from backend.providers.jobs.models import (
@@ -11,9 +11,20 @@ from backend.providers.jobs.models import (
     JobListing,
     ProviderInfo,
     JobLocation,
-    EmploymentDetails
+    EmploymentDetails,
+    Coordinates,
+    RadiusSearchRequest,
 )
-from backend.services.utils import haversine_distance
+from backend.db.fulltext import (
+    FTS_TABLE,
+    SEARCH_VECTOR_COLUMN,
+    SQLITE_BM25_WEIGHTS,
+    fulltext_backend,
+    postgres_tsquery,
+    query_words,
+    sqlite_match_expression,
+)
+from backend.services.utils import bounding_box, haversine_distance
 from backend.models import ScrapedJob
 
 logger = logging.getLogger(__name__)
@@ -33,7 +44,7 @@ class LocalDbProvider(JobProvider):
             accepted_domains=["*"],
         )
 
-    def _db_job_to_listing(self, db_job: ScrapedJob, distance_km: float = None) -> JobListing:
+    def _db_job_to_listing(self, db_job: ScrapedJob) -> JobListing:
         # Reconstruct EmploymentInfo
         employment = None
         if db_job.workload:
@@ -51,9 +62,13 @@ class LocalDbProvider(JobProvider):
                     workload_max=int(w_str)
                 )
 
+        coordinates = None
+        if db_job.latitude is not None and db_job.longitude is not None:
+            coordinates = Coordinates(lat=db_job.latitude, lon=db_job.longitude)
+
         location = None
-        if db_job.location:
-            location = JobLocation(city=db_job.location)
+        if db_job.location or coordinates:
+            location = JobLocation(city=db_job.location or "", coordinates=coordinates)
             
         return JobListing(
             id=db_job.platform_job_id,
@@ -64,43 +79,131 @@ class LocalDbProvider(JobProvider):
             employment=employment,
             external_url=db_job.external_url,
             raw_data=db_job.raw_metadata or {},
+            summary=db_job.summary or None,
         )
 
+    # ── keyword matching ───────────────────────────────────────────────────
+
+    def _keyword_filter(self, q, query: str):
+        """Restrict *q* to listings matching *query*, best matches first.
+
+        Every word must occur as a substring of title, description or company
+        (``ILIKE``), which also finds words inside German compounds
+        ("entwickler" in "Softwareentwickler").  Where the database has a
+        full-text index (FTS5 / tsvector), listings matching all words as
+        token prefixes are found through it as well and ranked first; the
+        index also matches accent-insensitively.
+        """
+        terms = [term.strip() for term in query.split(" ") if term.strip()]
+        if not terms:
+            return q
+        substring_match = and_(*[
+            or_(
+                ScrapedJob.title.ilike(f"%{term}%"),
+                ScrapedJob.description.ilike(f"%{term}%"),
+                ScrapedJob.company.ilike(f"%{term}%"),
+            )
+            for term in terms
+        ])
+
+        words = query_words(query)
+        bind = self.db.get_bind()
+        backend = fulltext_backend(getattr(bind, "engine", bind)) if words else None
+
+        if backend == "fts5":
+            fts = literal_column(FTS_TABLE)
+            matches = (
+                select(literal_column("rowid").label("rowid"), func.bm25(fts, *SQLITE_BM25_WEIGHTS).label("rank"))
+                .select_from(table(FTS_TABLE))
+                .where(fts.op("MATCH")(sqlite_match_expression(words)))
+                .subquery("fts")
+            )
+            # bm25() is lower-is-better; substring-only matches come last
+            return (
+                q.outerjoin(matches, matches.c.rowid == ScrapedJob.id)
+                .filter(or_(matches.c.rowid.is_not(None), substring_match))
+                .order_by(matches.c.rank.is_(None), matches.c.rank, ScrapedJob.id)
+            )
+
+        if backend == "tsvector":
+            vector = literal_column(f"scraped_jobs.{SEARCH_VECTOR_COLUMN}")
+            tsquery = func.to_tsquery("simple", postgres_tsquery(words))
+            # Substring-only matches rank 0, after every index match
+            return q.filter(or_(vector.op("@@")(tsquery), substring_match)).order_by(
+                func.ts_rank_cd(vector, tsquery).desc(), ScrapedJob.id
+            )
+
+        return q.filter(substring_match)
+
+    # ── radius search ──────────────────────────────────────────────────────
+
+    def _within_radius(self, q, radius: RadiusSearchRequest, limit: int) -> Tuple[List[ScrapedJob], int]:
+        """Nearest *limit* listings of *q* inside *radius*, plus the total in range.
+
+        The indexed bounding box narrows the candidates in SQL; only their ids
+        and coordinates are loaded for the exact haversine check, and full
+        rows are fetched for the returned page alone.
+
+        Listings without coordinates cannot be placed and are left out; rows
+        stored before coordinates were kept get them back (via the upsert
+        backfill) the next time a provider returns the listing.
+        """
+        point = radius.geo_point
+        min_lat, max_lat, min_lon, max_lon = bounding_box(point.lat, point.lon, radius.distance)
+        candidates = (
+            q.filter(
+                ScrapedJob.latitude.between(min_lat, max_lat),
+                ScrapedJob.longitude.between(min_lon, max_lon),
+            )
+            .with_entities(ScrapedJob.id, ScrapedJob.latitude, ScrapedJob.longitude)
+            .all()
+        )
+
+        distances = {}
+        for job_id, lat, lon in candidates:
+            distance = haversine_distance(point.lat, point.lon, lat, lon)
+            if distance <= radius.distance:
+                distances[job_id] = distance
+
+        # Nearest first; the sort is stable, so equally distant jobs keep their rank
+        ordered = sorted(distances, key=distances.get)
+        page_ids = ordered[:limit]
+        if not page_ids:
+            return [], len(ordered)
+        by_id = {job.id: job for job in self.db.query(ScrapedJob).filter(ScrapedJob.id.in_(page_ids))}
+        return [by_id[job_id] for job_id in page_ids if job_id in by_id], len(ordered)
+
     async def search(self, request: JobSearchRequest) -> JobSearchResponse:
         logger.info(f"[{self.name()}] Starting search for '{request.query}' in '{request.location}'")
         start_time = time.time()
 
-        # Start building the ORM query
-        q = self.db.query(ScrapedJob)
-        
-        # 1. Keywords filtering (ILIKE)
+        # The total comes from a window count on the same query, so matching
+        # rows are only searched once
+        q = self.db.query(ScrapedJob, func.count().over().label("total_count"))
+
+        # 1. Keywords filtering (full-text, ranked)
         if request.query:
-            query_terms = request.query.split(" ")
-            for term in query_terms:
-                term = term.strip()
-                if not term:
-                    continue
-                ilike_term = f"%{term}%"
-                q = q.filter(
-                    or_(
-                        ScrapedJob.title.ilike(ilike_term),
-                        ScrapedJob.description.ilike(ilike_term),
-                        ScrapedJob.company.ilike(ilike_term)
-                    )
-                )
+            q = self._keyword_filter(q, request.query)
 
-        # 2. Location filtering
-        if request.location:
-            ilike_city = f"%{request.location}%"
-            q = q.filter(ScrapedJob.location.ilike(ilike_city))
+        # Incremental searches: listings published (or first stored) since then
+        if request.posted_since is not None:
+            q = q.filter(func.coalesce(ScrapedJob.publication_date, ScrapedJob.created_at) >= request.posted_since)
 
-        # Get total count before pagination
-        total_count = q.count()
+        if request.radius_search:
+            # 2. Distance filtering (supersedes the city text), nearest first
+            scraped_jobs, total_count = self._within_radius(q, request.radius_search, request.page_size)
+        else:
+            # 2. Location filtering
+            if request.location:
+                ilike_city = f"%{request.location}%"
+                q = q.filter(ScrapedJob.location.ilike(ilike_city))
 
-        # 3. Pagination (Local limit)
-        q = q.limit(request.page_size)
+            # 3. Pagination (Local limit)
+            q = q.limit(request.page_size)
 
-        scraped_jobs = q.all()
+            rows = q.all()
+            total_count = rows[0][1] if rows else 0
+            scraped_jobs = [db_job for db_job, _ in rows]
 
         results = []
         for db_job in scraped_jobs:
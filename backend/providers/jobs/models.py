@@ -49,6 +49,8 @@ class JobSearchRequest(BaseModel):
     contract_type: ContractType = ContractType.ANY
     company_name: Optional[str] = None
     posted_within_days: Optional[int] = 30
+    # Incremental searches: only postings published at or after this moment
+    posted_since: Optional[datetime] = None
     display_restricted: bool = False
     radius_search: Optional[RadiusSearchRequest] = None
     work_forms: List[WorkForm] = []
@@ -159,6 +161,8 @@ class JobListing(BaseModel):
     reporting_obligation: bool = False
     reporting_obligation_end_date: Optional[str] = None
     raw_data: Optional[Dict[str, Any]] = None
+    # Precomputed match summary of an already stored job (local database)
+    summary: Optional[Dict[str, Any]] = None
 
 class JobSearchResponse(BaseModel):
     items: List[JobListing]
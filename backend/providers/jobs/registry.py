@@ -0,0 +1,86 @@
+"""
+Application-lifetime registry of remote job providers.
+
+Opened in the FastAPI lifespan and closed on shutdown: every search on the
+app's event loop reuses the same provider instances, and with them their
+keep-alive HTTP pools, the Job-Room CSRF token and the SwissDevJobs client.
+
+Code running without an open registry (or on another event loop, e.g. a
+script or a test) gets ``None`` from ``get_provider_registry`` and builds its
+own short-lived providers instead.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def close_providers(providers: Dict[str, Any]) -> None:
+    """Release the HTTP resources held by *providers* (failures are logged)."""
+    for name, provider in providers.items():
+        close = getattr(provider, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.warning(f"[Providers] Failed to close {name}: {e}")
+
+
+class ProviderRegistry:
+    def __init__(self, factory: Callable[[], Dict[str, Any]], loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._factory = factory
+        self._providers: Optional[Dict[str, Any]] = None
+        # httpx clients are bound to the loop they were first used on
+        self.loop = loop
+        self.closed = False
+
+    @property
+    def providers(self) -> Dict[str, Any]:
+        """The shared providers by name, built on first access."""
+        if self.closed:
+            raise RuntimeError("Provider registry is closed")
+        if self._providers is None:
+            self._providers = self._factory()
+            logger.info(f"[Providers] Shared providers ready: {', '.join(self._providers)}")
+        return self._providers
+
+    async def aclose(self) -> None:
+        """Close every provider's HTTP resources (idempotent)."""
+        self.closed = True
+        providers, self._providers = self._providers or {}, None
+        await close_providers(providers)
+
+
+_registry: Optional[ProviderRegistry] = None
+
+
+def open_provider_registry(factory: Callable[[], Dict[str, Any]]) -> ProviderRegistry:
+    """Install the app-wide registry, bound to the running event loop."""
+    global _registry
+    _registry = ProviderRegistry(factory, loop=asyncio.get_running_loop())
+    return _registry
+
+
+def get_provider_registry() -> Optional[ProviderRegistry]:
+    """The open registry if it belongs to the running event loop, else ``None``."""
+    registry = _registry
+    if registry is None or registry.closed:
+        return None
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return registry if registry.loop is loop else None
+
+
+async def close_provider_registry() -> None:
+    global _registry
+    registry, _registry = _registry, None
+    if registry is not None:
+        await registry.aclose()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import httpx
 from enum import Enum
@@ -13,30 +14,71 @@ class ProxyPool:
     pass
 
 class ScraperSession:
-    def __init__(self, mode: ExecutionMode = ExecutionMode.FAST, proxy_pool: Optional[ProxyPool] = None, base_url: Optional[str] = None):
+    """Keep-alive HTTP session with a CSRF token shared by all its requests.
+
+    The session may be used by many concurrent searches: the token is fetched
+    lazily on the first mutating request and refreshed at most once per
+    rejection, however many requests were rejected with it.
+    """
+
+    def __init__(
+        self,
+        mode: ExecutionMode = ExecutionMode.FAST,
+        proxy_pool: Optional[ProxyPool] = None,
+        base_url: Optional[str] = None,
+        limits: Optional[httpx.Limits] = None,
+    ):
         self.mode = mode
         self.base_url = base_url
+        self.limits = limits
         self.client: Optional[httpx.AsyncClient] = None
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "application/json, text/plain, */*",
         }
         self.csrf_token: Optional[str] = None
+        # Bumped on every token fetch; lets concurrent callers detect that
+        # someone else already refreshed the token they were rejected with
+        self.csrf_generation = 0
+        self._csrf_lock: Optional[asyncio.Lock] = None
 
     async def start(self):
-        self.client = httpx.AsyncClient(headers=self.headers, verify=False, follow_redirects=True, timeout=30.0)
+        kwargs = {"limits": self.limits} if self.limits else {}
+        self.client = httpx.AsyncClient(headers=self.headers, verify=False, follow_redirects=True, timeout=30.0, **kwargs)
 
     async def close(self):
         if self.client:
             await self.client.aclose()
+            self.client = None
+        self.csrf_token = None
+        self.csrf_generation = 0
 
     async def get(self, url: str):
         if not self.client:
             await self.start()
         return await self.client.get(url)
 
-    async def refresh_csrf_token(self, url: str):
-        """Fetch index page to get CSRF token (Angular app)."""
+    async def ensure_csrf_token(self, url: str):
+        """Fetch the CSRF token unless this session already did."""
+        if self.csrf_generation == 0:
+            await self.refresh_csrf_token(url, seen_generation=0)
+
+    async def refresh_csrf_token(self, url: str, seen_generation: Optional[int] = None):
+        """Fetch index page to get CSRF token (Angular app).
+
+        Single-flight: callers pass the generation of the token their request
+        was sent with; if another caller refreshed it meanwhile, nothing is
+        fetched again.
+        """
+        if self._csrf_lock is None:
+            self._csrf_lock = asyncio.Lock()
+        async with self._csrf_lock:
+            if seen_generation is not None and seen_generation != self.csrf_generation:
+                return
+            await self._fetch_csrf_token(url)
+            self.csrf_generation += 1
+
+    async def _fetch_csrf_token(self, url: str):
         # JobRoom uses X-XSRF-TOKEN header from cookies or similar.
         # usually Angular sets a cookie 'XSRF-TOKEN', client reads it and sends 'X-XSRF-TOKEN'.
         response = await self.get(url)
@@ -57,14 +99,15 @@ class ScraperSession:
             await self.start()
         
         # Ensure we have CSRF if needed
-        if method in ["POST", "PUT", "DELETE"] and not self.csrf_token:
-            await self.refresh_csrf_token(csrf_refresh_url)
+        if method in ["POST", "PUT", "DELETE"]:
+            await self.ensure_csrf_token(csrf_refresh_url)
             
         try:
+            generation = self.csrf_generation
             response = await self.client.request(method, url, json=json)
             if response.status_code == 403 or response.status_code == 401:
                 logger.warning("CSRF/Auth failed, retrying once...")
-                await self.refresh_csrf_token(csrf_refresh_url)
+                await self.refresh_csrf_token(csrf_refresh_url, seen_generation=generation)
                 response = await self.client.request(method, url, json=json)
             
             response.raise_for_status()
@@ -4,17 +4,16 @@ SwissDevJobs API Client.
 Client for swissdevjobs.ch fetching via the jobsLight API and retrieving details via jobWithUrl.
 """
 
+import asyncio
 import logging
 import time
 from typing import Any
 
 import httpx
 
-from backend.providers.jobs.exceptions import (
-    ProviderError,
-    ResponseParseError,
-)
+from backend.providers.jobs.exceptions import ProviderError
 from backend.providers.jobs.models import (
+    JobListing,
     JobSearchRequest,
     JobSearchResponse,
     ProviderCapabilities,
@@ -24,13 +23,18 @@ from backend.providers.jobs.models import (
 from backend.providers.jobs.base import JobProvider as BaseJobProvider
 
 # Import extracted logic
+from backend.providers.jobs.swissdevjobs.constants import (
+    API_BASE_URL,
+    DEFAULT_DETAIL_CONCURRENCY,
+    DEFAULT_FEED_MAX_AGE,
+)
+from backend.providers.jobs.swissdevjobs.details import JobDetailCache, detail_cache_key, job_detail_cache
+from backend.providers.jobs.swissdevjobs.feed import JobsLightFeed, jobs_light_feed
 from backend.providers.jobs.swissdevjobs.filters import filter_jobs
 from backend.providers.jobs.swissdevjobs.transformer import transform_job_data
 
 logger = logging.getLogger(__name__)
 
-API_BASE_URL = "https://swissdevjobs.ch/api"
-
 class SwissDevJobsProvider(BaseJobProvider):
     """
     SwissDevJobs HTML/API Provider.
@@ -43,9 +47,21 @@ class SwissDevJobsProvider(BaseJobProvider):
         ))
     """
 
-    def __init__(self, include_raw_data: bool = False):
+    def __init__(
+        self,
+        include_raw_data: bool = False,
+        feed: JobsLightFeed | None = None,
+        feed_max_age: float = DEFAULT_FEED_MAX_AGE,
+        detail_cache: JobDetailCache | None = None,
+        detail_concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+    ):
         self._include_raw_data = include_raw_data
         self._client: httpx.AsyncClient | None = None
+        # The jobsLight list and job details are shared process-wide; see feed.py / details.py
+        self._feed = feed or jobs_light_feed
+        self._feed_max_age = feed_max_age
+        self._details = detail_cache if detail_cache is not None else job_detail_cache
+        self._detail_concurrency = max(1, detail_concurrency)
 
     @property
     def name(self) -> str:
@@ -79,7 +95,7 @@ class SwissDevJobsProvider(BaseJobProvider):
         )
 
     async def __aenter__(self) -> "SwissDevJobsProvider":
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._get_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
@@ -91,26 +107,62 @@ class SwissDevJobsProvider(BaseJobProvider):
             await self._client.aclose()
             self._client = None
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Keep-alive client shared by all searches of this instance until ``close``."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=self._detail_concurrency * 2,
+                    max_keepalive_connections=self._detail_concurrency,
+                ),
+            )
+        return self._client
+
+    async def _hydrate(self, client: httpx.AsyncClient, light_jobs: list[dict[str, Any]]) -> list[JobListing]:
+        """Fetch details for *light_jobs* with bounded concurrency, reusing cached details."""
+        semaphore = asyncio.Semaphore(self._detail_concurrency)
+
+        async def hydrate_one(light_job: dict[str, Any]) -> JobListing | None:
+            key = detail_cache_key(light_job)
+            if key is None:
+                return None
+            job_url_slug = key[0]
+
+            detail_data = self._details.get(key)
+            if detail_data is None:
+                try:
+                    async with semaphore:
+                        detail_res = await client.get(f"{API_BASE_URL}/jobWithUrl/{job_url_slug}")
+                    if detail_res.status_code != 200:
+                        return None
+                    detail_data = detail_res.json()
+                    if isinstance(detail_data, list) and len(detail_data) > 0:
+                        detail_data = detail_data[0]
+                    self._details.set(key, detail_data)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch details for {job_url_slug} on {self.name}: {e}")
+                    return None
+
+            try:
+                return transform_job_data(detail_data, light_job, self.name, self._include_raw_data)
+            except Exception as e:
+                logger.warning(f"Failed to transform details for {job_url_slug} on {self.name}: {e}")
+                return None
+
+        results = await asyncio.gather(*(hydrate_one(job) for job in light_jobs))
+        return [job for job in results if job]
+
     async def search(self, request: JobSearchRequest) -> JobSearchResponse:
         """Search for jobs on swissdevjobs.ch."""
         start_time = time.time()
         
-        should_close = False
-        if not self._client:
-            self._client = httpx.AsyncClient(timeout=30.0)
-            should_close = True
-
         try:
-            # Step 1: Fetch the bulk list
-            response = await self._client.get(f"{API_BASE_URL}/jobsLight")
-            response.raise_for_status()
-            
-            all_jobs_light = response.json()
-            if not isinstance(all_jobs_light, list):
-                 raise ResponseParseError(self.name, "Expected a list from jobsLight API")
+            # Step 1: Get the bulk list (cached snapshot, shared by all queries)
+            snapshot = await self._feed.get(max_age=self._feed_max_age)
 
             # Step 2: Use extracted filters to process jobs
-            filtered_jobs = filter_jobs(all_jobs_light, request)
+            filtered_jobs = filter_jobs(snapshot.index, request)
 
             # Step 3: Pagination
             page = request.page
@@ -121,31 +173,8 @@ class SwissDevJobsProvider(BaseJobProvider):
             
             page_items = filtered_jobs[start_idx:end_idx]
             
-            # Step 4: Fetch details for the paginated items and transform
-            hydrated_jobs = []
-            for light_job in page_items:
-                 job_url_slug = light_job.get("jobUrl")
-                 if not job_url_slug:
-                     continue
-                     
-                 try:
-                     detail_res = await self._client.get(f"{API_BASE_URL}/jobWithUrl/{job_url_slug}")
-                     if detail_res.status_code == 200:
-                         detail_data = detail_res.json()
-                         
-                         if isinstance(detail_data, list) and len(detail_data) > 0:
-                             detail_data = detail_data[0]
-                             
-                         job_listing = transform_job_data(
-                             detail_data, 
-                             light_job, 
-                             self.name, 
-                             self._include_raw_data
-                         )
-                         if job_listing:
-                             hydrated_jobs.append(job_listing)
-                 except Exception as e:
-                     logger.warning(f"Failed to fetch details for {job_url_slug} on {self.name}: {e}")
+            # Step 4: Fetch details for the paginated items (concurrently) and transform
+            hydrated_jobs = await self._hydrate(self._get_client(), page_items)
 
             elapsed_ms = int((time.time() - start_time) * 1000)
 
@@ -163,9 +192,6 @@ class SwissDevJobsProvider(BaseJobProvider):
         except Exception as e:
             logger.error(f"Search failed: {e}")
             raise ProviderError(self.name, f"Search failed: {e}") from e
-        finally:
-            if should_close and self._client:
-                await self.close()
 
     async def health_check(self) -> ProviderHealth:
         """Check if swissdevjobs.ch API is accessible."""
@@ -0,0 +1,12 @@
+"""
+Constants for SwissDevJobs API integration.
+"""
+
+API_BASE_URL = "https://swissdevjobs.ch/api"
+JOBS_LIGHT_URL = f"{API_BASE_URL}/jobsLight"
+
+# How long a downloaded jobsLight snapshot is served without revalidation
+DEFAULT_FEED_MAX_AGE = 300.0
+
+# Parallel /jobWithUrl requests while hydrating one result page
+DEFAULT_DETAIL_CONCURRENCY = 8
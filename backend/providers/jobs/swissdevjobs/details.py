@@ -0,0 +1,54 @@
+"""
+Per-slug cache of SwissDevJobs job details (``/api/jobWithUrl/{slug}``).
+
+A listing's details only change when it is re-published, so entries are keyed
+on the slug plus the listing's ``activeFrom`` (or ``_id``) from the jobsLight
+feed.  The cache is process-wide and bounded (least recently used entries are
+dropped first), so details fetched by an earlier run are reused.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+DetailKey = Tuple[str, str]
+
+
+def detail_cache_key(light_job: dict[str, Any]) -> Optional[DetailKey]:
+    slug = light_job.get("jobUrl")
+    if not slug:
+        return None
+    version = light_job.get("activeFrom") or light_job.get("_id") or ""
+    return slug, str(version)
+
+
+class JobDetailCache:
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[DetailKey, dict[str, Any]]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: DetailKey) -> Optional[dict[str, Any]]:
+        with self._lock:
+            detail = self._entries.get(key)
+            if detail is not None:
+                self._entries.move_to_end(key)
+            return detail
+
+    def set(self, key: DetailKey, detail: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = detail
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every SwissDevJobsProvider in the process
+job_detail_cache = JobDetailCache()
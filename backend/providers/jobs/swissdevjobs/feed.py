@@ -0,0 +1,123 @@
+"""
+Process-wide snapshot cache of the SwissDevJobs jobsLight feed.
+
+The feed is the whole job list (several MB), identical for every query, so it
+is downloaded once and shared:
+
+- snapshots younger than ``max_age`` are served from memory,
+- older snapshots are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+  (a 304 just renews the snapshot),
+- concurrent callers await one in-flight download (single-flight),
+- if a refresh fails, the stale snapshot is served rather than failing the query.
+
+Each snapshot carries a ``FeedIndex`` built once at download time (and kept
+across 304 revalidations), so queries never rescan the raw job list.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import httpx
+
+from backend.providers.jobs.exceptions import ResponseParseError
+from backend.providers.jobs.swissdevjobs.constants import DEFAULT_FEED_MAX_AGE, JOBS_LIGHT_URL
+from backend.providers.jobs.swissdevjobs.index import FeedIndex
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    jobs: list[dict[str, Any]]
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    index: Optional[FeedIndex] = field(default=None, compare=False, repr=False)
+
+    def __post_init__(self):
+        if self.index is None:
+            object.__setattr__(self, "index", FeedIndex(self.jobs))
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+def _default_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=30.0)
+
+
+class JobsLightFeed:
+    def __init__(
+        self,
+        url: str = JOBS_LIGHT_URL,
+        client_factory: Callable[[], httpx.AsyncClient] = _default_client,
+    ):
+        self.url = url
+        self.client_factory = client_factory
+        self._snapshot: Optional[FeedSnapshot] = None
+        self._inflight: Optional[asyncio.Task] = None
+
+    @property
+    def snapshot(self) -> Optional[FeedSnapshot]:
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    async def get(self, max_age: float = DEFAULT_FEED_MAX_AGE) -> FeedSnapshot:
+        """Return a snapshot at most *max_age* seconds old (revalidating if needed)."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age() < max_age:
+            return snapshot
+
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._inflight = loop.create_task(self._refresh(snapshot))
+        # Shielded: one waiter being cancelled must not abort the shared download
+        return await asyncio.shield(task)
+
+    async def _refresh(self, previous: Optional[FeedSnapshot]) -> FeedSnapshot:
+        headers = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+
+        try:
+            async with self.client_factory() as client:
+                response = await client.get(self.url, headers=headers)
+
+            if response.status_code == 304 and previous is not None:
+                logger.debug("[swissdevjobs] jobsLight feed not modified")
+                snapshot = FeedSnapshot(
+                    previous.jobs, time.monotonic(), previous.etag, previous.last_modified, previous.index
+                )
+            else:
+                response.raise_for_status()
+                jobs = response.json()
+                if not isinstance(jobs, list):
+                    raise ResponseParseError("swissdevjobs", "Expected a list from jobsLight API")
+                snapshot = FeedSnapshot(
+                    jobs,
+                    time.monotonic(),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                )
+                logger.info(f"[swissdevjobs] Downloaded jobsLight feed ({len(jobs)} jobs)")
+        except Exception as e:
+            if previous is None:
+                raise
+            logger.warning(f"[swissdevjobs] Feed refresh failed, serving stale snapshot: {e}")
+            return previous
+
+        self._snapshot = snapshot
+        return snapshot
+
+
+# Shared by every SwissDevJobsProvider in the process
+jobs_light_feed = JobsLightFeed()
@@ -0,0 +1,212 @@
+"""
+Search index over one jobsLight feed snapshot.
+
+Built once when a snapshot is downloaded and reused by every query against it:
+
+- per-job lowercased fields, so no string is re-lowered per query,
+- an inverted index from the words of name / technologies / filterTags to
+  job positions (a query token matches every word that contains it, which
+  keeps the substring semantics of the original linear scan),
+- a coarse lat/lon grid, so a radius search only computes the haversine
+  distance for jobs in the cells overlapping the search circle.
+"""
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Iterable, Optional
+
+from backend.providers.jobs.models import ContractType, JobSearchRequest
+from backend.services.utils import bounding_box, haversine_distance
+
+GRID_CELL_DEGREES = 0.5
+
+_LANGUAGE_NAMES = {"en": "english", "de": "german", "fr": "french", "it": "italian"}
+
+
+def _lower(value: Any) -> str:
+    return str(value).lower() if value else ""
+
+
+def _parse_active_from(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class IndexedJob:
+    job: dict[str, Any]
+    city: str
+    city_category: str
+    company: str
+    job_type: str
+    language: str
+    workplace: str
+    tags: tuple[str, ...]
+    lat: Optional[float]
+    lon: Optional[float]
+    active_from: Optional[datetime]
+
+    @classmethod
+    def from_job(cls, job: dict[str, Any]) -> "IndexedJob":
+        lat, lon = job.get("latitude"), job.get("longitude")
+        try:
+            coords = (float(lat), float(lon)) if lat and lon else (None, None)
+        except (TypeError, ValueError):
+            coords = (None, None)
+        return cls(
+            job=job,
+            city=_lower(job.get("actualCity")),
+            city_category=_lower(job.get("cityCategory")),
+            company=_lower(job.get("company")),
+            job_type=_lower(job.get("jobType")),
+            language=_lower(job.get("language")),
+            workplace=_lower(job.get("workplace")),
+            tags=tuple(_lower(t) for t in job.get("filterTags") or []),
+            lat=coords[0],
+            lon=coords[1],
+            active_from=_parse_active_from(job.get("activeFrom")),
+        )
+
+    @property
+    def is_temporary(self) -> bool:
+        # SwissDevJobs exposes temporary vs permanent info mostly in jobType or tags
+        return (
+            "freelance" in self.job_type or "freelance" in self.tags
+            or "temporary" in self.job_type or "consulting" in self.job_type
+            or "contractor" in self.tags
+        )
+
+
+class FeedIndex:
+    def __init__(self, jobs: list[dict[str, Any]]):
+        self.entries = [IndexedJob.from_job(job) for job in jobs]
+
+        self._postings: dict[str, set[int]] = {}
+        self._grid: dict[tuple[int, int], list[int]] = {}
+        for pos, (job, entry) in enumerate(zip(jobs, self.entries)):
+            words = " ".join([
+                _lower(job.get("name")),
+                *(_lower(t) for t in job.get("technologies") or []),
+                *entry.tags,
+            ]).split()
+            for word in words:
+                self._postings.setdefault(word, set()).add(pos)
+            if entry.lat is not None:
+                self._grid.setdefault(self._cell(entry.lat, entry.lon), []).append(pos)
+
+        self._vocabulary = tuple(self._postings)
+        self._token_cache: dict[str, frozenset[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ── candidate lookups ──────────────────────────────────────────────────
+
+    def _token_matches(self, token: str) -> frozenset[int]:
+        """Positions of jobs with a name/technology/tag word containing *token*."""
+        cached = self._token_cache.get(token)
+        if cached is None:
+            matches: set[int] = set(self._postings.get(token, ()))
+            for word in self._vocabulary:
+                if token in word:
+                    matches |= self._postings[word]
+            cached = self._token_cache[token] = frozenset(matches)
+        return cached
+
+    def _keyword_candidates(self, query: str) -> Optional[set[int]]:
+        tokens = query.lower().split()
+        if not tokens:
+            return None
+        # Rarest token first keeps the running intersection small
+        sets = sorted((self._token_matches(t) for t in set(tokens)), key=len)
+        result = set(sets[0])
+        for other in sets[1:]:
+            if not result:
+                break
+            result &= other
+        return result
+
+    @staticmethod
+    def _cell(lat: float, lon: float) -> tuple[int, int]:
+        return math.floor(lat / GRID_CELL_DEGREES), math.floor(lon / GRID_CELL_DEGREES)
+
+    def _radius_candidates(self, lat: float, lon: float, distance_km: float) -> set[int]:
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, distance_km)
+        min_cell = self._cell(min_lat, min_lon)
+        max_cell = self._cell(max_lat, max_lon)
+        cells: Iterable[tuple[int, int]]
+        if (max_cell[0] - min_cell[0] + 1) * (max_cell[1] - min_cell[1] + 1) > len(self._grid):
+            cells = self._grid
+        else:
+            cells = (
+                (i, j)
+                for i in range(min_cell[0], max_cell[0] + 1)
+                for j in range(min_cell[1], max_cell[1] + 1)
+            )
+
+        result = set()
+        for cell in cells:
+            for pos in self._grid.get(cell, ()):
+                entry = self.entries[pos]
+                if haversine_distance(lat, lon, entry.lat, entry.lon) <= distance_km:
+                    result.add(pos)
+        return result
+
+    # ── search ─────────────────────────────────────────────────────────────
+
+    def search(self, request: JobSearchRequest) -> list[dict[str, Any]]:
+        """Jobs matching *request*, in feed order."""
+        candidates = self._keyword_candidates(request.query) if request.query else None
+
+        if request.radius_search and (candidates is None or candidates):
+            point = request.radius_search.geo_point
+            in_radius = self._radius_candidates(point.lat, point.lon, request.radius_search.distance)
+            candidates = in_radius if candidates is None else candidates & in_radius
+
+        positions: Iterable[int] = range(len(self.entries)) if candidates is None else sorted(candidates)
+        return [self.entries[pos].job for pos in positions if self._passes_filters(self.entries[pos], request)]
+
+    @staticmethod
+    def _passes_filters(entry: IndexedJob, request: JobSearchRequest) -> bool:
+        if request.posted_since is not None and entry.active_from is not None:
+            since = request.posted_since
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            if entry.active_from < since:
+                return False
+
+        location_query = request.location.lower() if request.location else ""
+        if location_query and not request.radius_search:
+            if location_query not in entry.city and location_query not in entry.city_category:
+                return False
+
+        if request.company_name and request.company_name.lower() not in entry.company:
+            return False
+
+        if "part-time" in entry.job_type and request.workload_min >= 90:
+            return False  # Exclude part time if looking for >=90%
+        if "full-time" in entry.job_type and request.workload_max <= 80:
+            return False  # Exclude full time if looking for <=80%
+
+        if request.language_skills and entry.language:
+            allowed = [_LANGUAGE_NAMES.get(c, c) for c in (ls.language_code.lower() for ls in request.language_skills)]
+            if entry.language not in allowed:
+                return False
+
+        if request.work_forms:
+            if "home_office" in [wf.value for wf in request.work_forms]:
+                if entry.workplace not in ["remote", "hybrid"]:
+                    return False
+
+        if request.contract_type == ContractType.PERMANENT and entry.is_temporary:
+            return False
+        if request.contract_type == ContractType.TEMPORARY and not entry.is_temporary:
+            return False
+
+        return True
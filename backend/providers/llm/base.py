@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 
@@ -26,3 +27,20 @@ class LLMProvider(ABC):
     def generate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
         """Generate JSON from the LLM"""
         pass
+
+    # ── async API ──────────────────────────────────────────────────────────
+    #
+    # Providers should override these with native async SDK calls.  The
+    # defaults only exist so third-party providers keep working unchanged.
+
+    async def agenerate_text(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
+        """Asynchronously generate text from the LLM"""
+        return await asyncio.to_thread(self.generate_text, system_prompt, user_prompt, max_tokens)
+
+    async def agenerate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        """Asynchronously generate JSON from the LLM"""
+        return await asyncio.to_thread(self.generate_json, system_prompt, user_prompt, max_tokens)
+
+    async def aclose(self) -> None:
+        """Release network resources held by the provider (no-op by default)."""
+        return None
@@ -6,9 +6,26 @@ Resolution order for each field (provider, model, api_key, base_url, …):
 
 When ``step`` is not supplied (or is ``"default"``), global settings are used
 directly — this is functionally identical to the old ``get_llm_provider()``.
+
+Built providers are kept in a registry keyed on the resolved config and the
+calling event loop, so every call for the same config reuses one SDK client
+and its keep-alive connection pool.  Async SDK clients bind their connections
+to the loop they first ran on, hence one instance per loop (sync callers,
+outside any loop, share their own).
+
+A settings change resolves to a new key: the step gets a new provider, and the
+one it used before is evicted and closed unless another step still uses it
+(requests still running on it then fail, as with any reconfiguration).
+Providers of loops that have closed are dropped.  ``close_providers`` evicts
+and closes everything (shutdown, or after changing many settings at once).
 """
 
+import asyncio
 import logging
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+from openai import DefaultAsyncHttpxClient, DefaultHttpxClient
+import httpx
 from backend.core.config import settings
 from backend.providers.llm.base import LLMProvider
 from backend.providers.llm.openai_compatible import OpenAICompatibleProvider
@@ -18,7 +35,16 @@ from backend.providers.llm.ollama import OllamaProvider
 logger = logging.getLogger(__name__)
 
 # ─── recognised step names (used as env-var prefixes) ────────────────────────
-_KNOWN_STEPS = {"plan", "relevance", "match"}
+_KNOWN_STEPS = {"plan", "relevance", "match", "digest"}
+
+# ─── provider registry ((resolved config, event loop) → provider instance) ───
+_provider_cache: Dict[Tuple[Tuple, Any], LLMProvider] = {}
+# Config each step resolved to last, per loop; a different one means the
+# settings changed
+_step_configs: Dict[Tuple[str, Any], Tuple] = {}
+_cache_lock = threading.Lock()
+# Close tasks of evicted providers (referenced until they finish)
+_closing: Set[asyncio.Task] = set()
 
 
 def _resolve_step_config(step: str) -> dict:
@@ -63,6 +89,15 @@ def _resolve_step_config(step: str) -> dict:
     }
 
 
+def _http_limits() -> httpx.Limits:
+    """Connection-pool limits shared by the sync and async client of a provider."""
+    return httpx.Limits(
+        max_connections=settings.LLM_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.LLM_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry=settings.LLM_HTTP_KEEPALIVE_EXPIRY,
+    )
+
+
 def _build_provider(cfg: dict) -> LLMProvider:
     """Instantiate the correct ``LLMProvider`` subclass from a resolved *cfg*."""
     provider_name = cfg["provider"].lower()
@@ -81,6 +116,7 @@ def _build_provider(cfg: dict) -> LLMProvider:
         base_url = cfg["base_url"] or settings.OLLAMA_BASE_URL
         api_key  = cfg["api_key"] or "ollama"
         model    = cfg["model"] or settings.OLLAMA_MODEL
+        limits = _http_limits()
         return OllamaProvider(
             api_key=api_key,
             base_url=base_url,
@@ -88,9 +124,12 @@ def _build_provider(cfg: dict) -> LLMProvider:
             temperature=cfg["temperature"],
             top_p=cfg["top_p"],
             max_tokens=cfg["max_tokens"],
+            http_client=DefaultHttpxClient(limits=limits),
+            async_http_client=DefaultAsyncHttpxClient(limits=limits),
         )
 
     # Default: OpenAI-compatible (groq, deepseek, openai, etc.)
+    limits = _http_limits()
     return OpenAICompatibleProvider(
         api_key=cfg["api_key"],
         base_url=cfg["base_url"],
@@ -100,19 +139,81 @@ def _build_provider(cfg: dict) -> LLMProvider:
         max_tokens=cfg["max_tokens"],
         thinking=cfg["thinking"],
         provider_name=provider_name,
+        http_client=DefaultHttpxClient(limits=limits),
+        async_http_client=DefaultAsyncHttpxClient(limits=limits),
     )
 
 
 # ─── public API ──────────────────────────────────────────────────────────────
 
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _evict_stale(step: str, config_key: Tuple, loop: Optional[asyncio.AbstractEventLoop]) -> List[LLMProvider]:
+    """Evict the provider a settings change of *step* replaced, and return it.
+
+    Also drops the providers of closed loops.  Call with ``_cache_lock`` held.
+    """
+    previous = _step_configs.get((step, loop))
+    _step_configs[(step, loop)] = config_key
+
+    evicted = []
+    still_used = {key for (_, step_loop), key in _step_configs.items() if step_loop is loop}
+    if previous is not None and previous not in still_used:
+        provider = _provider_cache.pop((previous, loop), None)
+        if provider is not None:
+            evicted.append(provider)
+
+    # A closed loop's connections are gone with it: nothing left to close
+    for cache_key in [k for k in _provider_cache if k[1] is not None and k[1].is_closed()]:
+        del _provider_cache[cache_key]
+    for step_key in [k for k in _step_configs if k[1] is not None and k[1].is_closed()]:
+        del _step_configs[step_key]
+    return evicted
+
+
+async def _aclose_all(providers: List[LLMProvider]) -> None:
+    for provider in providers:
+        try:
+            await provider.aclose()
+        except Exception as e:
+            logger.warning(f"[LLM Factory] Failed to close {provider.model_id}: {e}")
+
+
+def _close_evicted(providers: List[LLMProvider], loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    logger.info(f"[LLM Factory] Settings changed, closing {len(providers)} stale provider(s)")
+    if loop is None:
+        # Sync callers: the providers' async clients were never used
+        asyncio.run(_aclose_all(providers))
+        return
+    task = loop.create_task(_aclose_all(providers))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
 def get_provider_for_step(step: str = "default") -> LLMProvider:
     """Resolve and instantiate the LLM provider for a pipeline *step*.
 
-    Recognised steps: ``"plan"``, ``"relevance"``, ``"match"``.
+    Recognised steps: ``"plan"``, ``"relevance"``, ``"match"``, ``"digest"``.
     Any other value (including ``"default"``) falls through to globals.
     """
     cfg = _resolve_step_config(step)
-    provider = _build_provider(cfg)
+    config_key = tuple(sorted(cfg.items()))
+    loop = _running_loop()
+
+    with _cache_lock:
+        evicted = _evict_stale(step, config_key, loop)
+        provider = _provider_cache.get((config_key, loop))
+        if provider is None:
+            provider = _build_provider(cfg)
+            _provider_cache[(config_key, loop)] = provider
+    if evicted:
+        _close_evicted(evicted, loop)
+
     logger.debug(
         f"[LLM Factory] step={step!r} → {provider.model_id} "
         f"(temp={cfg['temperature']}, top_p={cfg['top_p']}, max_tok={cfg['max_tokens']})"
@@ -123,3 +224,27 @@ def get_provider_for_step(step: str = "default") -> LLMProvider:
 def get_llm_provider() -> LLMProvider:
     """Backward-compatible alias — returns the global default provider."""
     return get_provider_for_step("default")
+
+
+def invalidate_provider_cache() -> List[LLMProvider]:
+    """Forget all cached providers so the next call rebuilds them from settings.
+
+    Returns the evicted providers; requests already in flight keep using them
+    until they finish.  Use ``close_providers`` to release their connections.
+    """
+    with _cache_lock:
+        evicted = list(_provider_cache.values())
+        _provider_cache.clear()
+        _step_configs.clear()
+    if evicted:
+        logger.info(f"[LLM Factory] Invalidated {len(evicted)} cached provider(s)")
+    return evicted
+
+
+async def close_providers() -> None:
+    """Evict every cached provider and close its HTTP connection pools."""
+    await _aclose_all(invalidate_provider_cache())
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _closing if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
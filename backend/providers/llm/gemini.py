@@ -93,3 +93,36 @@ class GeminiProvider(LLMProvider):
         except Exception as e:
              logger.error(f"Gemini JSON Error ({self.model_id}): {e}")
              raise
+
+    async def agenerate_text(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
+        config = self._get_config(json_mode=False, max_tokens=max_tokens)
+        config.system_instruction = system_prompt
+        
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=user_prompt,
+                config=config,
+            )
+            return response.text or ""
+        except Exception as e:
+             logger.error(f"Gemini Error ({self.model_id}): {e}")
+             raise
+
+    async def agenerate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        config = self._get_config(json_mode=True, max_tokens=max_tokens)
+        config.system_instruction = system_prompt
+        
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=user_prompt,
+                config=config,
+            )
+            return json.loads(response.text or "{}")
+        except Exception as e:
+             logger.error(f"Gemini JSON Error ({self.model_id}): {e}")
+             raise
+
+    async def aclose(self) -> None:
+        await self.client.aio.aclose()
@@ -1,4 +1,6 @@
 import logging
+from typing import Optional
+import httpx
 from backend.providers.llm.openai_compatible import OpenAICompatibleProvider
 
 logger = logging.getLogger(__name__)
@@ -21,6 +23,8 @@ class OllamaProvider(OpenAICompatibleProvider):
         temperature: float = 0.7,
         top_p: float = 0.95,
         max_tokens: int = 16384,
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
         **kwargs,
     ):
         super().__init__(
@@ -32,6 +36,8 @@ class OllamaProvider(OpenAICompatibleProvider):
             max_tokens=max_tokens,
             thinking=False,
             provider_name="ollama",
+            http_client=http_client,
+            async_http_client=async_http_client,
         )
         logger.info(f"Initialized OllamaProvider with model={self.model}, base_url={base_url}")
 
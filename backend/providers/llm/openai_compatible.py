@@ -1,7 +1,8 @@
 import json
 import logging
 from typing import Dict, Any, Optional
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, OpenAI
 from backend.providers.llm.base import LLMProvider
 
 logger = logging.getLogger(__name__)
@@ -25,8 +26,11 @@ class OpenAICompatibleProvider(LLMProvider):
         max_tokens: int = 16384,
         thinking: bool = False,
         provider_name: str = "openai",
+        http_client: Optional[httpx.Client] = None,
+        async_http_client: Optional[httpx.AsyncClient] = None,
     ):
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+        self.async_client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=async_http_client)
         self.model = model
         self.temperature = temperature
         self.top_p = top_p
@@ -76,9 +80,7 @@ class OpenAICompatibleProvider(LLMProvider):
             
         return text.strip()
 
-    # ── public API ─────────────────────────────────────────────────────────
-
-    def generate_text(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
+    def _text_params(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int]) -> Dict[str, Any]:
         params = {
             "model": self.model,
             "messages": [
@@ -94,22 +96,9 @@ class OpenAICompatibleProvider(LLMProvider):
         if self.provider_name == "deepseek" and self.thinking:
             params.pop("temperature", None)
             params.pop("top_p", None)
+        return params
 
-        try:
-            completion = self.client.chat.completions.create(**params)
-            message = completion.choices[0].message
-            content = message.content or ""
-            
-            # Deepseek Reasoner support: Capture reasoning trace if available
-            if getattr(message, "reasoning_content", None):
-                logger.info(f"DeepSeek Reasoning Trace: {message.reasoning_content[:500]}...")
-            
-            return content
-        except Exception as e:
-            logger.error(f"LLM Error ({self.model_id}): {e}")
-            raise
-
-    def generate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+    def _json_params(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int]) -> Dict[str, Any]:
         params = {
             "model": self.model,
             "messages": [
@@ -124,16 +113,61 @@ class OpenAICompatibleProvider(LLMProvider):
         # JSON Mode — skip for deepseek thinking where it's not supported
         if not (self.provider_name == "deepseek" and self.thinking):
              params["response_format"] = {"type": "json_object"}
+        return params
+
+    def _read_text(self, completion) -> str:
+        message = completion.choices[0].message
+        content = message.content or ""
+        
+        # Deepseek Reasoner support: Capture reasoning trace if available
+        if getattr(message, "reasoning_content", None):
+            logger.info(f"DeepSeek Reasoning Trace: {message.reasoning_content[:500]}...")
+        
+        return content
+
+    def _read_json(self, completion) -> Dict[str, Any]:
+        content = completion.choices[0].message.content or "{}"
+        clean_text = self._clean_json(content)
+        try:
+            return json.loads(clean_text)
+        except Exception as parse_err:
+            logger.error(f"Failed to parse JSON from {self.model_id}. Raw output:\n{content}\nCleaned:\n{clean_text}")
+            raise parse_err
+
+    # ── public API ─────────────────────────────────────────────────────────
 
+    def generate_text(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
+        try:
+            completion = self.client.chat.completions.create(**self._text_params(system_prompt, user_prompt, max_tokens))
+            return self._read_text(completion)
+        except Exception as e:
+            logger.error(f"LLM Error ({self.model_id}): {e}")
+            raise
+
+    def generate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        try:
+            completion = self.client.chat.completions.create(**self._json_params(system_prompt, user_prompt, max_tokens))
+            return self._read_json(completion)
+        except Exception as e:
+            logger.error(f"LLM JSON Error ({self.model_id}): {e}")
+            raise
+
+    async def agenerate_text(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> str:
         try:
-            completion = self.client.chat.completions.create(**params)
-            content = completion.choices[0].message.content or "{}"
-            clean_text = self._clean_json(content)
-            try:
-                return json.loads(clean_text)
-            except Exception as parse_err:
-                logger.error(f"Failed to parse JSON from {self.model_id}. Raw output:\n{content}\nCleaned:\n{clean_text}")
-                raise parse_err
+            completion = await self.async_client.chat.completions.create(**self._text_params(system_prompt, user_prompt, max_tokens))
+            return self._read_text(completion)
+        except Exception as e:
+            logger.error(f"LLM Error ({self.model_id}): {e}")
+            raise
+
+    async def agenerate_json(self, system_prompt: str, user_prompt: str, max_tokens: Optional[int] = None) -> Dict[str, Any]:
+        try:
+            completion = await self.async_client.chat.completions.create(**self._json_params(system_prompt, user_prompt, max_tokens))
+            return self._read_json(completion)
         except Exception as e:
             logger.error(f"LLM JSON Error ({self.model_id}): {e}")
             raise
+
+    async def aclose(self) -> None:
+        self.client.close()
+        await self.async_client.close()
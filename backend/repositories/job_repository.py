@@ -1,10 +1,17 @@
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import asc, desc, case, func
+from sqlalchemy import asc, desc, case, func, insert, literal, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from backend.repositories.base import BaseRepository
 from backend.models import Job, ScrapedJob
 
 
+# Columns added after rows were already being shared; an upsert fills them in
+# on existing rows that still lack them
+BACKFILLED_SCRAPED_JOB_COLUMNS = ("summary", "latitude", "longitude")
+
+
 class JobRepository(BaseRepository[Job]):
     def __init__(self, db: Session):
         super().__init__(Job, db)
@@ -56,6 +63,73 @@ class JobRepository(BaseRepository[Job]):
             .all()
         )
 
+    # ── bulk writes (caller owns the transaction) ─────────────────────────
+
+    def bulk_upsert_scraped_jobs(
+        self, rows: List[Dict[str, Any]], chunk_size: int = 50
+    ) -> Dict[Tuple[str, str], int]:
+        """Insert missing ScrapedJob rows and return ids keyed on (platform, platform_job_id).
+
+        Existing shared rows are kept as they are (first writer wins), except
+        that ``BACKFILLED_SCRAPED_JOB_COLUMNS`` still empty on them are filled in.
+        """
+        unique_rows = list({(r["platform"], r["platform_job_id"]): r for r in rows}.values())
+        if not unique_rows:
+            return {}
+        keys = [(r["platform"], r["platform_job_id"]) for r in unique_rows]
+
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            for i in range(0, len(unique_rows), chunk_size):
+                stmt = dialect_insert(ScrapedJob).values(unique_rows[i:i + chunk_size])
+                self.db.execute(stmt.on_conflict_do_update(
+                    index_elements=["platform", "platform_job_id"],
+                    set_={
+                        column: func.coalesce(getattr(ScrapedJob, column), getattr(stmt.excluded, column))
+                        for column in BACKFILLED_SCRAPED_JOB_COLUMNS
+                    },
+                ))
+        else:
+            existing = set(self._scraped_job_ids(keys))
+            missing = [r for r, key in zip(unique_rows, keys) if key not in existing]
+            if missing:
+                self.db.execute(insert(ScrapedJob), missing)
+            for row, key in zip(unique_rows, keys):
+                if key in existing:
+                    self._backfill_scraped_job(key, row)
+
+        return self._scraped_job_ids(keys)
+
+    def _backfill_scraped_job(self, key: Tuple[str, str], row: Dict[str, Any]) -> None:
+        """Fill the existing row's empty ``BACKFILLED_SCRAPED_JOB_COLUMNS`` from *row*."""
+        values = {
+            column: func.coalesce(getattr(ScrapedJob, column), literal(row[column], getattr(ScrapedJob, column).type))
+            for column in BACKFILLED_SCRAPED_JOB_COLUMNS
+            if row.get(column) is not None
+        }
+        if values:
+            self.db.query(ScrapedJob).filter(
+                ScrapedJob.platform == key[0], ScrapedJob.platform_job_id == key[1]
+            ).update(values, synchronize_session=False)
+
+    def _scraped_job_ids(self, keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], int]:
+        ids: Dict[Tuple[str, str], int] = {}
+        for i in range(0, len(keys), 500):
+            rows = (
+                self.db.query(ScrapedJob.id, ScrapedJob.platform, ScrapedJob.platform_job_id)
+                .filter(tuple_(ScrapedJob.platform, ScrapedJob.platform_job_id).in_(keys[i:i + 500]))
+                .all()
+            )
+            ids.update({(row.platform, row.platform_job_id): row.id for row in rows})
+        return ids
+
+    def bulk_insert_jobs(self, rows: List[Dict[str, Any]]) -> int:
+        """Insert user-specific Job rows in one executemany round trip."""
+        if rows:
+            self.db.execute(insert(Job), rows)
+        return len(rows)
+
     def _build_filter_query(
         self,
         user_id: int,
@@ -1,3 +1,3 @@
 from backend.schemas.user import UserCreate, UserLogin, Token
 from backend.schemas.job import JobBase, JobCreate, JobUpdate, Job, JobPaginationResponse
-from backend.schemas.profile import SearchProfileBase, SearchProfileCreate, SearchProfileUpdate, SearchProfile, ScheduleToggle
+from backend.schemas.profile import SearchProfileBase, SearchProfileCreate, SearchProfileUpdate, SearchProfile, ScheduleToggle, SearchPlan, SearchPlanQuery, SearchPlanUpdate
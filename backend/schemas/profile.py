@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict, field_validator
-from typing import Optional, Any
+from typing import List, Optional, Any
 from datetime import datetime
 
 # ═══════════════════════════════════════
@@ -75,3 +75,31 @@ class ScheduleToggle(BaseModel):
     """Toggle schedule on/off for a profile."""
     enabled: bool
     interval_hours: Optional[int] = None
+
+
+# ═══════════════════════════════════════
+# Search Plan Schemas
+# ═══════════════════════════════════════
+
+class SearchPlanQuery(BaseModel):
+    """One query of a search plan (extra LLM fields such as language are kept)."""
+    model_config = ConfigDict(extra="allow")
+
+    query: str
+    domain: str = "general"
+
+
+class SearchPlan(BaseModel):
+    """The saved search plan of a profile."""
+    queries: List[SearchPlanQuery] = []
+    fingerprint: Optional[str] = None
+    pinned: bool = False
+    generated_at: Optional[datetime] = None
+    # Whether the next run reuses the plan instead of generating a new one
+    up_to_date: bool = False
+
+
+class SearchPlanUpdate(BaseModel):
+    """Replace the plan's queries and/or pin it against regeneration."""
+    queries: Optional[List[SearchPlanQuery]] = None
+    pinned: Optional[bool] = None
@@ -29,3 +29,24 @@ def decode_access_token(token: str) -> Optional[dict]:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
     except PyJWTError:
         return None
+
+
+# Status streams are opened by the browser's EventSource, which cannot send an
+# Authorization header; it passes this short-lived, stream-only token in the
+# URL instead of the long-lived access token.
+STREAM_TOKEN_SCOPE = "status-stream"
+
+
+def create_stream_token(user_id: int) -> str:
+    return create_access_token(
+        {"uid": user_id, "scope": STREAM_TOKEN_SCOPE},
+        timedelta(seconds=settings.SEARCH_STATUS_STREAM_TOKEN_SECONDS),
+    )
+
+
+def decode_stream_token(token: str) -> Optional[int]:
+    """User id of a valid stream token, else ``None``."""
+    payload = decode_access_token(token)
+    if not payload or payload.get("scope") != STREAM_TOKEN_SCOPE or not isinstance(payload.get("uid"), int):
+        return None
+    return payload["uid"]
@@ -0,0 +1,88 @@
+"""
+Leader election through a lease row.
+
+Every worker process tries to take or renew the same named lease; the row
+update only succeeds for the current holder or once the lease has expired,
+so at most one process holds it at a time.  A holder that dies simply stops
+renewing and another process takes over after ``ttl`` seconds.
+"""
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from backend.db.base import SessionLocal
+from backend.models.scheduler_lease import SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+
+def process_identity() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        holder: str | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.holder = holder or process_identity()
+        self.session_factory = session_factory
+
+    def acquire(self) -> bool:
+        """Take or renew the lease; ``True`` while this process holds it."""
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=self.ttl)
+        db = self.session_factory()
+        try:
+            renewed = (
+                db.query(SchedulerLease)
+                .filter(
+                    SchedulerLease.name == self.name,
+                    or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at < now),
+                )
+                .update(
+                    {SchedulerLease.holder: self.holder, SchedulerLease.expires_at: expires_at},
+                    synchronize_session=False,
+                )
+            )
+            if renewed:
+                db.commit()
+                return True
+            if db.query(SchedulerLease.id).filter(SchedulerLease.name == self.name).first():
+                db.rollback()
+                return False  # held by another live process
+            db.add(SchedulerLease(name=self.name, holder=self.holder, expires_at=expires_at))
+            db.commit()
+            return True
+        except IntegrityError:
+            # Another process created the row first
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def release(self) -> None:
+        """Give the lease up early so another process can take over at once."""
+        db = self.session_factory()
+        try:
+            db.query(SchedulerLease).filter(
+                SchedulerLease.name == self.name, SchedulerLease.holder == self.holder
+            ).delete(synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[Lease] Failed to release lease {self.name!r}: {e}")
+        finally:
+            db.close()
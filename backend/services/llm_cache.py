@@ -0,0 +1,163 @@
+"""
+Persistent, content-addressed cache of LLM JSON responses.
+
+Entries are keyed on a hash of (step, model id, system prompt, user prompt),
+so an identical request for the same model is answered from the database
+instead of the provider.  Entries expire after a TTL and the least recently
+used ones are evicted once the table grows past ``max_entries``.
+"""
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.db.base import SessionLocal
+from backend.models import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        ttl_hours: int = 24 * 14,
+        max_entries: int = 50_000,
+    ):
+        self.session_factory = session_factory
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+        self._writes_since_eviction = 0
+
+    # ── keys ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(step: str, model_id: str, system_prompt: str, user_prompt: str) -> str:
+        payload = json.dumps([step, model_id, system_prompt, user_prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    # ── lookups ────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response for *key*, or ``None`` on a miss.
+
+        Cache failures are never fatal — they are logged and count as a miss.
+        """
+        now = datetime.now(timezone.utc)
+        db = self.session_factory()
+        try:
+            entry = db.query(LLMCacheEntry).filter(LLMCacheEntry.key == key).first()
+            if entry is None or self._as_utc(entry.expires_at) <= now:
+                self._count(miss=True)
+                return None
+
+            entry.last_accessed_at = now
+            entry.hit_count = (entry.hit_count or 0) + 1
+            db.commit()
+            self._count(hit=True)
+            return entry.response
+        except Exception as e:
+            db.rollback()
+            self._count(miss=True, error=True)
+            logger.warning(f"[LLM Cache] Lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def set(self, key: str, step: str, model_id: str, response: Dict[str, Any]) -> None:
+        """Store *response* under *key*, replacing any previous entry."""
+        now = datetime.now(timezone.utc)
+        db = self.session_factory()
+        try:
+            entry = db.query(LLMCacheEntry).filter(LLMCacheEntry.key == key).first()
+            if entry is None:
+                entry = LLMCacheEntry(key=key, step=step, model_id=model_id, hit_count=0)
+                db.add(entry)
+            entry.response = response
+            entry.expires_at = now + self.ttl
+            entry.last_accessed_at = now
+            db.commit()
+
+            with self._lock:
+                self._writes_since_eviction += 1
+                evict = self._writes_since_eviction >= max(1, self.max_entries // 10)
+                if evict:
+                    self._writes_since_eviction = 0
+            if evict:
+                self.evict(db)
+        except Exception as e:
+            db.rollback()
+            self._count(error=True)
+            logger.warning(f"[LLM Cache] Store failed: {e}")
+        finally:
+            db.close()
+
+    # ── maintenance ────────────────────────────────────────────────────────
+
+    def evict(self, db: Optional[Session] = None) -> int:
+        """Delete expired entries, then the least recently used overflow."""
+        owns_session = db is None
+        db = db or self.session_factory()
+        try:
+            now = datetime.now(timezone.utc)
+            removed = (
+                db.query(LLMCacheEntry)
+                .filter(LLMCacheEntry.expires_at <= now)
+                .delete(synchronize_session=False)
+            )
+
+            overflow = db.query(LLMCacheEntry).count() - self.max_entries
+            if overflow > 0:
+                stale_ids = [
+                    row.id for row in db.query(LLMCacheEntry.id)
+                    .order_by(LLMCacheEntry.last_accessed_at.asc())
+                    .limit(overflow)
+                ]
+                removed += (
+                    db.query(LLMCacheEntry)
+                    .filter(LLMCacheEntry.id.in_(stale_ids))
+                    .delete(synchronize_session=False)
+                )
+            db.commit()
+            if removed:
+                logger.info(f"[LLM Cache] Evicted {removed} entries")
+            return removed
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[LLM Cache] Eviction failed: {e}")
+            return 0
+        finally:
+            if owns_session:
+                db.close()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+    # ── helpers ────────────────────────────────────────────────────────────
+
+    def _count(self, hit: bool = False, miss: bool = False, error: bool = False):
+        with self._lock:
+            self._hits += int(hit)
+            self._misses += int(miss)
+            self._errors += int(error)
+
+    @staticmethod
+    def _as_utc(value: datetime) -> datetime:
+        # SQLite drops tzinfo on DateTime(timezone=True) columns
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
@@ -1,29 +1,94 @@
+import asyncio
+import json
 import logging
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from backend.providers.llm.base import LLMProvider
 from backend.providers.llm.factory import get_provider_for_step
 from backend.core.config import settings
+from backend.services.llm_cache import LLMResponseCache
+from backend.services.search.governor import ConcurrencyBudgets
 
 logger = logging.getLogger(__name__)
 
 
+def _is_relevance_verdict(result: Any) -> bool:
+    return isinstance(result, dict) and isinstance(result.get("relevant"), bool)
+
+
 class LLMService:
     """Orchestrates all LLM calls for the job-hunting pipeline.
 
     Each method resolves its own provider via ``get_provider_for_step``
     so that different steps can transparently use different models/providers.
-    """
+    Every step has a blocking variant and an ``a``-prefixed coroutine that
+    runs natively on the event loop.
 
-    # ─── Step 1: Search Plan Generation ───────────────────────────────────
+    When a ``cache`` is given, JSON responses of the steps listed in
+    ``cached_steps`` are looked up there before the provider is called.
+    ``budgets`` (keyed by model id) caps in-flight async calls per model
+    across every search sharing this service.
+    """
 
-    def generate_search_plan(
+    def __init__(
         self,
-        profile: Dict[str, Any],
-        providers_info: List[Any],
-        max_queries: int | None = None,
-    ) -> List[Dict[str, Any]]:
-        provider = get_provider_for_step("plan")
-        logger.info(f"[PLAN] Using {provider.model_id}")
+        cache: Optional[LLMResponseCache] = None,
+        cached_steps: Optional[set] = None,
+        budgets: Optional[ConcurrencyBudgets] = None,
+    ):
+        self.cache = cache
+        self.cached_steps = cached_steps if cached_steps is not None else {"relevance", "match"}
+        self.budgets = budgets or ConcurrencyBudgets()
+
+    # ─── Cached provider calls ────────────────────────────────────────────
+
+    def _cache_key(self, step: str, provider: LLMProvider, system_prompt: str, user_prompt: str) -> Optional[str]:
+        if self.cache is None or step not in self.cached_steps:
+            return None
+        return self.cache.make_key(step, provider.model_id, system_prompt, user_prompt)
+
+    def _generate_json(
+        self, step: str, provider: LLMProvider, system_prompt: str, user_prompt: str,
+        is_valid: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        # Answers failing *is_valid* are returned but not cached
+        key = self._cache_key(step, provider, system_prompt, user_prompt)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        result = provider.generate_json(system_prompt, user_prompt)
+        if key and (is_valid is None or is_valid(result)):
+            self.cache.set(key, step, provider.model_id, result)
+        return result
+
+    async def _agenerate_json(
+        self, step: str, provider: LLMProvider, system_prompt: str, user_prompt: str,
+        is_valid: Optional[Callable[[Any], bool]] = None,
+    ) -> Dict[str, Any]:
+        # The cache reads and writes the database; keep that off the event loop
+        key = self._cache_key(step, provider, system_prompt, user_prompt)
+        if key:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        async with self.budgets.slot(provider.model_id):
+            result = await provider.agenerate_json(system_prompt, user_prompt)
+        if key and (is_valid is None or is_valid(result)):
+            await asyncio.to_thread(self.cache.set, key, step, provider.model_id, result)
+        return result
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the response cache (since process start)."""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, "steps": sorted(self.cached_steps), **self.cache.stats()}
+
+    # ─── Step 1: Search Plan Generation ───────────────────────────────────
 
+    @staticmethod
+    def _search_plan_prompts(profile: Dict[str, Any], max_queries: int | None) -> Tuple[str, str]:
         system_prompt = (
             "You are an expert Job Hunter AI specialized in the Swiss job market. "
             "You are fluent in English, German, French, and Italian. "
@@ -68,25 +133,56 @@ Return ONLY pure JSON with a 'searches' list. Example:
         {{"domain": "finance", "language": "en", "type": "occupation", "query": "Financial Analyst"}}
     ]
 }}"""
+        return system_prompt, user_prompt
 
+    @staticmethod
+    def _parse_search_plan(result: Dict[str, Any], max_queries: int | None) -> List[Dict[str, Any]]:
+        searches = result.get("searches", [])
+
+        # Application-side enforcement of the limit just in case LLM goes over
+        if max_queries is not None:
+            searches = searches[:max_queries]
+
+        return searches
+
+    def generate_search_plan(
+        self,
+        profile: Dict[str, Any],
+        providers_info: List[Any],
+        max_queries: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        provider = get_provider_for_step("plan")
+        logger.info(f"[PLAN] Using {provider.model_id}")
+
+        system_prompt, user_prompt = self._search_plan_prompts(profile, max_queries)
         try:
-            result = provider.generate_json(system_prompt, user_prompt)
-            searches = result.get("searches", [])
+            result = self._generate_json("plan", provider, system_prompt, user_prompt)
+            return self._parse_search_plan(result, max_queries)
+        except Exception as e:
+            logger.error(f"Error generating keywords: {e}")
+            return []
 
-            # Application-side enforcement of the limit just in case LLM goes over
-            if max_queries is not None:
-                searches = searches[:max_queries]
+    async def agenerate_search_plan(
+        self,
+        profile: Dict[str, Any],
+        providers_info: List[Any],
+        max_queries: int | None = None,
+    ) -> List[Dict[str, Any]]:
+        provider = get_provider_for_step("plan")
+        logger.info(f"[PLAN] Using {provider.model_id}")
 
-            return searches
+        system_prompt, user_prompt = self._search_plan_prompts(profile, max_queries)
+        try:
+            result = await self._agenerate_json("plan", provider, system_prompt, user_prompt)
+            return self._parse_search_plan(result, max_queries)
         except Exception as e:
             logger.error(f"Error generating keywords: {e}")
             return []
 
     # ─── Step 2: Title Relevance Check ────────────────────────────────────
 
-    def check_title_relevance(self, title: str, role_description: str) -> Dict[str, Any]:
-        provider = get_provider_for_step("relevance")
-
+    @staticmethod
+    def _title_relevance_prompts(title: str, role_description: str) -> Tuple[str, str]:
         system_prompt = (
             "You are a concise classification assistant that outputs JSON. "
             "Determine whether a job title is relevant to the user's target role."
@@ -95,21 +191,131 @@ Return ONLY pure JSON with a 'searches' list. Example:
             f'Is the job title "{title}" relevant to a candidate looking for "{role_description}"?\n\n'
             f'Return JSON: {{ "relevant": true/false, "reason": "one-sentence explanation" }}'
         )
+        return system_prompt, user_prompt
+
+    def check_title_relevance(self, title: str, role_description: str) -> Dict[str, Any]:
+        provider = get_provider_for_step("relevance")
+
+        system_prompt, user_prompt = self._title_relevance_prompts(title, role_description)
+        try:
+            return self._generate_json("relevance", provider, system_prompt, user_prompt, _is_relevance_verdict)
+        except Exception as e:
+            logger.error(f"Error checking relevance: {e}")
+            return {"relevant": True, "reason": "Error checking relevance"}
+
+    async def acheck_title_relevance(self, title: str, role_description: str) -> Dict[str, Any]:
+        provider = get_provider_for_step("relevance")
 
+        system_prompt, user_prompt = self._title_relevance_prompts(title, role_description)
         try:
-            return provider.generate_json(system_prompt, user_prompt)
+            return await self._agenerate_json("relevance", provider, system_prompt, user_prompt, _is_relevance_verdict)
         except Exception as e:
             logger.error(f"Error checking relevance: {e}")
             return {"relevant": True, "reason": "Error checking relevance"}
 
+    # ─── Step 2b: Batched Title Relevance ─────────────────────────────────
+    #
+    # Classifies many titles in one round trip.  Titles are chunked so that the
+    # expected answer fits into the provider's max_tokens; any title missing or
+    # malformed in a batch answer falls back to the single-title check.  Only
+    # titles without a cached verdict are sent.
+
+    @staticmethod
+    def _titles_relevance_prompts(titles: List[str], role_description: str) -> Tuple[str, str]:
+        system_prompt = (
+            "You are a concise classification assistant that outputs JSON. "
+            "Determine for each job title whether it is relevant to the user's target role."
+        )
+        numbered = "\n".join(f"{i}. {json.dumps(title, ensure_ascii=False)}" for i, title in enumerate(titles))
+        user_prompt = (
+            f'For a candidate looking for "{role_description}", classify each of these job titles:\n'
+            f"{numbered}\n\n"
+            f"Answer for every index from 0 to {len(titles) - 1}. Return JSON:\n"
+            f'{{ "results": [ {{ "index": 0, "relevant": true/false, "reason": "one-sentence explanation" }} ] }}'
+        )
+        return system_prompt, user_prompt
+
+    @staticmethod
+    def _parse_titles_relevance(result: Dict[str, Any], count: int) -> List[Optional[Dict[str, Any]]]:
+        """Map a batch answer back to input order; unusable entries stay ``None``."""
+        parsed: List[Optional[Dict[str, Any]]] = [None] * count
+        items = result.get("results") if isinstance(result, dict) else None
+        if not isinstance(items, list):
+            return parsed
+
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get("relevant"), bool):
+                continue
+            index = item.get("index")
+            if isinstance(index, int) and 0 <= index < count and parsed[index] is None:
+                parsed[index] = {"relevant": item["relevant"], "reason": str(item.get("reason", ""))}
+        return parsed
+
+    @staticmethod
+    def _relevance_chunk_size(provider: LLMProvider) -> int:
+        max_tokens = getattr(provider, "max_tokens", None)
+        if not isinstance(max_tokens, int) or max_tokens <= 0:
+            max_tokens = settings.LLM_MAX_TOKENS
+        by_tokens = max_tokens // settings.LLM_RELEVANCE_TOKENS_PER_TITLE
+        return max(1, min(settings.LLM_RELEVANCE_BATCH_SIZE, by_tokens))
+
+    async def acheck_titles_relevance(self, titles: List[str], role_description: str) -> List[Dict[str, Any]]:
+        if not titles:
+            return []
+        provider = get_provider_for_step("relevance")
+        size = self._relevance_chunk_size(provider)
+
+        # Verdicts are cached per title, under the single-title prompt's key,
+        # so they are found again whatever batch a title arrives in
+        keys = [
+            self._cache_key("relevance", provider, *self._title_relevance_prompts(title, role_description))
+            for title in titles
+        ]
+        results: List[Optional[Dict[str, Any]]] = [None] * len(titles)
+        if any(keys):
+            results = await asyncio.to_thread(lambda: [self.cache.get(key) if key else None for key in keys])
+
+        def store(verdicts: List[Tuple[str, Dict[str, Any]]]) -> None:
+            for key, item in verdicts:
+                self.cache.set(key, "relevance", provider.model_id, item)
+
+        async def classify_chunk(indexes: List[int]) -> None:
+            chunk = [titles[i] for i in indexes]
+            system_prompt, user_prompt = self._titles_relevance_prompts(chunk, role_description)
+            try:
+                async with self.budgets.slot(provider.model_id):
+                    answer = await provider.agenerate_json(system_prompt, user_prompt)
+                parsed = self._parse_titles_relevance(answer, len(chunk))
+            except Exception as e:
+                logger.error(f"Error checking relevance batch of {len(chunk)}: {e}")
+                parsed = [None] * len(chunk)
+
+            verdicts = [(keys[i], item) for i, item in zip(indexes, parsed) if keys[i] and item is not None]
+            if verdicts:
+                await asyncio.to_thread(store, verdicts)
+
+            missing = [n for n, item in enumerate(parsed) if item is None]
+            if missing:
+                logger.warning(f"[RELEVANCE] {len(missing)}/{len(chunk)} titles missing from batch answer, retrying singly")
+                singles = await asyncio.gather(
+                    *(self.acheck_title_relevance(chunk[n], role_description) for n in missing)
+                )
+                for n, item in zip(missing, singles):
+                    parsed[n] = item
+            for i, item in zip(indexes, parsed):
+                results[i] = item
+
+        misses = [i for i, item in enumerate(results) if item is None]
+        await asyncio.gather(*(classify_chunk(misses[start:start + size]) for start in range(0, len(misses), size)))
+        return results
+
     # ─── Step 3: Job Match Analysis ───────────────────────────────────────
 
-    def analyze_job_match(
-        self,
-        job_metadata: Dict[str, Any],
-        profile: Dict[str, Any],
-    ) -> Dict[str, Any]:
-        provider = get_provider_for_step("match")
+    @staticmethod
+    def _job_match_prompts(job_metadata: Dict[str, Any], profile: Dict[str, Any]) -> Tuple[str, str]:
+        # A long CV is sent as its digest (see agenerate_cv_digest)
+        digest = profile.get("cv_digest")
+        experience = json.dumps(digest, ensure_ascii=False) if digest else profile.get("cv_content")
 
         system_prompt = (
             "You are a strict and precise Career Coach AI. "
@@ -121,10 +327,10 @@ Return ONLY pure JSON with a 'searches' list. Example:
 
 PROFILE:
 - Expected Role: {profile.get('role_description')}
-- Experience Context: {profile.get('cv_content')}
+- Experience Context: {experience}
 
 JOB METADATA:
-{job_metadata}
+{json.dumps(job_metadata, ensure_ascii=False, default=str)}
 
 SCORING RULES:
 1. SENIORITY MISMATCH: If the candidate is Junior/Entry-level and the job requires Senior/Lead/Staff/Principal (5+ years), the affinity_score MUST NOT exceed 50. You may still mark worth_applying as true if the candidate has most required skills.
@@ -137,12 +343,87 @@ Return ONLY JSON:
     "affinity_analysis": "Concise 2-3 sentence explanation focusing on why the score was given, mentioning seniority if applicable.",
     "worth_applying": true/false
 }}"""
+        return system_prompt, user_prompt
 
+    def analyze_job_match(
+        self,
+        job_metadata: Dict[str, Any],
+        profile: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        provider = get_provider_for_step("match")
+
+        system_prompt, user_prompt = self._job_match_prompts(job_metadata, profile)
         try:
-            return provider.generate_json(system_prompt, user_prompt)
+            return self._generate_json("match", provider, system_prompt, user_prompt)
         except Exception as e:
             logger.error(f"Error analyzing affinity: {e}")
             return {"affinity_score": 0, "affinity_analysis": "Error during analysis", "worth_applying": False}
 
+    async def aanalyze_job_match(
+        self,
+        job_metadata: Dict[str, Any],
+        profile: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        provider = get_provider_for_step("match")
+
+        system_prompt, user_prompt = self._job_match_prompts(job_metadata, profile)
+        try:
+            return await self._agenerate_json("match", provider, system_prompt, user_prompt)
+        except Exception as e:
+            logger.error(f"Error analyzing affinity: {e}")
+            return {"affinity_score": 0, "affinity_analysis": "Error during analysis", "worth_applying": False}
+
+    # ─── Step 4: CV Digest ────────────────────────────────────────────────
+
+    @staticmethod
+    def _cv_digest_prompts(cv_content: str, token_budget: int) -> Tuple[str, str]:
+        system_prompt = (
+            "You condense CVs into compact, structured candidate profiles used "
+            "to judge job fit. Keep the facts, drop the prose, never invent anything."
+        )
+
+        user_prompt = f"""Condense this CV into a structured digest of at most about {token_budget} tokens.
+Keep everything that matters for judging fit with a job: seniority, years of experience, roles, skills and technologies, industries, languages with their level, education and certifications.
+
+CV:
+{cv_content}
+
+Return ONLY JSON:
+{{
+    "headline": "Current or target role and seniority in one line",
+    "seniority": "junior|mid|senior|lead",
+    "years_experience": 0,
+    "roles": ["Most recent role (years)"],
+    "skills": ["Skill or technology"],
+    "industries": ["Industry"],
+    "languages": ["German (C1)"],
+    "education": ["Degree, institution"],
+    "highlights": ["Short, concrete achievement"]
+}}"""
+        return system_prompt, user_prompt
+
+    async def agenerate_cv_digest(self, cv_content: str, token_budget: int) -> Optional[Dict[str, Any]]:
+        provider = get_provider_for_step("digest")
+
+        system_prompt, user_prompt = self._cv_digest_prompts(cv_content, token_budget)
+        try:
+            return await self._agenerate_json("digest", provider, system_prompt, user_prompt) or None
+        except Exception as e:
+            logger.error(f"Error generating CV digest: {e}")
+            return None
+
+
+def _build_response_cache() -> Optional[LLMResponseCache]:
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    return LLMResponseCache(
+        ttl_hours=settings.LLM_CACHE_TTL_HOURS,
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    )
+
 
-llm_service = LLMService()
+llm_service = LLMService(
+    cache=_build_response_cache(),
+    cached_steps={s.strip() for s in settings.LLM_CACHE_STEPS.split(",") if s.strip()},
+    budgets=ConcurrencyBudgets(default_limit=settings.LLM_MAX_CONCURRENT_CALLS),
+)
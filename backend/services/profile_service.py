@@ -1,8 +1,10 @@
+from datetime import datetime, timezone
 from typing import List
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from backend.repositories.profile_repository import ProfileRepository
-from backend.schemas import SearchProfileCreate, ScheduleToggle
+from backend.schemas import SearchProfileCreate, ScheduleToggle, SearchPlanUpdate
+from backend.services.search.search_plan import plan_fingerprint
 
 class ProfileService:
     def __init__(self, db: Session):
@@ -51,5 +53,63 @@ class ProfileService:
             
         return self.repo.update(profile, update_data)
 
+    # ── saved search plan ──
+
+    def _get_owned_profile(self, user_id: int, profile_id: int):
+        profile = self.repo.get(profile_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        if profile.user_id != user_id:
+            raise HTTPException(status_code=403, detail="Not authorized")
+        return profile
+
+    @staticmethod
+    def _current_fingerprint(profile) -> str:
+        from backend.services.search_service import search_provider_names
+        return plan_fingerprint(profile, search_provider_names())
+
+    def _plan_view(self, profile) -> dict:
+        up_to_date = bool(profile.search_plan) and (
+            profile.search_plan_pinned
+            or profile.search_plan_fingerprint == self._current_fingerprint(profile)
+        )
+        return {
+            "queries": profile.search_plan or [],
+            "fingerprint": profile.search_plan_fingerprint,
+            "pinned": bool(profile.search_plan_pinned),
+            "generated_at": profile.search_plan_generated_at,
+            "up_to_date": up_to_date,
+        }
+
+    def get_search_plan(self, user_id: int, profile_id: int) -> dict:
+        return self._plan_view(self._get_owned_profile(user_id, profile_id))
+
+    def update_search_plan(self, user_id: int, profile_id: int, plan_in: SearchPlanUpdate) -> dict:
+        profile = self._get_owned_profile(user_id, profile_id)
+
+        update_data = {}
+        if plan_in.queries is not None:
+            # Edited queries count as generated from the profile as it is now
+            update_data["search_plan"] = [q.model_dump() for q in plan_in.queries]
+            update_data["search_plan_fingerprint"] = self._current_fingerprint(profile)
+            update_data["search_plan_generated_at"] = datetime.now(timezone.utc)
+        if plan_in.pinned is not None:
+            if plan_in.pinned and not (update_data.get("search_plan") or profile.search_plan):
+                raise HTTPException(status_code=400, detail="There is no search plan to pin yet")
+            update_data["search_plan_pinned"] = plan_in.pinned
+
+        return self._plan_view(self.repo.update(profile, update_data))
+
+    def clear_search_plan(self, user_id: int, profile_id: int) -> dict:
+        """Drop the saved plan so the next run generates a new one."""
+        profile = self._get_owned_profile(user_id, profile_id)
+        profile = self.repo.update(profile, {
+            "search_plan": None,
+            "search_plan_fingerprint": None,
+            "search_plan_generated_at": None,
+            "search_plan_pinned": False,
+        })
+        return self._plan_view(profile)
+
 def get_profile_service(db: Session) -> ProfileService:
     return ProfileService(db)
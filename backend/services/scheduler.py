@@ -2,32 +2,73 @@
 # Scheduler Service
 # ═══════════════════════════════════════
 # Uses APScheduler to run periodic search workflows.
-# Each SearchProfile with schedule_enabled=True gets its own recurring job.
+# Each SearchProfile with schedule_enabled=True gets its own recurring job,
+# kept in a database job store.  Every worker process starts a scheduler, but
+# only the one holding the scheduler lease runs it unpaused, so each run is
+# triggered once; another process takes over when the leader goes away.
 
+import asyncio
 import logging
-from datetime import datetime, timezone
+import random
+from datetime import datetime, timedelta, timezone
+from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from backend.db.base import Base, SessionLocal
-from backend.services.search_service import get_search_service
+from backend.core.config import settings
+from backend.db.base import SessionLocal, engine
+from backend.services.leader_lease import LeaderLease
+from backend.services.search_service import get_search_service, search_governor
 from backend.models import SearchProfile
 
 logger = logging.getLogger(__name__)
 
+LEASE_NAME = "scheduler"
+JOB_ID_PREFIX = "search_profile_"
+
+# Incremental runs look back this far before the last completed run's start,
+# so postings published while it was running are not missed
+INCREMENTAL_OVERLAP = timedelta(hours=1)
+
 # Global scheduler instance
 _scheduler: AsyncIOScheduler | None = None
+_lease: LeaderLease | None = None
+_lease_task: asyncio.Task | None = None
+_is_leader = False
+
+
+def _job_id(profile_id: int) -> str:
+    return f"{JOB_ID_PREFIX}{profile_id}"
+
+
+def _build_job_store():
+    if settings.SCHEDULER_JOBSTORE == "db":
+        return SQLAlchemyJobStore(engine=engine, tablename="apscheduler_jobs")
+    if settings.SCHEDULER_JOBSTORE != "memory":
+        logger.warning(f"[Scheduler] Unknown job store {settings.SCHEDULER_JOBSTORE!r}, using in-memory")
+    return MemoryJobStore()
 
 
 def get_scheduler() -> AsyncIOScheduler:
     """Get or create the global scheduler."""
     global _scheduler
     if _scheduler is None:
-        _scheduler = AsyncIOScheduler()
+        _scheduler = AsyncIOScheduler(
+            jobstores={"default": _build_job_store()},
+            # Runs missed while nobody led (downtime, failover) fire once, late
+            job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": None},
+        )
     return _scheduler
 
 
+def is_leader() -> bool:
+    """Whether this process currently triggers the scheduled searches."""
+    return _is_leader
+
+
 async def _run_scheduled_search(profile_id: int):
     """Execute a scheduled search for the given profile."""
     logger.info(f"[Scheduler] Running scheduled search for profile {profile_id}")
@@ -38,19 +79,46 @@ async def _run_scheduled_search(profile_id: int):
             logger.warning(f"[Scheduler] Profile {profile_id} not found, removing job")
             remove_schedule(profile_id)
             return
-        
+
         if not profile.schedule_enabled:
             logger.info(f"[Scheduler] Profile {profile_id} schedule disabled, skipping")
             return
-        
-        # Update last run time
-        profile.last_scheduled_run = datetime.now(timezone.utc)
+
+        completed_through = profile.search_completed_through
+
+        # Claim the run by updating the last run time: if a lease handover
+        # briefly left two leaders, only one of them gets to start it
+        now = datetime.now(timezone.utc)
+        interval = timedelta(hours=profile.schedule_interval_hours or 24)
+        claimed = db.query(SearchProfile).filter(
+            SearchProfile.id == profile_id,
+            or_(
+                SearchProfile.last_scheduled_run.is_(None),
+                SearchProfile.last_scheduled_run <= now - interval / 2,
+            ),
+        ).update({SearchProfile.last_scheduled_run: now}, synchronize_session=False)
         db.commit()
-        
-        # Run the search workflow
-        search_service = get_search_service(db)
-        await search_service.run_search(profile_id)
-        
+        if not claimed:
+            logger.info(f"[Scheduler] Profile {profile_id} already ran this interval, skipping")
+            return
+
+        # Later runs only fetch what was posted since the last run that
+        # completed; a failed or stopped run leaves that checkpoint alone
+        since = None
+        if settings.SCHEDULER_INCREMENTAL and completed_through is not None:
+            since = _as_utc(completed_through) - INCREMENTAL_OVERLAP
+
+        # Run the search workflow once one of the global search slots is free
+        async with search_governor.run_slot(profile_id):
+            search_service = get_search_service(db)
+            completed = await search_service.run_search(profile_id, since=since)
+
+        if completed:
+            db.query(SearchProfile).filter(SearchProfile.id == profile_id).update(
+                {SearchProfile.search_completed_through: now}, synchronize_session=False
+            )
+            db.commit()
+
         logger.info(f"[Scheduler] Completed scheduled search for profile {profile_id}")
     except Exception as e:
         logger.error(f"[Scheduler] Error running scheduled search for profile {profile_id}: {e}")
@@ -58,16 +126,36 @@ async def _run_scheduled_search(profile_id: int):
         db.close()
 
 
-def add_schedule(profile_id: int, interval_hours: int):
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops the offset of stored datetimes
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _next_run_time(interval_hours: int, last_run: datetime | None) -> datetime:
+    """One interval after the last run; a run already due fires now (once).
+
+    A random start jitter spreads profiles due at the same moment (e.g. all
+    overdue after downtime) instead of firing them together.  Later runs
+    follow at exact intervals from this start, so each profile keeps its
+    offset; the trigger adds no jitter of its own.
+    """
+    now = datetime.now(timezone.utc)
+    jitter = timedelta(seconds=random.uniform(0, max(0, settings.SCHEDULER_START_JITTER_SECONDS)))
+    if last_run is None:
+        return now + timedelta(hours=interval_hours) + jitter
+    return max(now, _as_utc(last_run) + timedelta(hours=interval_hours)) + jitter
+
+
+def add_schedule(profile_id: int, interval_hours: int, last_run: datetime | None = None):
     """Add or update a scheduled search job."""
     scheduler = get_scheduler()
-    job_id = f"search_profile_{profile_id}"
-    
+    job_id = _job_id(profile_id)
+
     # Remove existing job if any
     existing = scheduler.get_job(job_id)
     if existing:
         scheduler.remove_job(job_id)
-    
+
     trigger = IntervalTrigger(hours=interval_hours)
     scheduler.add_job(
         _run_scheduled_search,
@@ -75,6 +163,7 @@ def add_schedule(profile_id: int, interval_hours: int):
         args=[profile_id],
         id=job_id,
         name=f"Scheduled search: Profile {profile_id}",
+        next_run_time=_next_run_time(interval_hours, last_run),
         replace_existing=True,
     )
     logger.info(f"[Scheduler] Added schedule for profile {profile_id}: every {interval_hours}h")
@@ -83,13 +172,38 @@ def add_schedule(profile_id: int, interval_hours: int):
 def remove_schedule(profile_id: int):
     """Remove a scheduled search job."""
     scheduler = get_scheduler()
-    job_id = f"search_profile_{profile_id}"
+    job_id = _job_id(profile_id)
     existing = scheduler.get_job(job_id)
     if existing:
         scheduler.remove_job(job_id)
         logger.info(f"[Scheduler] Removed schedule for profile {profile_id}")
 
 
+def sync_schedules():
+    """Make the job store match the schedule settings saved on the profiles."""
+    scheduler = get_scheduler()
+    db: Session = SessionLocal()
+    try:
+        profiles = db.query(SearchProfile).filter(
+            SearchProfile.schedule_enabled == True
+        ).all()
+    finally:
+        db.close()
+
+    wanted = set()
+    for profile in profiles:
+        interval = profile.schedule_interval_hours or 24
+        wanted.add(_job_id(profile.id))
+        job = scheduler.get_job(_job_id(profile.id))
+        if job is None or getattr(job.trigger, "interval", None) != timedelta(hours=interval):
+            add_schedule(profile.id, interval, profile.last_scheduled_run)
+
+    for job in scheduler.get_jobs():
+        if job.id.startswith(JOB_ID_PREFIX) and job.id not in wanted:
+            scheduler.remove_job(job.id)
+            logger.info(f"[Scheduler] Removed schedule {job.id} (disabled or deleted)")
+
+
 def get_all_schedules() -> list[dict]:
     """Get info about all scheduled jobs."""
     scheduler = get_scheduler()
@@ -104,35 +218,82 @@ def get_all_schedules() -> list[dict]:
     return jobs
 
 
+# ── leadership ─────────────────────────────────────────────────────────────
+
+async def _lead_once(lease: LeaderLease):
+    """Renew or compete for the lease and pause/resume the scheduler to match."""
+    global _is_leader
+    scheduler = get_scheduler()
+    try:
+        leader = await asyncio.to_thread(lease.acquire)
+    except Exception as e:
+        logger.warning(f"[Scheduler] Could not check the scheduler lease: {e}")
+        leader = False
+
+    if leader:
+        # Picks up schedules enabled, changed or disabled since the last check
+        await asyncio.to_thread(sync_schedules)
+        if not _is_leader:
+            _is_leader = True
+            scheduler.resume()
+            logger.info(f"[Scheduler] {lease.holder} is now the scheduler leader")
+        else:
+            scheduler.wakeup()
+    elif _is_leader:
+        _is_leader = False
+        scheduler.pause()
+        logger.warning(f"[Scheduler] {lease.holder} lost the scheduler lease, pausing")
+
+
+async def _lead(lease: LeaderLease):
+    renew_interval = lease.ttl / 3
+    while True:
+        try:
+            await _lead_once(lease)
+        except Exception as e:
+            logger.error(f"[Scheduler] Leadership check failed: {e}")
+        await asyncio.sleep(renew_interval)
+
+
 def start_scheduler():
-    """Start the scheduler and load saved schedules from DB."""
+    """Start the scheduler (paused) and compete for the scheduler lease."""
+    global _lease, _lease_task
     scheduler = get_scheduler()
     if scheduler.running:
         return
-    
-    # Load saved schedules from DB
-    db: Session = SessionLocal()
-    try:
-        profiles = db.query(SearchProfile).filter(
-            SearchProfile.schedule_enabled == True
-        ).all()
-        
-        for profile in profiles:
-            interval = profile.schedule_interval_hours or 24
-            add_schedule(profile.id, interval)
-            logger.info(f"[Scheduler] Restored schedule for profile {profile.id} (every {interval}h)")
-    except Exception as e:
-        logger.error(f"[Scheduler] Error loading schedules: {e}")
-    finally:
-        db.close()
-    
-    scheduler.start()
-    logger.info("[Scheduler] Started")
+
+    # Followers keep the scheduler paused; it only triggers jobs once this
+    # process holds the lease (see _lead_once)
+    scheduler.start(paused=True)
+    _lease = LeaderLease(LEASE_NAME, ttl=settings.SCHEDULER_LEASE_TTL_SECONDS)
+    _lease_task = asyncio.get_running_loop().create_task(_lead(_lease))
+    logger.info(f"[Scheduler] Started as {_lease.holder}, waiting for the scheduler lease")
+
+
+def pause_scheduler():
+    """Trigger no more scheduled searches; runs already started carry on.
+
+    Shutdown pauses first and waits for running searches: stopping the
+    scheduler would cancel its running jobs outright.
+    """
+    global _lease_task
+    if _lease_task is not None:
+        # The leadership loop would resume the scheduler
+        _lease_task.cancel()
+        _lease_task = None
+    if _scheduler and _scheduler.running:
+        _scheduler.pause()
 
 
 def stop_scheduler():
-    """Stop the scheduler gracefully."""
-    global _scheduler
+    """Stop the scheduler gracefully and hand the lease on."""
+    global _scheduler, _lease, _lease_task, _is_leader
+    pause_scheduler()
+    if _lease is not None and _is_leader:
+        _lease.release()
+    _lease = None
+    _is_leader = False
+
     if _scheduler and _scheduler.running:
         _scheduler.shutdown(wait=False)
         logger.info("[Scheduler] Stopped")
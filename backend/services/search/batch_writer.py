@@ -0,0 +1,89 @@
+"""Write-behind persistence of analyzed listings.
+
+Instead of SELECT + INSERT + COMMIT per job, the writer accumulates analyzed
+listings and stores them in one transaction: a multi-row upsert into
+``scraped_jobs`` keyed on ``(platform, platform_job_id)`` followed by one bulk
+insert into ``jobs``.  If the batch transaction fails, it is rolled back and
+every entry is retried on its own, so one bad row only loses itself.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.repositories.job_repository import JobRepository
+from backend.services.search.job_normalizer import NormalizedJobCache
+from backend.services.search.search_executor import (
+    build_scraped_job_row, build_job_row, save_job_analysis,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FlushResult:
+    saved: int = 0
+    failed: List[Tuple[Any, Exception]] = field(default_factory=list)
+
+
+class JobBatchWriter:
+    def __init__(self, db_session, normalizer: Optional[NormalizedJobCache] = None):
+        self.db = db_session
+        self.repo = JobRepository(db_session)
+        # Reuses the rows normalized for the match stage
+        self.normalizer = normalizer
+        self._pending: List[Tuple[Any, Dict[str, Any], dict]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, listing, analysis: Dict[str, Any], profile_dict: dict):
+        self._pending.append((listing, analysis, profile_dict))
+
+    def flush(self) -> FlushResult:
+        """Persist everything pending; never raises."""
+        pending, self._pending = self._pending, []
+        result = FlushResult()
+        if not pending:
+            return result
+
+        # Rows that cannot even be built only fail themselves
+        entries = []
+        for listing, analysis, profile_dict in pending:
+            try:
+                entries.append((
+                    listing,
+                    analysis,
+                    profile_dict,
+                    self._scraped_job_row(listing),
+                    build_job_row(listing, analysis, profile_dict),
+                ))
+            except Exception as e:
+                result.failed.append((listing, e))
+
+        if not entries:
+            return result
+
+        try:
+            ids = self.repo.bulk_upsert_scraped_jobs([entry[3] for entry in entries])
+            job_rows = []
+            for *_, scraped_row, job_row in entries:
+                key = (scraped_row["platform"], scraped_row["platform_job_id"])
+                job_rows.append({**job_row, "scraped_job_id": ids[key]})
+            self.repo.bulk_insert_jobs(job_rows)
+            self.db.commit()
+            result.saved += len(entries)
+        except Exception as batch_err:
+            self.db.rollback()
+            logger.warning(f"Batch insert of {len(entries)} jobs failed, retrying one by one: {batch_err}")
+            for listing, analysis, profile_dict, *_ in entries:
+                if save_job_analysis(listing, analysis, profile_dict, self.db):
+                    result.saved += 1
+                else:
+                    result.failed.append((listing, RuntimeError("DB error saving job")))
+        return result
+
+    def _scraped_job_row(self, listing) -> Dict[str, Any]:
+        if self.normalizer is not None:
+            return self.normalizer.normalize(listing).row
+        return build_scraped_job_row(listing)
@@ -0,0 +1,80 @@
+"""
+Concurrency limits shared by every search running in the process.
+
+Per-run limits (``QueryExecutor`` semaphores, pipeline workers) only bound a
+single search; when many scheduled searches fire together their load adds
+up.  ``ConcurrencyBudgets`` holds named semaphores that all runs draw from,
+and ``SearchGovernor`` adds a FIFO run queue capping how many searches run at
+once.
+
+Semaphores are bound to the event loop they are used on, so the budgets are
+rebuilt when used from a different loop (scripts, tests).
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager, nullcontext
+from typing import AsyncContextManager, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyBudgets:
+    """Named concurrency limits (``0`` or less = unlimited)."""
+
+    def __init__(self, limits: Optional[Dict[str, int]] = None, default_limit: int = 0):
+        self.limits = limits or {}
+        self.default_limit = default_limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def semaphore(self, name: str) -> Optional[asyncio.Semaphore]:
+        limit = self.limits.get(name, self.default_limit)
+        if limit <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop, self._semaphores = loop, {}
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = self._semaphores[name] = asyncio.Semaphore(limit)
+        return semaphore
+
+    def slot(self, name: str) -> AsyncContextManager:
+        """Hold one unit of *name*'s budget for the duration of the block."""
+        return self.semaphore(name) or nullcontext()
+
+
+class SearchGovernor:
+    """Run queue for scheduled searches plus the shared job-provider budget."""
+
+    def __init__(
+        self,
+        max_concurrent_searches: int = 0,
+        provider_limits: Optional[Dict[str, int]] = None,
+        default_provider_limit: int = 0,
+    ):
+        self._runs = ConcurrencyBudgets(default_limit=max_concurrent_searches)
+        self.providers = ConcurrencyBudgets(provider_limits, default_provider_limit)
+        self.queued = 0
+        self.running = 0
+
+    @asynccontextmanager
+    async def run_slot(self, profile_id: int) -> AsyncIterator[None]:
+        """Wait for a free search slot (first come, first served) and hold it."""
+        semaphore = self._runs.semaphore("searches")
+        if semaphore is not None and semaphore.locked():
+            logger.info(f"[Governor] Profile {profile_id} queued behind {self.running} running search(es)")
+        self.queued += 1
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+        finally:
+            self.queued -= 1
+        self.running += 1
+        try:
+            yield
+        finally:
+            self.running -= 1
+            if semaphore is not None:
+                semaphore.release()
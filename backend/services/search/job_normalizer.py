@@ -0,0 +1,158 @@
+"""
+Normalization of provider listings, done once per shared job.
+
+Cleaning the HTML, picking the description, formatting the workload and
+parsing the publication date depend only on the listing, not on the profile
+looking at it.  ``normalize_listing`` computes the ``ScrapedJob`` column
+values and a compact summary used as the match prompt's job input;
+``NormalizedJobCache`` keeps the results per ``(platform, platform_job_id)``
+so every run and profile in the process that meets the same job reuses them;
+an entry is only reused while the listing's content is unchanged, so an
+edited listing gets a fresh summary.
+
+The summary is stored on the ``ScrapedJob`` row as well; listings served
+from the local database carry it back, so it is not rebuilt across processes
+either.  With a token budget its description is trimmed (see
+``prompt_compaction``); the row keeps the full description.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from backend.services.search.prompt_compaction import compact_job_summary
+from backend.services.utils import clean_html_tags
+
+
+@dataclass(frozen=True)
+class NormalizedJob:
+    row: Dict[str, Any]  # ScrapedJob column values
+    summary: Dict[str, Any]  # job input of the match prompt
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.row["platform"], self.row["platform_job_id"]
+
+
+def listing_key(listing) -> Tuple[str, str]:
+    return listing.source, str(listing.id)
+
+
+def listing_fingerprint(listing) -> bytes:
+    """Digest of everything a listing carries; changes whenever the listing does."""
+    return hashlib.blake2b(listing.model_dump_json().encode(), digest_size=16).digest()
+
+
+def _parse_publication_date(listing) -> Optional[datetime]:
+    if not (listing.publication and listing.publication.start_date):
+        return None
+    try:
+        date_raw = listing.publication.start_date
+        if "T" in date_raw:
+            return datetime.fromisoformat(date_raw.replace("Z", "+00:00"))
+        return datetime.strptime(date_raw, "%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+def _workload(listing) -> Optional[str]:
+    if not listing.employment:
+        return None
+    wmin = listing.employment.workload_min
+    wmax = listing.employment.workload_max
+    return f"{wmin}-{wmax}%" if wmin != wmax else f"{wmin}%"
+
+
+def build_job_summary(row: Dict[str, Any], listing) -> Dict[str, Any]:
+    """Compact, LLM-ready description of a job (empty fields left out)."""
+    publication_date = row.get("publication_date")
+    summary = {
+        "title": row["title"],
+        "company": row.get("company"),
+        "location": row.get("location"),
+        "workload": row.get("workload"),
+        "published": publication_date.date().isoformat() if publication_date else None,
+        "languages": [
+            f"{s.language_code} ({s.spoken_level})" if s.spoken_level else s.language_code
+            for s in listing.language_skills
+        ],
+        "description": row.get("description"),
+    }
+    return {k: v for k, v in summary.items() if v}
+
+
+def normalize_listing(listing, description_token_budget: int = 0) -> NormalizedJob:
+    """Column values and match summary of *listing*'s shared ``ScrapedJob``."""
+    desc_text = listing.descriptions[0].description if listing.descriptions else ""
+    coordinates = listing.location.coordinates if listing.location else None
+
+    # Fallback for JobRoom if external_url is missing
+    external_url = listing.external_url
+    if not external_url and listing.source == "job_room":
+        external_url = f"https://www.job-room.ch/job-search/{listing.id}"
+
+    row = {
+        "platform": listing.source,
+        "platform_job_id": str(listing.id),
+        "title": clean_html_tags(listing.title),
+        "company": listing.company.name if listing.company else "Unknown",
+        "description": clean_html_tags(desc_text) if desc_text else None,
+        "location": listing.location.city if listing.location else "",
+        "latitude": coordinates.lat if coordinates else None,
+        "longitude": coordinates.lon if coordinates else None,
+        "external_url": external_url or str(listing.id),
+        "application_url": (listing.application.form_url if listing.application else None) or None,
+        "application_email": (listing.application.email if listing.application else None) or None,
+        "workload": _workload(listing),
+        "publication_date": _parse_publication_date(listing),
+        "raw_metadata": listing.raw_data,
+        "source_query": listing.title,
+    }
+    # Listings read back from the database already carry their summary
+    summary = compact_job_summary(listing.summary or build_job_summary(row, listing), description_token_budget)
+    row["summary"] = summary
+    return NormalizedJob(row=row, summary=summary)
+
+
+class NormalizedJobCache:
+    """LRU of normalized listings keyed on ``(platform, platform_job_id)``.
+
+    Used from the event loop and from the batch writer's worker threads, so
+    every access holds ``_lock``.  Each entry remembers the fingerprint of
+    the listing it was built from and is rebuilt when the listing changes.
+    """
+
+    def __init__(self, max_entries: int = 5000, description_token_budget: int = 0):
+        self.max_entries = max_entries
+        self.description_token_budget = description_token_budget
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[bytes, NormalizedJob]]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def normalize(self, listing) -> NormalizedJob:
+        key = listing_key(listing)
+        fingerprint = listing_fingerprint(listing)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == fingerprint:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+
+        # Outside the lock: two threads may normalize the same listing, which is harmless
+        job = normalize_listing(listing, self.description_token_budget)
+        if self.max_entries > 0:
+            with self._lock:
+                self._entries[key] = (fingerprint, job)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return job
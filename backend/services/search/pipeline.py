@@ -0,0 +1,294 @@
+"""Streaming search pipeline.
+
+Provider results flow through five stages connected by bounded queues:
+
+    fetch → dedup → relevance → match → persist
+
+so the LLM starts analysing the first listings while scrapers are still
+running, and memory is bounded by the queue sizes instead of by the total
+number of results.
+
+Relevance checks and persistence work on micro-batches: a worker takes what
+is queued (up to a batch size) or whatever arrived within a short window.
+"""
+
+import logging
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, List, Optional, Set
+from backend.services.search.search_executor import check_listings_relevance, analyze_listing
+from backend.services.search.batch_writer import JobBatchWriter
+from backend.services.search.job_normalizer import NormalizedJobCache
+from backend.services.search.title_prefilter import TitlePrefilter
+from backend.services.search_status import add_log, update_status
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PipelineStats:
+    jobs_found: int = 0
+    jobs_duplicates: int = 0
+    jobs_unique: int = 0
+    jobs_irrelevant: int = 0
+    jobs_saved: int = 0
+    jobs_failed: int = 0
+    provider_calls: int = 0
+    provider_errors: int = 0
+    llm_calls_saved: int = 0
+
+    @property
+    def jobs_skipped(self) -> int:
+        return self.jobs_irrelevant + self.jobs_failed
+
+
+class Deduplicator:
+    """Filter listings already seen in this run or already stored for the profile."""
+
+    def __init__(self, existing_identifiers: List[Any]):
+        self.seen_keys: Set[str] = set()
+        self.existing_keys = {
+            f"{row.platform}:{row.platform_job_id}" for row in existing_identifiers
+            if row.platform and row.platform_job_id
+        }
+        self.existing_urls = {row.external_url for row in existing_identifiers if row.external_url}
+
+    def is_known(self, listing) -> bool:
+        """Whether the profile already stored *listing* (no state is changed)."""
+        key = f"{getattr(listing, 'source', 'unknown')}:{getattr(listing, 'id', '')}"
+        url = getattr(listing, "external_url", None) or getattr(listing, "url", None)
+        return key in self.existing_keys or bool(url and url in self.existing_urls)
+
+    def is_new(self, listing) -> bool:
+        platform = getattr(listing, "source", "unknown")
+        platform_id = str(getattr(listing, "id", ""))
+
+        key = f"{platform}:{platform_id}"
+        url = getattr(listing, "external_url", None) or getattr(listing, "url", None) or platform_id
+
+        if (platform and platform_id and (key in self.seen_keys or key in self.existing_keys)) or \
+           (url and (url in self.existing_urls and key not in self.existing_keys)):
+            return False
+
+        if platform and platform_id:
+            self.seen_keys.add(key)
+        if url:
+            self.existing_urls.add(url)
+        return True
+
+
+class SearchPipeline:
+    """Run the staged fetch → dedup → relevance → match → persist pipeline.
+
+    ``db_session`` belongs to the persist stage alone: only the single persist
+    task touches it, one flush at a time.  Callers must not share it with
+    other work running during the pipeline.
+    """
+
+    def __init__(
+        self,
+        profile_id: int,
+        profile_dict: dict,
+        db_session,
+        deduplicator: Deduplicator,
+        *,
+        queue_size: int = 100,
+        analysis_concurrency: int = 10,
+        relevance_batch_size: int = 25,
+        relevance_batch_wait: float = 0.05,
+        prefilter: Optional[TitlePrefilter] = None,
+        persist_batch_size: int = 50,
+        persist_flush_interval: float = 0.5,
+        writer: Optional[JobBatchWriter] = None,
+        normalizer: Optional[NormalizedJobCache] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ):
+        self.profile_id = profile_id
+        self.profile_dict = profile_dict
+        self.db_session = db_session
+        self.deduplicator = deduplicator
+        self.analysis_concurrency = max(1, analysis_concurrency)
+        self.relevance_batch_size = max(1, relevance_batch_size)
+        self.relevance_batch_wait = relevance_batch_wait
+        self.prefilter = prefilter
+        self.persist_batch_size = max(1, persist_batch_size)
+        self.persist_flush_interval = persist_flush_interval
+        # Listing normalization (clean text, parsed fields, match summary) is
+        # shared by the match and persist stages, and across runs when the
+        # caller passes a long-lived cache
+        self.normalizer = normalizer if normalizer is not None else NormalizedJobCache()
+        self.writer = writer if writer is not None else JobBatchWriter(db_session, self.normalizer)
+        self.should_stop = should_stop
+        self.stats = PipelineStats()
+        self.stopped = False
+
+        self._fetched: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._unique: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._relevant: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._analyzed: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    # ───────────────────────────── stages ─────────────────────────────
+
+    async def _fetch(self, results: AsyncIterator[Any]):
+        async with aclosing(results) as stream:
+            async for result in stream:
+                if result.done:
+                    self.stats.provider_calls += 1
+                    update_status(self.profile_id, current_search_index=self.stats.provider_calls)
+
+                query, p_name = result.call.query, result.call.provider_name
+                if result.error:
+                    self.stats.provider_errors += 1
+                    logger.warning(f"Search «{query}» on {p_name} failed: {result.error}")
+                    add_log(self.profile_id, f"⚠ Search «{query}» on {p_name} failed: {result.error}")
+                    continue
+
+                add_log(self.profile_id, f"  ↳ {p_name}: {len(result.items)} jobs for «{query}»")
+                for listing in result.items:
+                    self.stats.jobs_found += 1
+                    await self._fetched.put(listing)
+
+    async def _dedup(self):
+        while True:
+            listing = await self._fetched.get()
+            try:
+                if self.deduplicator.is_new(listing):
+                    self.stats.jobs_unique += 1
+                    await self._unique.put(listing)
+                else:
+                    self.stats.jobs_duplicates += 1
+                update_status(
+                    self.profile_id,
+                    jobs_found=self.stats.jobs_found,
+                    jobs_new=self.stats.jobs_unique,
+                    jobs_duplicates=self.stats.jobs_duplicates,
+                )
+            finally:
+                self._fetched.task_done()
+
+    @staticmethod
+    async def _next_batch(queue: asyncio.Queue, size: int, wait: float) -> List[Any]:
+        """Wait for one item, then gather up to *size* items for at most *wait* seconds."""
+        batch = [await queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + wait
+        while len(batch) < size:
+            remaining = deadline - loop.time()
+            try:
+                if remaining <= 0:
+                    batch.append(queue.get_nowait())
+                else:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except (asyncio.QueueEmpty, asyncio.TimeoutError):
+                break
+        return batch
+
+    async def _relevance(self):
+        while True:
+            batch = await self._next_batch(self._unique, self.relevance_batch_size, self.relevance_batch_wait)
+            try:
+                if self._stop_requested():
+                    logger.info(f"Skipping job analysis for {len(batch)} jobs as search was stopped.")
+                    continue
+                verdicts = self._prefilter(batch)
+                ambiguous = [listing for listing, verdict in zip(batch, verdicts) if verdict is None]
+                if ambiguous:
+                    llm_verdicts = iter(await check_listings_relevance(ambiguous, self.profile_dict))
+                    verdicts = [next(llm_verdicts) if v is None else v for v in verdicts]
+
+                for listing, relevant in zip(batch, verdicts):
+                    if relevant:
+                        await self._relevant.put(listing)
+                    else:
+                        self.stats.jobs_irrelevant += 1
+            except Exception as e:
+                for listing in batch:
+                    self._record_failure(listing, e)
+            finally:
+                for _ in batch:
+                    self._unique.task_done()
+
+    def _prefilter(self, batch: List[Any]) -> List[Optional[bool]]:
+        """Local verdicts for *batch*; ``None`` entries still need the LLM."""
+        if self.prefilter is None:
+            return [None] * len(batch)
+
+        verdicts = [self.prefilter.classify(listing.title) for listing in batch]
+        decided = sum(v is not None for v in verdicts)
+        if decided:
+            self.stats.llm_calls_saved += decided
+            update_status(self.profile_id, llm_calls_saved=self.stats.llm_calls_saved)
+        return verdicts
+
+    async def _match(self):
+        while True:
+            listing = await self._relevant.get()
+            try:
+                # Listings queued before a stop are dropped, not analysed
+                if self._stop_requested():
+                    continue
+                add_log(self.profile_id, f"Analyzing: {listing.title}")
+                analysis = await analyze_listing(listing, self.profile_dict, self.normalizer)
+                await self._analyzed.put((listing, analysis))
+            except Exception as e:
+                self._record_failure(listing, e)
+            finally:
+                self._relevant.task_done()
+
+    async def _persist(self):
+        while True:
+            batch = await self._next_batch(self._analyzed, self.persist_batch_size, self.persist_flush_interval)
+            try:
+                # Analyses finished before a stop are still saved: their LLM
+                # calls are already paid for (the match stage starts no new ones)
+                for listing, analysis in batch:
+                    self.writer.add(listing, analysis, self.profile_dict)
+                # Flushing happens in a worker thread on the writer's own
+                # session, so DB I/O overlaps with fetching and LLM calls.
+                result = await asyncio.to_thread(self.writer.flush)
+                self.stats.jobs_saved += result.saved
+                for listing, error in result.failed:
+                    self._record_failure(listing, error)
+            except Exception as e:
+                for listing, _ in batch:
+                    self._record_failure(listing, e)
+            finally:
+                for _ in batch:
+                    self._analyzed.task_done()
+
+    def _stop_requested(self) -> bool:
+        if not self.stopped and self.should_stop and self.should_stop():
+            self.stopped = True
+        return self.stopped
+
+    def _record_failure(self, listing, error: Exception):
+        self.stats.jobs_failed += 1
+        logger.warning(f"Failed to process job {listing.id}: {error}")
+        add_log(self.profile_id, f"⚠ Failed: {listing.title} – {error}")
+
+    # ───────────────────────────── driver ─────────────────────────────
+
+    async def run(self, results: AsyncIterator[Any]) -> PipelineStats:
+        """Drain *results* through all stages and return the final counters."""
+        workers = [
+            asyncio.create_task(self._dedup()),
+            asyncio.create_task(self._persist()),
+        ]
+        workers += [asyncio.create_task(self._relevance()) for _ in range(self.analysis_concurrency)]
+        workers += [asyncio.create_task(self._match()) for _ in range(self.analysis_concurrency)]
+
+        try:
+            await self._fetch(results)
+            update_status(self.profile_id, state="analyzing")
+
+            # Each queue is only joined once everything upstream is drained,
+            # so no stage can receive new work after its join returns.
+            for queue in (self._fetched, self._unique, self._relevant, self._analyzed):
+                await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return self.stats
@@ -0,0 +1,66 @@
+"""
+Token budgets for the match prompt.
+
+Every relevant listing gets its own match call, and each used to carry the
+whole CV and the whole job description.  A long CV is condensed once into a
+structured digest (cached on the profile under a hash of its content) and
+job descriptions are trimmed when a job is normalized, so the per-listing
+prompts stay small while the scoring instructions remain the same.
+
+Token counts are estimates (about four characters per token), which is
+precise enough for a budget and needs no tokenizer.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict
+
+CHARS_PER_TOKEN = 4
+
+# A description is never cut below this, however much the other fields take
+MIN_DESCRIPTION_TOKENS = 100
+
+# Bump when the digest prompt changes so stored digests are redone
+DIGEST_FORMAT_VERSION = 1
+
+_ELLIPSIS = " …"
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN) if text else 0
+
+
+def trim_to_tokens(text: str, budget: int) -> str:
+    """*text* cut to about *budget* tokens, preferably at a sentence end."""
+    if budget <= 0 or estimate_tokens(text) <= budget:
+        return text
+    limit = budget * CHARS_PER_TOKEN - len(_ELLIPSIS)
+    cut = text[:limit]
+    # Only back up to a boundary when that keeps most of the budget
+    sentence_end = cut.rfind(". ")
+    if sentence_end >= limit * 0.6:
+        cut = cut[:sentence_end + 1]
+    else:
+        word_end = cut.rfind(" ")
+        if word_end >= limit * 0.6:
+            cut = cut[:word_end]
+    return cut.rstrip() + _ELLIPSIS
+
+
+def compact_job_summary(summary: Dict[str, Any], budget: int) -> Dict[str, Any]:
+    """*summary* with its description trimmed so the whole fits about *budget* tokens."""
+    description = summary.get("description")
+    if budget <= 0 or not description:
+        return summary
+    other_fields = {k: v for k, v in summary.items() if k != "description"}
+    other_tokens = estimate_tokens(json.dumps(other_fields, ensure_ascii=False, default=str))
+    trimmed = trim_to_tokens(description, max(budget - other_tokens, MIN_DESCRIPTION_TOKENS))
+    if trimmed == description:
+        return summary
+    return {**summary, "description": trimmed}
+
+
+def cv_digest_key(cv_content: str, budget: int) -> str:
+    """Content hash a stored CV digest is valid for."""
+    raw = f"{DIGEST_FORMAT_VERSION}:{budget}:{cv_content}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
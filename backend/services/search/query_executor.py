@@ -0,0 +1,164 @@
+import logging
+import asyncio
+from dataclasses import dataclass, field
+from contextlib import AsyncExitStack, aclosing, asynccontextmanager
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Dict, Iterable, List, Optional
+from backend.providers.jobs.base import JobProvider
+from backend.providers.jobs.models import JobSearchRequest
+from backend.services.search.governor import ConcurrencyBudgets
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderCall:
+    """A single (query, provider) pair of the search plan."""
+    query: str
+    domain: str
+    provider_name: str
+    request: JobSearchRequest
+
+
+@dataclass
+class ProviderResult:
+    """Outcome of a ``ProviderCall`` — either ``items`` or an ``error``.
+
+    Providers that paginate produce several results per call; only the last
+    one has ``done`` set.
+    """
+    call: ProviderCall
+    items: List[Any] = field(default_factory=list)
+    error: Optional[Exception] = None
+    done: bool = True
+
+
+# Marker a call task puts on the output queue once it has finished
+_CALL_FINISHED = object()
+
+
+class _SearchStopped(Exception):
+    """Raised by a page slot obtained after the search was stopped."""
+
+
+async def _single_page(
+    provider: Any, request: JobSearchRequest, page_slot: Callable[[], AsyncContextManager]
+) -> AsyncIterator[List[Any]]:
+    async with page_slot():
+        result = await provider.search(request)
+    yield list(result.items)
+
+
+def _iter_pages(
+    provider: Any, request: JobSearchRequest, page_slot: Callable[[], AsyncContextManager]
+) -> AsyncIterator[List[Any]]:
+    if isinstance(provider, JobProvider):
+        return provider.iter_search(request, page_slot=page_slot)
+    return _single_page(provider, request, page_slot)
+
+
+class QueryExecutor:
+    """Run all planned provider calls concurrently.
+
+    Every call is started at once; a per-provider semaphore caps how many
+    requests hit the same job board simultaneously, and ``shared_limits``
+    (if given) additionally caps them across all concurrent searches.  The
+    limits apply per page request, so providers fetching several pages of a
+    call at once (Job-Room harvest) stay within them too.
+    With ``is_known``, a paginating call stops after a page made up only of
+    listings the profile already has: results come newest first, so the
+    remaining pages hold nothing new.  Results are yielded in
+    arrival order (page by page for paginating providers) so callers can
+    report progress and start processing as soon as data comes in; at most
+    ``queue_size`` of them wait for the caller, after which calls pause
+    until it catches up.
+    """
+
+    def __init__(
+        self,
+        providers: Dict[str, Any],
+        limits: Optional[Dict[str, int]] = None,
+        default_limit: int = 4,
+        shared_limits: Optional[ConcurrencyBudgets] = None,
+        is_known: Optional[Callable[[Any], bool]] = None,
+        queue_size: int = 100,
+    ):
+        limits = limits or {}
+        self.providers = providers
+        self.queue_size = queue_size
+        self.shared_limits = shared_limits
+        self.is_known = is_known
+        self._semaphores = {
+            name: asyncio.Semaphore(max(1, limits.get(name, default_limit)))
+            for name in providers
+        }
+        self.stopped = False
+
+    async def _run_call(
+        self,
+        call: ProviderCall,
+        should_stop: Optional[Callable[[], bool]],
+        out: asyncio.Queue,
+    ):
+        @asynccontextmanager
+        async def page_slot() -> AsyncIterator[None]:
+            async with AsyncExitStack() as stack:
+                await stack.enter_async_context(self._semaphores[call.provider_name])
+                if self.shared_limits:
+                    await stack.enter_async_context(self.shared_limits.slot(call.provider_name))
+                # Stop check happens right before a request is issued, so
+                # requests still queued behind the limits are skipped once stopped.
+                if self.stopped or (should_stop and should_stop()):
+                    self.stopped = True
+                    raise _SearchStopped()
+                yield
+
+        # One page of look-ahead, so the last page can be marked ``done``
+        page = None
+        try:
+            provider = self.providers[call.provider_name]
+            async with aclosing(_iter_pages(provider, call.request, page_slot)) as pages:
+                async for items in pages:
+                    if page is not None:
+                        await out.put(ProviderResult(call=call, items=page, done=False))
+                    page = list(items)
+                    if self.is_known and page and all(self.is_known(item) for item in page):
+                        break  # nothing new on this page or after it
+            await out.put(ProviderResult(call=call, items=page or []))
+        except _SearchStopped:
+            if page:
+                await out.put(ProviderResult(call=call, items=page, done=False))
+        except Exception as e:
+            if page:
+                await out.put(ProviderResult(call=call, items=page, done=False))
+            await out.put(ProviderResult(call=call, error=e))
+        # Not in a ``finally``: a call is only cancelled once the caller stopped
+        # reading, and waiting for room in the queue then would never end
+        await out.put(_CALL_FINISHED)
+
+    async def run(
+        self,
+        calls: Iterable[ProviderCall],
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> AsyncIterator[ProviderResult]:
+        """Execute *calls* concurrently and yield results as they arrive.
+
+        Iteration ends early (and outstanding calls are cancelled) as soon as
+        ``should_stop`` reports that the search was stopped.
+        """
+        out: asyncio.Queue = asyncio.Queue(maxsize=max(1, self.queue_size))
+        tasks = [asyncio.create_task(self._run_call(c, should_stop, out)) for c in calls]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                result = await out.get()
+                if result is _CALL_FINISHED:
+                    remaining -= 1
+                    if self.stopped:
+                        break
+                    continue
+                yield result
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -1,75 +1,44 @@
 import logging
-import asyncio
-from datetime import datetime
+from typing import Any, Dict, List, Optional
 from backend.services.llm_service import llm_service
-from backend.services.utils import haversine_distance, clean_html_tags
+from backend.services.search.job_normalizer import NormalizedJobCache, normalize_listing
+from backend.services.utils import haversine_distance
 from backend.models import Job, ScrapedJob
+from backend.repositories.job_repository import BACKFILLED_SCRAPED_JOB_COLUMNS
 
 logger = logging.getLogger(__name__)
 
-async def process_job_listing(listing, profile_dict: dict, db_session) -> bool:
-    """Analyse a single job listing via LLM and save it to DB."""
-    # Step A: Title Relevance Check First (User Request)
-    relevance = await asyncio.to_thread(
-        llm_service.check_title_relevance, listing.title, profile_dict.get("role_description", "")
+
+async def check_listings_relevance(listings: List[Any], profile_dict: dict) -> List[bool]:
+    """Stage 1 (batched) — classify many listing titles in as few LLM calls as possible."""
+    verdicts = await llm_service.acheck_titles_relevance(
+        [listing.title for listing in listings], profile_dict.get("role_description", "")
     )
-    if not relevance.get("relevant", True):
-        logger.info(f"Skipping job due to title irrelevance: {listing.title}")
-        return False
+    relevant = []
+    for listing, verdict in zip(listings, verdicts):
+        keep = verdict.get("relevant", True)
+        if not keep:
+            logger.info(f"Skipping job due to title irrelevance: {listing.title}")
+        relevant.append(keep)
+    return relevant
 
-    # Extract description text
-    desc_text = ""
-    if listing.descriptions:
-        desc_text = listing.descriptions[0].description
-
-    # Enriched Metadata for deep analysis
-    job_metadata = {
-        "title": listing.title,
-        "description": desc_text, 
-        "location": listing.location.city if listing.location else "Unknown",
-        "workload": f"{listing.employment.workload_min}-{listing.employment.workload_max}%" if listing.employment else "Unknown",
-        "languages": [f"{s.language_code} ({s.spoken_level})" for s in listing.language_skills] if listing.language_skills else [],
-        "company": listing.company.name if listing.company else "Unknown",
-    }
 
-    # LLM affinity analysis (Deep)
-    analysis = await asyncio.to_thread(
-        llm_service.analyze_job_match, job_metadata, profile_dict
-    )
+async def analyze_listing(
+    listing, profile_dict: dict, normalizer: Optional[NormalizedJobCache] = None
+) -> Dict[str, Any]:
+    """Stage 2 — deep LLM affinity analysis of a relevant listing."""
+    job = normalizer.normalize(listing) if normalizer is not None else normalize_listing(listing)
+    return await llm_service.aanalyze_job_match(job.summary, profile_dict)
+
+
+def build_scraped_job_row(listing) -> Dict[str, Any]:
+    """Column values of the shared ScrapedJob row for *listing*."""
+    return normalize_listing(listing).row
+
 
-    score = analysis.get("affinity_score", 0)
+def build_job_row(listing, analysis: Dict[str, Any], profile_dict: dict) -> Dict[str, Any]:
+    """Column values of the user-specific Job row (without ``scraped_job_id``)."""
     reasoning = analysis.get("affinity_analysis", "")
-    worth = analysis.get("worth_applying", False)
-
-    # Parsing fields
-    company = listing.company.name if listing.company else "Unknown"
-    location_str = listing.location.city if listing.location else ""
-    
-    workload_str = ""
-    if listing.employment:
-        wmin = listing.employment.workload_min
-        wmax = listing.employment.workload_max
-        workload_str = f"{wmin}-{wmax}%" if wmin != wmax else f"{wmin}%"
-
-    app_url = listing.application.form_url if listing.application else None
-    app_email = listing.application.email if listing.application else None
-
-    # Fallback for JobRoom if external_url is missing
-    final_external_url = listing.external_url
-    if not final_external_url and listing.source == "job_room":
-        final_external_url = f"https://www.job-room.ch/job-search/{listing.id}"
-
-    pub_date = None
-    if listing.publication and listing.publication.start_date:
-        try:
-            date_raw = listing.publication.start_date
-            if "T" in date_raw:
-                date_str = date_raw.replace('Z', '+00:00')
-                pub_date = datetime.fromisoformat(date_str)
-            else:
-                pub_date = datetime.strptime(date_raw, "%Y-%m-%d")
-        except (ValueError, TypeError):
-            pass
 
     distance_km = None
     if (profile_dict.get("latitude") is not None and profile_dict.get("longitude") is not None and 
@@ -84,42 +53,39 @@ async def process_job_listing(listing, profile_dict: dict, db_session) -> bool:
             1,
         )
 
+    return {
+        "user_id": profile_dict["user_id"],
+        "search_profile_id": profile_dict["id"],
+        "is_scraped": True,
+        "affinity_score": analysis.get("affinity_score", 0),
+        "affinity_analysis": reasoning if reasoning else None,
+        "worth_applying": analysis.get("worth_applying", False),
+        "distance_km": distance_km,
+    }
+
+
+def save_job_analysis(listing, analysis: Dict[str, Any], profile_dict: dict, db_session) -> bool:
+    """Stage 3 — upsert the ScrapedJob and store the user-specific Job row."""
+    scraped_row = build_scraped_job_row(listing)
+    job_row = build_job_row(listing, analysis, profile_dict)
+
     # 1. UPSERT ScrapedJob + 2. CREATE Job (with rollback on error)
     try:
         scraped_job = db_session.query(ScrapedJob).filter(
-            ScrapedJob.platform == listing.source,
-            ScrapedJob.platform_job_id == str(listing.id)
+            ScrapedJob.platform == scraped_row["platform"],
+            ScrapedJob.platform_job_id == scraped_row["platform_job_id"]
         ).first()
 
         if not scraped_job:
-            scraped_job = ScrapedJob(
-                platform=listing.source,
-                platform_job_id=str(listing.id),
-                title=clean_html_tags(listing.title),
-                company=company,
-                description=clean_html_tags(desc_text) if desc_text else None,
-                location=location_str,
-                external_url=final_external_url or str(listing.id),
-                application_url=app_url or None,
-                application_email=app_email or None,
-                workload=workload_str or None,
-                publication_date=pub_date,
-                raw_metadata=listing.raw_data,
-                source_query=listing.title,
-            )
+            scraped_job = ScrapedJob(**scraped_row)
             db_session.add(scraped_job)
             db_session.flush() # flush to get the ID for the Job
+        else:
+            for column in BACKFILLED_SCRAPED_JOB_COLUMNS:
+                if getattr(scraped_job, column) is None and scraped_row.get(column) is not None:
+                    setattr(scraped_job, column, scraped_row[column])
 
-        job = Job(
-            user_id=profile_dict["user_id"],
-            search_profile_id=profile_dict["id"],
-            scraped_job_id=scraped_job.id,
-            is_scraped=True,
-            affinity_score=score,
-            affinity_analysis=reasoning if reasoning else None,
-            worth_applying=worth,
-            distance_km=distance_km,
-        )
+        job = Job(scraped_job_id=scraped_job.id, **job_row)
 
         db_session.add(job)
         db_session.commit()
@@ -128,4 +94,3 @@ async def process_job_listing(listing, profile_dict: dict, db_session) -> bool:
         logger.error(f"DB error saving job '{listing.title}': {db_err}")
         db_session.rollback()
         return False
-
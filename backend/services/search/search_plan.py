@@ -0,0 +1,38 @@
+"""
+Reuse of saved LLM search plans.
+
+A generated plan is stored on the profile together with a fingerprint of the
+inputs it was generated from (CV, role description, strategy, query limit and
+the providers searched).  A later run whose inputs hash the same reuses the
+plan instead of asking the LLM again; a pinned plan is reused regardless.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+# Bump when the plan prompt changes enough that saved plans should be redone
+PLAN_FORMAT_VERSION = 1
+
+
+def plan_fingerprint(profile: Any, provider_names: Iterable[str]) -> str:
+    """Hash of everything the generated plan depends on."""
+    inputs = {
+        "version": PLAN_FORMAT_VERSION,
+        "cv_content": profile.cv_content or "",
+        "role_description": profile.role_description or "",
+        "search_strategy": profile.search_strategy or "",
+        "max_queries": profile.max_queries,
+        "providers": sorted(provider_names),
+    }
+    encoded = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def reusable_plan(profile: Any, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+    """The profile's saved plan if it may be used for *fingerprint*, else ``None``."""
+    if not profile.search_plan:
+        return None
+    if profile.search_plan_pinned or profile.search_plan_fingerprint == fingerprint:
+        return list(profile.search_plan)
+    return None
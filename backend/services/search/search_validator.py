@@ -1,10 +1,15 @@
 import logging
+from datetime import datetime
+from typing import Optional
 from backend.providers.jobs.models import JobSearchRequest, SortOrder, RadiusSearchRequest, Coordinates, ContractType
 
 logger = logging.getLogger(__name__)
 
-def build_search_request(profile, query: str) -> JobSearchRequest:
-    """Create a JobSearchRequest from profile settings and a keyword query."""
+def build_search_request(profile, query: str, posted_since: Optional[datetime] = None) -> JobSearchRequest:
+    """Create a JobSearchRequest from profile settings and a keyword query.
+
+    ``posted_since`` narrows the request to postings newer than a previous run.
+    """
     workload_min, workload_max = 0, 100
     if profile.workload_filter:
         parts = profile.workload_filter.replace("%", "").split("-")
@@ -43,6 +48,7 @@ def build_search_request(profile, query: str) -> JobSearchRequest:
         query=query,
         location=profile.location_filter or "",
         posted_within_days=profile.posted_within_days or 30,
+        posted_since=posted_since,
         workload_min=workload_min,
         workload_max=workload_max,
         contract_type=c_type,
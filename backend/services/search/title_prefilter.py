@@ -0,0 +1,120 @@
+"""Cheap local title scoring in front of the LLM relevance check.
+
+Every listing title is compared word by word (character trigrams) against the
+profile's ``role_description`` and the generated plan queries:
+
+* titles that contain a whole plan query (or a short role description) are
+  accepted,
+* everything else is left to the LLM.
+
+Rejecting titles locally is opt-in (``reject_below``): synonyms, abbreviations
+and other-language titles ("Programmierer", "SRE", "Ingénieur logiciel")
+share no trigrams with the references, so a score threshold cannot tell
+them from real mismatches.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# Words that say nothing about the occupation itself (seniority, gender
+# markers, filler in free-text role descriptions) in EN/DE/FR/IT.  Words
+# that can be the occupation ("Tech Lead", "Head of IT") are kept.
+_STOPWORDS = frozenset("""
+    a an and or the of for in on at to with as by from my me i am be is are
+    looking look seeking want would like job jobs role roles position positions work working
+    senior junior principal intern internship trainee praktikum praktikant
+    stage stagiaire apprenti lehrling lehre mitarbeiter mitarbeiterin
+    und oder der die das fur im in mit als bei von zu ein eine
+    et ou le la les des du de pour avec en un une
+    e o il lo gli per con da di del della un una
+    100 80 90 70 60 50 40
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def _normalize(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text or "")
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def _words(text: str) -> List[str]:
+    return [w for w in _WORD_RE.findall(_normalize(text)) if len(w) > 1 and w not in _STOPWORDS]
+
+
+@lru_cache(maxsize=4096)
+def _trigrams(word: str) -> FrozenSet[str]:
+    padded = f" {word} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def word_similarity(a: str, b: str) -> float:
+    """Dice coefficient of the character trigrams of two words."""
+    if a == b:
+        return 1.0
+    ta, tb = _trigrams(a), _trigrams(b)
+    return 2 * len(ta & tb) / (len(ta) + len(tb))
+
+
+class TitlePrefilter:
+    """Accept obvious title matches locally so only the rest costs an LLM call.
+
+    With ``reject_below`` > 0, titles scoring below it are rejected as well.
+    """
+
+    def __init__(
+        self,
+        role_description: str,
+        queries: Iterable[str] = (),
+        reject_below: float = 0.0,
+        accept_above: float = 0.85,
+        max_role_phrase_words: int = 4,
+    ):
+        self.reject_below = reject_below
+        self.accept_above = accept_above
+
+        role_words = _words(role_description)
+        phrases = [_words(q) for q in queries]
+        # A short role description ("Software Engineer") is itself a good phrase;
+        # a long free-text one only contributes vocabulary.
+        if 0 < len(role_words) <= max_role_phrase_words:
+            phrases.append(role_words)
+
+        self.phrases: List[Tuple[str, ...]] = list({tuple(p) for p in phrases if p})
+        self.vocabulary = frozenset(role_words).union(*self.phrases) if self.phrases else frozenset(role_words)
+        self._best: Dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.vocabulary)
+
+    def _best_match(self, word: str) -> float:
+        if word not in self._best:
+            self._best[word] = max((word_similarity(word, ref) for ref in self.vocabulary), default=0.0)
+        return self._best[word]
+
+    def score(self, title: str) -> float:
+        """Best similarity of any title word to the reference vocabulary (0–1)."""
+        return max((self._best_match(w) for w in _words(title)), default=0.0)
+
+    def _contains_phrase(self, title_words: List[str]) -> bool:
+        return any(
+            all(
+                any(word_similarity(t, p) >= self.accept_above for t in title_words)
+                for p in phrase
+            )
+            for phrase in self.phrases
+        )
+
+    def classify(self, title: str) -> Optional[bool]:
+        """``True`` = accept, ``False`` = reject, ``None`` = ask the LLM."""
+        title_words = _words(title)
+        if not self.enabled or not title_words:
+            return None
+        if self._contains_phrase(title_words):
+            return True
+        if self.reject_below > 0 and self.score(title) < self.reject_below:
+            return False
+        return None
@@ -1,20 +1,29 @@
 import logging
 import asyncio
-from typing import List, Any, Dict
-from datetime import datetime
+from typing import Callable, List, Any, Dict, Optional
+from datetime import datetime, timezone
+import httpx
 from backend.repositories.job_repository import JobRepository
 from backend.repositories.profile_repository import ProfileRepository
 from backend.services.llm_service import llm_service
 from backend.services.search.search_validator import build_search_request
-from backend.services.search.search_executor import process_job_listing
+from backend.services.search.query_executor import QueryExecutor, ProviderCall
+from backend.services.search.pipeline import SearchPipeline, Deduplicator
+from backend.services.search.title_prefilter import TitlePrefilter
+from backend.services.search.governor import SearchGovernor
+from backend.services.search.job_normalizer import NormalizedJobCache
+from backend.services.search.prompt_compaction import cv_digest_key, estimate_tokens
+from backend.services.search.search_plan import plan_fingerprint, reusable_plan
 from backend.providers.jobs.jobroom.client import JobRoomProvider
 from backend.providers.jobs.swissdevjobs.client import SwissDevJobsProvider
 from backend.providers.jobs.localdb.client import LocalDbProvider
 from backend.providers.jobs.models import JobSearchRequest, SortOrder, RadiusSearchRequest, Coordinates
+from backend.providers.jobs.registry import close_providers, get_provider_registry
 from backend.models import Job
 from backend.core.config import settings
+from backend.db.base import SessionLocal
 from backend.services.search_status import (
-    init_status, add_log, update_status, clear_status,
+    init_status, add_log, update_status, clear_status, stop_signalled,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,23 +51,154 @@ def get_compatible_providers(
     return compatible
 
 
+def _job_room_provider() -> JobRoomProvider:
+    return JobRoomProvider(
+        harvest=settings.JOB_ROOM_HARVEST_ENABLED,
+        harvest_max_results=settings.JOB_ROOM_HARVEST_MAX_RESULTS,
+        harvest_concurrency=settings.JOB_ROOM_HARVEST_CONCURRENCY,
+        http_limits=httpx.Limits(
+            max_connections=settings.JOB_ROOM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.JOB_ROOM_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.JOB_ROOM_HTTP_KEEPALIVE_EXPIRY,
+        ),
+    )
+
+
+def _swissdevjobs_provider() -> SwissDevJobsProvider:
+    return SwissDevJobsProvider(
+        feed_max_age=settings.SWISSDEVJOBS_FEED_MAX_AGE_SECONDS,
+        detail_concurrency=settings.SWISSDEVJOBS_DETAIL_CONCURRENCY,
+    )
+
+
+_SHARED_PROVIDER_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "job_room": _job_room_provider,
+    "swissdevjobs": _swissdevjobs_provider,
+}
+
+
+def build_shared_providers() -> Dict[str, Any]:
+    """Remote job providers configured from settings.
+
+    Built once per app by the provider registry, or per run when no registry
+    is open on the current event loop.
+    """
+    return {name: factory() for name, factory in _SHARED_PROVIDER_FACTORIES.items()}
+
+
+def search_provider_names() -> List[str]:
+    """Names of the providers every run searches (part of the plan fingerprint)."""
+    return sorted([*_SHARED_PROVIDER_FACTORIES, "local_db"])
+
+
+# Budgets shared by every search in the process; scheduled searches also
+# wait for a slot in its run queue
+search_governor = SearchGovernor(
+    max_concurrent_searches=settings.SCHEDULER_MAX_CONCURRENT_SEARCHES,
+    provider_limits=settings.global_provider_concurrency_limits,
+    default_provider_limit=settings.SEARCH_GLOBAL_PROVIDER_CONCURRENCY,
+)
+
+
+# Normalized listings shared by every run and profile in the process
+normalized_jobs = NormalizedJobCache(
+    settings.SEARCH_NORMALIZED_JOB_CACHE_SIZE,
+    description_token_budget=settings.LLM_MATCH_JOB_TOKEN_BUDGET,
+)
+
+
 class SearchService:
-    def __init__(self, job_repo: JobRepository, profile_repo: ProfileRepository):
+    """Runs the search workflow for one profile.
+
+    ``job_repo``/``profile_repo`` share the caller's session and are only used
+    for setup reads.  Work that overlaps with the pipeline (stop checks, the
+    batch writer) opens its own sessions from ``session_factory`` so nothing
+    running concurrently ever shares a Session.
+    """
+
+    def __init__(
+        self,
+        job_repo: JobRepository,
+        profile_repo: ProfileRepository,
+        session_factory: Optional[Callable] = None,
+    ):
         self.job_repo = job_repo
         self.profile_repo = profile_repo
+        self.session_factory = session_factory or SessionLocal
+
+    def _is_stopped(self, profile_id: int) -> bool:
+        # A short-lived session always reads the committed flag instead of a
+        # stale copy from a long-lived identity map.
+        db = self.session_factory()
+        try:
+            current_profile = ProfileRepository(db).get(profile_id)
+            if current_profile and current_profile.is_stopped:
+                return True
+        finally:
+            db.close()
+        # Stop signals recorded in the shared status backend by another process
+        return stop_signalled(profile_id)
+
+    async def _cv_digest(self, profile) -> Optional[Dict[str, Any]]:
+        """Digest of a CV longer than the match budget, regenerated only when the CV changes."""
+        budget = settings.LLM_MATCH_CV_TOKEN_BUDGET
+        cv_content = profile.cv_content or ""
+        if budget <= 0 or estimate_tokens(cv_content) <= budget:
+            return None
+        key = cv_digest_key(cv_content, budget)
+        if profile.cv_digest and profile.cv_digest_hash == key:
+            return profile.cv_digest
+
+        # Failures fall back to the full CV in the match prompts
+        digest = await llm_service.agenerate_cv_digest(cv_content, budget)
+        if digest:
+            self.profile_repo.update(profile, {"cv_digest": digest, "cv_digest_hash": key})
+        return digest
+
+    async def _watch_stop_flag(self, profile_id: int, stop_event: asyncio.Event):
+        """Relay a stop requested through the DB flag (e.g. by another worker
+        process) to the in-process token.  Stops requested in this process set
+        the token directly, so this is the only place that polls the DB."""
+        while not stop_event.is_set():
+            try:
+                if await asyncio.to_thread(self._is_stopped, profile_id):
+                    stop_event.set()
+                    return
+            except Exception as e:
+                logger.warning(f"Stop flag check for profile {profile_id} failed: {e}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.SEARCH_STOP_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
 
     # ───────────────────────── public entry point ─────────────────────────
 
-    async def run_search(self, profile_id: int):
-        """Run the full search workflow for a saved profile."""
+    async def run_search(self, profile_id: int, since: Optional[datetime] = None) -> bool:
+        """Run the full search workflow for a saved profile.
+
+        The saved search plan is reused when it was generated from the same
+        inputs (see ``search_plan``) or pinned; otherwise a new one is
+        generated and saved.
+
+        With ``since`` (set by scheduled runs) and a reused plan the run is
+        incremental: providers are only asked for postings published since
+        then, and paginated queries stop at the first page holding nothing
+        new.  A freshly generated plan always gets a full run.
+
+        Returns ``True`` only when every provider call completed without an
+        error or a stop, i.e. nothing published before the run was missed.
+        """
         from backend.services.search_status import register_task, unregister_task
-        register_task(profile_id, asyncio.current_task())
+        stop_event = register_task(profile_id, asyncio.current_task())
+        stop_watcher = asyncio.create_task(self._watch_stop_flag(profile_id, stop_event))
+        # Providers created for this run only (closed at the end of it)
+        run_providers: Dict[str, Any] = {}
 
         try:
             profile = self.profile_repo.get(profile_id)
             if not profile:
                 logger.error(f"Profile {profile_id} not found")
-                return
+                return False
 
             profile_dict = {
                 "id": profile.id,
@@ -73,10 +213,15 @@ class SearchService:
             # Initialize status tracker immediately so frontend sees progress
             init_status(profile_id)
 
-            # Map available providers and their infos
+            # Map available providers and their infos; remote ones come from
+            # the app-wide registry so their pools and CSRF token are reused
+            registry = get_provider_registry()
+            if registry is not None:
+                shared_providers = registry.providers
+            else:
+                shared_providers = run_providers = build_shared_providers()
             available_providers = {
-                "job_room": JobRoomProvider(),
-                "swissdevjobs": SwissDevJobsProvider(),
+                **shared_providers,
                 "local_db": LocalDbProvider(self.job_repo.db)
             }
             
@@ -84,22 +229,31 @@ class SearchService:
                 name: p.get_provider_info() for name, p in available_providers.items()
             }
 
-            # ── Step 1: Generate search plan using LLM ──
-            add_log(profile_id, "Generating search plan with AI…")
-
-            try:
-                searches = await asyncio.to_thread(
-                    llm_service.generate_search_plan, profile_dict, list(provider_infos.values()), profile.max_queries
-                )
-            except Exception as e:
-                logger.error(f"LLM keyword generation failed: {e}")
-                update_status(profile_id, state="error", error=str(e))
-                return
+            # ── Step 1: Generate search plan using LLM (or reuse the saved one) ──
+            fingerprint = plan_fingerprint(profile, available_providers)
+            saved_plan = reusable_plan(profile, fingerprint)
+            incremental = since is not None and saved_plan is not None
+            if saved_plan is not None:
+                searches = saved_plan
+                add_log(profile_id, f"Reusing the saved search plan ({len(searches)} queries)")
+                if incremental:
+                    add_log(profile_id, f"Incremental run: postings since {since:%Y-%m-%d %H:%M} UTC")
+            else:
+                add_log(profile_id, "Generating search plan with AI…")
+
+                try:
+                    searches = await llm_service.agenerate_search_plan(
+                        profile_dict, list(provider_infos.values()), profile.max_queries
+                    )
+                except Exception as e:
+                    logger.error(f"LLM keyword generation failed: {e}")
+                    update_status(profile_id, state="error", error=str(e))
+                    return False
 
             if not searches:
                 add_log(profile_id, "No search keywords generated")
                 update_status(profile_id, state="done", jobs_found=0, jobs_new=0)
-                return
+                return False
 
             # Deduplicate searches based on query string (domain-agnostic dedup)
             unique_searches = []
@@ -118,27 +272,32 @@ class SearchService:
                 compatible = get_compatible_providers(domain, available_providers, provider_infos)
                 total_provider_calls += len(compatible)
 
-            init_status(profile_id, total_searches=total_provider_calls, searches=unique_searches)
+            # Not a second init_status(): that would clear a stop requested meanwhile
+            update_status(profile_id, total_searches=total_provider_calls, searches_generated=unique_searches)
             add_log(profile_id, f"Generated {len(searches)} queries → {len(unique_searches)} unique → {total_provider_calls} provider calls")
             
             searches = unique_searches
-
-            # ── Step 2: Execute searches with domain routing ──
+            if saved_plan is None:
+                # Reused by later runs while the profile's plan inputs stay the same
+                self.profile_repo.update(profile, {
+                    "search_plan": unique_searches,
+                    "search_plan_fingerprint": fingerprint,
+                    "search_plan_generated_at": datetime.now(timezone.utc),
+                })
+
+            # Match prompts carry a digest instead of a CV over the token budget
+            cv_digest = await self._cv_digest(profile)
+            if cv_digest:
+                profile_dict["cv_digest"] = cv_digest
+                add_log(profile_id, "Using the condensed CV for job matching")
+
+            # ── Step 2: Execute all searches concurrently with domain routing ──
             update_status(profile_id, state="searching")
-            
-            all_jobs: list = []
-            call_index = 0
 
+            calls: List[ProviderCall] = []
             for idx, search in enumerate(searches):
                 query = search.get("query", "")
                 domain = search.get("domain", "general")
-                
-                # Check if stopped
-                profile = self.profile_repo.get(profile_id)
-                if profile and profile.is_stopped:
-                    logger.info(f"Search profile {profile_id} was stopped by user.")
-                    update_status(profile_id, state="stopped", error="Search stopped by user.")
-                    break
 
                 # Find compatible providers for this query's domain
                 compatible = get_compatible_providers(domain, available_providers, provider_infos)
@@ -150,122 +309,90 @@ class SearchService:
                 add_log(profile_id, f"[{idx+1}/{len(searches)}] «{query}» (domain={domain}) → {', '.join(compatible)}")
 
                 # Build search request once, reuse for all providers
-                request = build_search_request(profile, query)
-
-                # Execute on all compatible providers in parallel
-                async def search_provider(provider_name: str, req: JobSearchRequest, q: str):
-                    provider = available_providers[provider_name]
-                    try:
-                        result = await provider.search(req)
-                        return provider_name, result.items, None
-                    except Exception as e:
-                        return provider_name, [], e
-
-                tasks = [
-                    search_provider(p_name, request, query)
+                request = build_search_request(profile, query, posted_since=since if incremental else None)
+                calls.extend(
+                    ProviderCall(query=query, domain=domain, provider_name=p_name, request=request)
                     for p_name in compatible
-                ]
-
-                results = await asyncio.gather(*tasks)
-
-                for p_name, items, error in results:
-                    call_index += 1
-                    update_status(profile_id, current_search_index=call_index)
-                    
-                    if error:
-                        logger.warning(f"Search «{query}» on {p_name} failed: {error}")
-                        add_log(profile_id, f"⚠ Search «{query}» on {p_name} failed: {error}")
-                    else:
-                        all_jobs.extend(items)
-                        add_log(profile_id, f"  ↳ {p_name}: {len(items)} jobs")
-
-            if not all_jobs:
-                add_log(profile_id, "No jobs found across all queries")
-                update_status(profile_id, state="done", jobs_found=0, jobs_new=0)
-                return
+                )
 
-            add_log(profile_id, f"Total raw results: {len(all_jobs)}")
+            # Hot-path stop checks only read the in-process token
+            is_stopped = stop_event.is_set
 
-            # ── Step 3: Deduplicate ──
-            seen_keys: set = set()
-            unique_jobs: list = []
-            
             # Use profile-specific identifiers instead of user-wide to allow re-analysis for different searches
-            existing_identifiers = self.job_repo.get_profile_job_identifiers(profile.id)
-            existing_keys = {
-                f"{row.platform}:{row.platform_job_id}" for row in existing_identifiers
-                if row.platform and row.platform_job_id
-            }
-            existing_urls = {row.external_url for row in existing_identifiers if row.external_url}
-
-            for listing in all_jobs:
-                platform = getattr(listing, "source", "unknown")
-                platform_id = str(getattr(listing, "id", ""))
-                
-                key = f"{platform}:{platform_id}"
-                url = getattr(listing, "external_url", None) or getattr(listing, "url", None) or platform_id
-                
-                if (platform and platform_id and (key in seen_keys or key in existing_keys)) or \
-                   (url and (url in existing_urls and key not in existing_keys)):
-                       continue
-                       
-                if platform and platform_id:
-                    seen_keys.add(key)
-                if url:
-                    existing_urls.add(url)
-                    
-                unique_jobs.append(listing)
-
-            duplicates = len(all_jobs) - len(unique_jobs)
-            add_log(
-                profile_id,
-                f"After dedup: {len(unique_jobs)} new, {duplicates} duplicates",
+            deduplicator = Deduplicator(self.job_repo.get_profile_job_identifiers(profile.id))
+
+            executor = QueryExecutor(
+                available_providers,
+                limits=settings.provider_concurrency_limits,
+                default_limit=settings.SEARCH_PROVIDER_CONCURRENCY,
+                shared_limits=search_governor.providers,
+                is_known=deduplicator.is_known if incremental else None,
+                queue_size=settings.SEARCH_PIPELINE_QUEUE_SIZE,
             )
-            update_status(
+
+            # ── Steps 3–5: Stream results through dedup → relevance → match → persist ──
+
+            prefilter = None
+            if settings.SEARCH_PREFILTER_ENABLED:
+                prefilter = TitlePrefilter(
+                    profile.role_description or "",
+                    [s.get("query", "") for s in searches],
+                    reject_below=settings.SEARCH_PREFILTER_REJECT_BELOW,
+                    accept_above=settings.SEARCH_PREFILTER_ACCEPT_ABOVE,
+                )
+
+            # The persist stage writes through its own session (see SearchPipeline)
+            writer_db = self.session_factory()
+            pipeline = SearchPipeline(
                 profile_id,
-                state="analyzing",
-                jobs_found=len(all_jobs),
-                jobs_new=len(unique_jobs),
-                jobs_duplicates=duplicates,
+                profile_dict,
+                writer_db,
+                deduplicator,
+                queue_size=settings.SEARCH_PIPELINE_QUEUE_SIZE,
+                analysis_concurrency=settings.SEARCH_ANALYSIS_CONCURRENCY,
+                relevance_batch_size=settings.LLM_RELEVANCE_BATCH_SIZE,
+                relevance_batch_wait=settings.SEARCH_RELEVANCE_BATCH_WAIT_MS / 1000,
+                prefilter=prefilter,
+                persist_batch_size=settings.SEARCH_PERSIST_BATCH_SIZE,
+                persist_flush_interval=settings.SEARCH_PERSIST_FLUSH_MS / 1000,
+                normalizer=normalized_jobs,
+                should_stop=is_stopped,
             )
+            try:
+                stats = await pipeline.run(executor.run(calls, should_stop=is_stopped))
+            finally:
+                writer_db.close()
 
-            # ── Step 4: Analyze & save each unique job (Parallel) ──
-            semaphore = asyncio.Semaphore(10)
-
-            async def process_with_limit(job, idx, total):
-                async with semaphore:
-                    current_profile = self.profile_repo.get(profile_id)
-                    if current_profile and current_profile.is_stopped:
-                        logger.info(f"Skipping job analysis for {job.id} as search was stopped.")
-                        return False
-                        
-                    add_log(profile_id, f"Analyzing {idx + 1}/{total}: {job.title}")
-                    try:
-                        return await process_job_listing(job, profile_dict, self.job_repo.db)
-                    except Exception as e:
-                        logger.warning(f"Failed to process job {job.id}: {e}")
-                        add_log(profile_id, f"⚠ Failed: {job.title} – {e}")
-                        return False
-
-            tasks = [
-                process_with_limit(job, idx, len(unique_jobs))
-                for idx, job in enumerate(unique_jobs)
-            ]
-            
-            results = await asyncio.gather(*tasks)
-            saved_count = sum(1 for r in results if r is True)
-            skipped_count = sum(1 for r in results if r is False)
+            stopped = executor.stopped or pipeline.stopped
+            if stopped:
+                logger.info(f"Search profile {profile_id} was stopped by user.")
+                update_status(profile_id, state="stopped", error="Search stopped by user.")
+
+            # A stopped search keeps its "stopped" state instead of ending as "done"
+            final_state = {} if stopped else {"state": "done"}
+
+            if not stats.jobs_found:
+                add_log(profile_id, "No jobs found across all queries")
+                update_status(profile_id, jobs_found=0, jobs_new=0, **final_state)
+                return not stopped and not stats.provider_errors
 
-            add_log(profile_id, f"✓ Search complete – {saved_count} jobs saved, {skipped_count} skipped")
+            add_log(profile_id, f"Total raw results: {stats.jobs_found} ({stats.jobs_unique} new, {stats.jobs_duplicates} duplicates)")
+            if stats.llm_calls_saved:
+                add_log(profile_id, f"Title pre-filter decided {stats.llm_calls_saved} jobs locally (LLM relevance checks saved)")
+            add_log(profile_id, f"✓ Search complete – {stats.jobs_saved} jobs saved, {stats.jobs_skipped} skipped")
             update_status(
                 profile_id,
-                state="done",
-                jobs_found=len(all_jobs),
-                jobs_new=saved_count,
-                jobs_duplicates=duplicates,
-                jobs_skipped=skipped_count
+                jobs_found=stats.jobs_found,
+                jobs_new=stats.jobs_saved,
+                jobs_duplicates=stats.jobs_duplicates,
+                jobs_skipped=stats.jobs_skipped,
+                llm_calls_saved=stats.llm_calls_saved,
+                **final_state,
             )
+            return not stopped and not stats.provider_errors
         finally:
+            stop_watcher.cancel()
+            await close_providers(run_providers)
             unregister_task(profile_id)
 
 
@@ -1,89 +1,266 @@
 """
-In-memory search status tracker.
+Search status tracker.
 Stores real-time progress of search workflows for frontend polling.
+
+Status data lives in a pluggable backend (see ``status_backend``): in-memory
+for a single process, or the database so every worker process serves the
+same progress.  Running tasks and their stop tokens are always in-process.
+
+Every change made in this process bumps a per-profile version and wakes the
+status streams waiting on it (``wait_for_change``).
 """
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Set, Tuple
+import asyncio
+import logging
 import threading
 
+from backend.core.config import settings
+from backend.services.status_backend import InMemoryStatusBackend, StatusBackend, build_status_backend
+
+logger = logging.getLogger(__name__)
+
 _lock = threading.Lock()
-_statuses: Dict[int, Dict[str, Any]] = {}
 _active_tasks: Dict[int, Any] = {} # profile_id -> asyncio.Task
+_stop_events: Dict[int, Tuple[asyncio.Event, Optional[asyncio.AbstractEventLoop]]] = {}
+# Per-run log sequence numbers (assigned by the process running the search);
+# stream clients resume from the last one they saw
+_log_seqs: Dict[int, int] = {}
+_backend: Optional[StatusBackend] = None
+
+# Change versions and waiting streams per profile id; ALL_PROFILES follows
+# every profile
+ALL_PROFILES = "all"
+_change_versions: Dict[Any, int] = {}
+_change_waiters: Dict[Any, Set[Tuple[asyncio.Event, Optional[asyncio.AbstractEventLoop]]]] = {}
+
+
+def get_status_backend() -> StatusBackend:
+    """The configured status backend (created on first use)."""
+    global _backend
+    if _backend is None:
+        with _lock:
+            if _backend is None:
+                _backend = build_status_backend(
+                    settings.SEARCH_STATUS_BACKEND,
+                    flush_interval=settings.SEARCH_STATUS_FLUSH_MS / 1000,
+                )
+    return _backend
+
+
+def set_status_backend(backend: Optional[StatusBackend]) -> Optional[StatusBackend]:
+    """Swap the status backend (``None`` = rebuild from settings); returns the old one."""
+    global _backend
+    with _lock:
+        previous, _backend = _backend, backend
+    return previous
+
+
+def close_status_backend():
+    """Flush buffered status writes and stop the backend's flusher."""
+    previous = set_status_backend(None)
+    if previous is not None:
+        previous.close()
 
 
 def init_status(profile_id: int, total_searches: int = 0, searches: List[Dict] = None):
     """Initialize or reset status when search begins."""
     with _lock:
-        _statuses[profile_id] = {
-            "state": "generating",
-            "total_searches": total_searches,
-            "current_search_index": 0,
-            "current_query": "",
-            "searches_generated": searches or [],
-            "jobs_found": 0,
-            "jobs_new": 0,
-            "jobs_duplicates": 0,
-            "jobs_skipped": 0,
-            "errors": 0,
-            "log": [],
-            "started_at": datetime.now(timezone.utc).isoformat(),
-            "finished_at": None,
-        }
+        _log_seqs[profile_id] = 0
+    get_status_backend().init(profile_id, {
+        "state": "generating",
+        "total_searches": total_searches,
+        "current_search_index": 0,
+        "current_query": "",
+        "searches_generated": searches or [],
+        "jobs_found": 0,
+        "jobs_new": 0,
+        "jobs_duplicates": 0,
+        "jobs_skipped": 0,
+        "llm_calls_saved": 0,
+        "errors": 0,
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "finished_at": None,
+    })
+    _notify_change(profile_id)
 
 
 def add_log(profile_id: int, message: str):
-    """Append a log entry."""
+    """Append a log entry (the last 100 are kept)."""
     with _lock:
-        s = _statuses.get(profile_id)
-        if s:
-            s["log"].append({
-                "time": datetime.now(timezone.utc).isoformat(),
-                "message": message,
-            })
-            # Keep last 100 entries
-            if len(s["log"]) > 100:
-                s["log"] = s["log"][-100:]
+        seq = _log_seqs[profile_id] = _log_seqs.get(profile_id, 0) + 1
+    get_status_backend().append_log(profile_id, {
+        "seq": seq,
+        "time": datetime.now(timezone.utc).isoformat(),
+        "message": message,
+    })
+    _notify_change(profile_id)
 
 
 def update_status(profile_id: int, **kwargs):
     """Update any status fields."""
-    with _lock:
-        s = _statuses.get(profile_id)
-        if s:
-            s.update(kwargs)
+    get_status_backend().update(profile_id, kwargs)
+    _notify_change(profile_id)
 
 
 def get_status(profile_id: int) -> Dict[str, Any]:
     """Get current status for a profile."""
-    with _lock:
-        return dict(_statuses.get(profile_id, {"state": "unknown"}))
+    return get_status_backend().get(profile_id) or {"state": "unknown"}
 
 
 def get_all_statuses() -> Dict[int, Dict[str, Any]]:
     """Get all current statuses."""
-    with _lock:
-        # Filter for only active/running or recently finished searches if needed,
-        # but returning all keeps frontend in sync. We'll return a copy.
-        import copy
-        return copy.deepcopy(_statuses)
+    return get_status_backend().get_all()
 
 
 def clear_status(profile_id: int):
     """Remove status (optional cleanup)."""
     with _lock:
-        _statuses.pop(profile_id, None)
+        _log_seqs.pop(profile_id, None)
+    get_status_backend().clear(profile_id)
+    _notify_change(profile_id)
+
+
+# ── change notification ──────────────────────────────────────────────────
+
+def _set_event(event: asyncio.Event, loop: Optional[asyncio.AbstractEventLoop]):
+    """Set *event* from any thread, on the loop it belongs to."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is None or loop is running or loop.is_closed():
+        event.set()
+    else:
+        loop.call_soon_threadsafe(event.set)
+
+
+def _notify_change(profile_id: int):
+    with _lock:
+        waiters = []
+        for key in (profile_id, ALL_PROFILES):
+            _change_versions[key] = _change_versions.get(key, 0) + 1
+            waiters += _change_waiters.get(key, ())
+    for event, loop in waiters:
+        _set_event(event, loop)
 
 
-def register_task(profile_id: int, task: Any):
-    """Register an active search task."""
+def change_version(key: Any) -> int:
+    """Current change version of a profile id (or ``ALL_PROFILES``)."""
+    with _lock:
+        return _change_versions.get(key, 0)
+
+
+async def wait_for_change(key: Any, seen_version: int, timeout: float) -> bool:
+    """Wait until *key* changes past *seen_version*; ``False`` on timeout.
+
+    Only changes made by this process wake the waiter; the timeout is the
+    fallback for changes other processes write to a shared backend.
+    """
+    entry = (asyncio.Event(), asyncio.get_running_loop())
+    with _lock:
+        if _change_versions.get(key, 0) != seen_version:
+            return True
+        _change_waiters.setdefault(key, set()).add(entry)
+    try:
+        await asyncio.wait_for(entry[0].wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        with _lock:
+            waiters = _change_waiters.get(key)
+            if waiters is not None:
+                waiters.discard(entry)
+                if not waiters:
+                    del _change_waiters[key]
+
+
+# ── running tasks ──────────────────────────────────────────────────────────
+
+def stop_signalled(profile_id: int) -> bool:
+    """Whether any process asked the search for *profile_id* to stop."""
+    return get_status_backend().stop_signalled(profile_id)
+
+
+def register_task(profile_id: int, task: Any) -> asyncio.Event:
+    """Register an active search task and return its in-process stop token."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    event = asyncio.Event()
     with _lock:
         _active_tasks[profile_id] = task
+        _stop_events[profile_id] = (event, loop)
+    return event
 
 
 def unregister_task(profile_id: int):
     """Remove a finished or cancelled task from registry."""
     with _lock:
         _active_tasks.pop(profile_id, None)
+        _stop_events.pop(profile_id, None)
+
+
+def get_stop_event(profile_id: int) -> Optional[asyncio.Event]:
+    """Stop token of the search running in this process, if any."""
+    with _lock:
+        entry = _stop_events.get(profile_id)
+    return entry[0] if entry else None
+
+
+def request_stop(profile_id: int) -> bool:
+    """Ask the search running in this process to stop gracefully.
+
+    Returns ``False`` when no search for the profile runs here — the caller's
+    DB flag then carries the request to whichever process owns it.
+    """
+    with _lock:
+        entry = _stop_events.get(profile_id)
+    if not entry:
+        # Reaches the owning process through the shared backend (if any)
+        get_status_backend().signal_stop(profile_id)
+        return False
+
+    _set_event(*entry)
+    return True
+
+
+def _running_searches() -> Dict[int, asyncio.Future]:
+    with _lock:
+        tasks = dict(_active_tasks)
+    current = asyncio.current_task()
+    return {
+        profile_id: task for profile_id, task in tasks.items()
+        if isinstance(task, asyncio.Future) and task is not current and not task.done()
+    }
+
+
+async def stop_active_searches(timeout: float) -> None:
+    """Stop every search running in this process and wait for it to end.
+
+    Searches are asked to stop gracefully first (including ones that start
+    meanwhile, e.g. scheduled runs that were waiting for a slot); those still
+    running after *timeout* seconds are cancelled.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while running := _running_searches():
+        left = deadline - loop.time()
+        if left <= 0:
+            break
+        logger.info(f"[Status] Waiting for {len(running)} running search(es) to stop")
+        for profile_id in running:
+            request_stop(profile_id)
+        await asyncio.wait(running.values(), timeout=left)
+
+    running = _running_searches()
+    for task in running.values():
+        task.cancel()
+    if running:
+        logger.warning(f"[Status] Cancelled {len(running)} search(es) that did not stop in {timeout}s")
+        await asyncio.gather(*running.values(), return_exceptions=True)
 
 
 def cancel_task(profile_id: int):
@@ -0,0 +1,361 @@
+"""
+Storage backends for live search status.
+
+- ``InMemoryStatusBackend``: process-local dicts.  Fast, but a status poll
+  served by another worker process sees nothing.
+- ``DatabaseStatusBackend``: one ``search_statuses`` row per profile, visible
+  to every process sharing the database (SQLite file or PostgreSQL).  Writes
+  are buffered and coalesced — many ``add_log`` / ``update`` calls become one
+  row update per flush interval — and reads merge the buffer in, so the
+  writing process always sees its own changes immediately.
+
+Select one with ``SEARCH_STATUS_BACKEND`` ("memory" or "db").
+"""
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from backend.db.base import SessionLocal
+from backend.models.search_status import SearchStatusRecord
+
+logger = logging.getLogger(__name__)
+
+# Log entries kept per profile
+LOG_LIMIT = 100
+
+# States after which no more writes are expected; flushed without delay
+TERMINAL_STATES = {"done", "error", "stopped"}
+
+
+class StatusBackend:
+    """Interface shared by the status backends."""
+
+    def init(self, profile_id: int, status: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def append_log(self, profile_id: int, entry: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def update(self, profile_id: int, fields: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def get(self, profile_id: int) -> Optional[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def get_all(self) -> Dict[int, Dict[str, Any]]:
+        raise NotImplementedError
+
+    def clear(self, profile_id: int) -> None:
+        raise NotImplementedError
+
+    def signal_stop(self, profile_id: int) -> None:
+        raise NotImplementedError
+
+    def stop_signalled(self, profile_id: int) -> bool:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Write buffered changes now (no-op for unbuffered backends)."""
+
+    def close(self) -> None:
+        """Flush and release background resources."""
+
+
+# ── in-memory ──────────────────────────────────────────────────────────────
+
+class InMemoryStatusBackend(StatusBackend):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses: Dict[int, Dict[str, Any]] = {}
+        self._stops: set = set()
+
+    def init(self, profile_id, status):
+        with self._lock:
+            self._statuses[profile_id] = {**status, "log": []}
+            self._stops.discard(profile_id)
+
+    def append_log(self, profile_id, entry):
+        with self._lock:
+            s = self._statuses.get(profile_id)
+            if s:
+                s["log"].append(entry)
+                if len(s["log"]) > LOG_LIMIT:
+                    s["log"] = s["log"][-LOG_LIMIT:]
+
+    def update(self, profile_id, fields):
+        with self._lock:
+            s = self._statuses.get(profile_id)
+            if s:
+                s.update(fields)
+
+    # Reads copy the status dict and the log list, not the entries: entries
+    # and field values are replaced, never mutated in place.
+
+    def get(self, profile_id):
+        with self._lock:
+            s = self._statuses.get(profile_id)
+            return {**s, "log": list(s["log"])} if s is not None else None
+
+    def get_all(self):
+        with self._lock:
+            return {pid: {**s, "log": list(s["log"])} for pid, s in self._statuses.items()}
+
+    def clear(self, profile_id):
+        with self._lock:
+            self._statuses.pop(profile_id, None)
+
+    def signal_stop(self, profile_id):
+        with self._lock:
+            self._stops.add(profile_id)
+
+    def stop_signalled(self, profile_id):
+        with self._lock:
+            return profile_id in self._stops
+
+
+# ── database ───────────────────────────────────────────────────────────────
+
+@dataclass
+class _Pending:
+    """Changes to one profile's row not yet written."""
+    reset: Optional[Dict[str, Any]] = None
+    updates: Dict[str, Any] = field(default_factory=dict)
+    logs: List[Dict[str, Any]] = field(default_factory=list)
+    delete: bool = False
+
+
+class DatabaseStatusBackend(StatusBackend):
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        flush_interval: float = 0.5,
+    ):
+        self.session_factory = session_factory
+        self.flush_interval = flush_interval
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: Dict[int, _Pending] = {}
+        # Batch being written by flush(), and how many flushes have finished
+        self._flushing: Dict[int, _Pending] = {}
+        self._flushes = 0
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ── writes (buffered) ──────────────────────────────────────────────────
+
+    def _buffer(self, profile_id: int) -> _Pending:
+        pending = self._pending.get(profile_id)
+        if pending is None:
+            pending = self._pending[profile_id] = _Pending()
+        return pending
+
+    def init(self, profile_id, status):
+        with self._lock:
+            self._pending[profile_id] = _Pending(reset=dict(status))
+        self._schedule(urgent=True)
+
+    def append_log(self, profile_id, entry):
+        with self._lock:
+            pending = self._buffer(profile_id)
+            pending.logs.append(entry)
+            del pending.logs[:-LOG_LIMIT]
+        self._schedule()
+
+    def update(self, profile_id, fields):
+        with self._lock:
+            self._buffer(profile_id).updates.update(fields)
+        self._schedule(urgent=fields.get("state") in TERMINAL_STATES)
+
+    def clear(self, profile_id):
+        with self._lock:
+            self._pending[profile_id] = _Pending(delete=True)
+        self._schedule(urgent=True)
+
+    def signal_stop(self, profile_id):
+        # Not buffered: the running search may live in another process.  Flush
+        # first so a just-initialised status row exists to carry the flag.
+        self.flush()
+        db = self.session_factory()
+        try:
+            db.query(SearchStatusRecord).filter(SearchStatusRecord.profile_id == profile_id).update(
+                {SearchStatusRecord.stop_requested: True}, synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[Status] Failed to record stop for profile {profile_id}: {e}")
+        finally:
+            db.close()
+
+    # ── reads ──────────────────────────────────────────────────────────────
+
+    # Reads query without any lock, then lay the batch being flushed and the
+    # buffer over the rows.  Applying a change the rows already hold is a
+    # no-op (log entries are matched on ``seq``), so a flush committing in the
+    # middle is harmless; a read that overlapped a finished flush may have
+    # missed its commit and is repeated.
+
+    def _read(self, query: Callable[[Session], Any], merge: Callable[[Any], Any]) -> Any:
+        while True:
+            with self._lock:
+                flushes = self._flushes
+            db = self.session_factory()
+            try:
+                stored = query(db)
+            finally:
+                db.close()
+            with self._lock:
+                if self._flushes == flushes:
+                    return merge(stored)
+
+    def _merge_buffers(self, profile_id: int, stored: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        status = self._merge(stored, self._flushing.get(profile_id))
+        return self._merge(status, self._pending.get(profile_id))
+
+    def get(self, profile_id):
+        def query(db):
+            row = db.query(SearchStatusRecord).filter(SearchStatusRecord.profile_id == profile_id).first()
+            return self._as_status(row) if row else None
+
+        return self._read(query, lambda stored: self._merge_buffers(profile_id, stored))
+
+    def get_all(self):
+        return self._read(
+            lambda db: {row.profile_id: self._as_status(row) for row in db.query(SearchStatusRecord).all()},
+            self._merge_all,
+        )
+
+    def _merge_all(self, stored: Dict[int, Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        merged = {}
+        for profile_id in stored.keys() | self._flushing.keys() | self._pending.keys():
+            status = self._merge_buffers(profile_id, stored.get(profile_id))
+            if status is not None:
+                merged[profile_id] = status
+        return merged
+
+    def stop_signalled(self, profile_id):
+        db = self.session_factory()
+        try:
+            row = (
+                db.query(SearchStatusRecord.stop_requested)
+                .filter(SearchStatusRecord.profile_id == profile_id)
+                .first()
+            )
+            return bool(row and row[0])
+        finally:
+            db.close()
+
+    @staticmethod
+    def _as_status(row: SearchStatusRecord) -> Dict[str, Any]:
+        return {**(row.status or {}), "log": list(row.log or [])}
+
+    @staticmethod
+    def _merge(stored: Optional[Dict[str, Any]], pending: Optional[_Pending]) -> Optional[Dict[str, Any]]:
+        if pending is None:
+            return stored
+        if pending.delete:
+            return None
+        base = {**pending.reset, "log": []} if pending.reset is not None else stored
+        if base is None:
+            return None
+        merged = {**base, **pending.updates}
+        last_seq = base["log"][-1].get("seq", 0) if base["log"] else 0
+        new_logs = [entry for entry in pending.logs if entry.get("seq") is None or entry["seq"] > last_seq]
+        merged["log"] = (list(base["log"]) + new_logs)[-LOG_LIMIT:]
+        return merged
+
+    # ── flushing ───────────────────────────────────────────────────────────
+
+    def _schedule(self, urgent: bool = False):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if not self._closed and (self._thread is None or not self._thread.is_alive()):
+                    self._thread = threading.Thread(target=self._run, name="status-flusher", daemon=True)
+                    self._thread.start()
+        if urgent:
+            self._wake.set()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+            if not batch:
+                return
+
+            db = self.session_factory()
+            try:
+                rows = {
+                    row.profile_id: row
+                    for row in db.query(SearchStatusRecord).filter(SearchStatusRecord.profile_id.in_(list(batch)))
+                }
+                for profile_id, pending in batch.items():
+                    self._apply(db, rows.get(profile_id), profile_id, pending)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"[Status] Flush of {len(batch)} status(es) failed: {e}")
+                self._requeue(batch)
+            finally:
+                db.close()
+                with self._lock:
+                    self._flushing = {}
+                    self._flushes += 1
+
+    @staticmethod
+    def _apply(db: Session, row: Optional[SearchStatusRecord], profile_id: int, pending: _Pending):
+        if pending.delete:
+            if row is not None:
+                db.delete(row)
+            return
+        if pending.reset is not None:
+            if row is None:
+                row = SearchStatusRecord(profile_id=profile_id)
+                db.add(row)
+            row.status = dict(pending.reset)
+            row.log = []
+            row.stop_requested = False
+        elif row is None:
+            return  # nothing to update: the search was never initialised
+        if pending.updates:
+            row.status = {**(row.status or {}), **pending.updates}
+        if pending.logs:
+            row.log = (list(row.log or []) + pending.logs)[-LOG_LIMIT:]
+
+    def _requeue(self, batch: Dict[int, _Pending]):
+        """Put a failed batch back in front of newer changes."""
+        with self._lock:
+            for profile_id, older in batch.items():
+                newer = self._pending.get(profile_id)
+                if newer is None:
+                    self._pending[profile_id] = older
+                elif newer.reset is None and not newer.delete and not older.delete:
+                    older.updates.update(newer.updates)
+                    older.logs = (older.logs + newer.logs)[-LOG_LIMIT:]
+                    self._pending[profile_id] = older
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+
+def build_status_backend(kind: str, flush_interval: float = 0.5) -> StatusBackend:
+    if kind == "db":
+        return DatabaseStatusBackend(flush_interval=flush_interval)
+    if kind != "memory":
+        logger.warning(f"[Status] Unknown status backend {kind!r}, using in-memory")
+    return InMemoryStatusBackend()
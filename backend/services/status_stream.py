@@ -0,0 +1,170 @@
+"""
+Server-sent event streams of search status.
+
+Instead of the whole status (and log) on every poll, a client receives one
+event per change carrying only the fields that changed plus the new log
+entries.  Every event id is ``"<started_at>#<last log seq>"``: a client that
+reconnects with ``Last-Event-ID`` gets the current fields once and only the
+log lines it missed.  A new run (different ``started_at``) is sent as a full
+snapshot with ``"reset": true``.
+
+Streams wake as soon as this process changes a status (see
+``search_status.wait_for_change``) and re-read it every ``poll_interval``
+otherwise, which picks up changes other processes write to the database
+backend.  ``all_status_events`` streams every status a user owns.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from backend.services.search_status import (
+    ALL_PROFILES, change_version, get_all_statuses, get_status, get_status_backend, wait_for_change,
+)
+from backend.services.status_backend import InMemoryStatusBackend
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def parse_event_id(event_id: Optional[str]) -> Tuple[Optional[str], int]:
+    """``(started_at, seq)`` of an event id; ``(None, 0)`` if absent or malformed."""
+    if not event_id:
+        return None, 0
+    run, _, seq = event_id.rpartition("#")
+    if not run or not seq.isdigit():
+        return None, 0
+    return run, int(seq)
+
+
+def format_event(event_id: str, payload: Dict[str, Any]) -> str:
+    return f"id: {event_id}\nevent: status\ndata: {json.dumps(payload, default=str)}\n\n"
+
+
+async def _read(read: Callable[[], Any]) -> Any:
+    # Shared backends query the database; keep that off the event loop
+    if isinstance(get_status_backend(), InMemoryStatusBackend):
+        return read()
+    return await asyncio.to_thread(read)
+
+
+class _StatusDiff:
+    """What one client has seen of a profile's status, and what it has not."""
+
+    def __init__(self, last_event_id: Optional[str] = None):
+        self.run, self.last_seq = parse_event_id(last_event_id)
+        self.sent: Dict[str, Any] = {}
+        self.first = True
+
+    @property
+    def event_id(self) -> str:
+        return f"{self.run}#{self.last_seq}"
+
+    def payload(self, status: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The delta of *status* since the last payload (``None`` if nothing new)."""
+        started_at = status.get("started_at")
+        reset = started_at != self.run
+        if reset:
+            # A run the client has not seen (or a first connection): everything
+            self.run, self.last_seq = started_at, 0
+        if reset or self.first:
+            self.sent = {}
+
+        fields = {k: v for k, v in status.items() if k != "log"}
+        changed = {k: v for k, v in fields.items() if self.sent.get(k, _MISSING) != v}
+        logs = [entry for entry in status.get("log", []) if entry.get("seq", 0) > self.last_seq]
+        if not (self.first or changed or logs):
+            return None
+
+        self.sent = fields
+        self.first = False
+        if logs:
+            self.last_seq = logs[-1].get("seq", self.last_seq)
+        return {"reset": reset, "status": changed, "log": logs}
+
+
+async def _stream(
+    key: Any,
+    next_events: Callable[[], Awaitable[List[str]]],
+    poll_interval: float,
+    heartbeat: float,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]],
+) -> AsyncIterator[str]:
+    last_write = time.monotonic()
+    while not (is_disconnected and await is_disconnected()):
+        # Taken before reading, so a change made meanwhile is not missed
+        version = change_version(key)
+        events = await next_events()
+        for event in events:
+            yield event
+        if events:
+            last_write = time.monotonic()
+        elif time.monotonic() - last_write >= heartbeat:
+            # Comment line: keeps proxies from closing an idle connection
+            yield ": keep-alive\n\n"
+            last_write = time.monotonic()
+
+        idle_left = max(0.0, heartbeat - (time.monotonic() - last_write))
+        await wait_for_change(key, version, timeout=min(poll_interval, idle_left))
+
+
+async def status_events(
+    profile_id: int,
+    last_event_id: Optional[str] = None,
+    poll_interval: float = 5.0,
+    heartbeat: float = 15.0,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[str]:
+    """Yield SSE messages for *profile_id* until the client goes away."""
+    diff = _StatusDiff(last_event_id)
+
+    async def next_events() -> List[str]:
+        payload = diff.payload(await _read(lambda: get_status(profile_id)))
+        return [format_event(diff.event_id, payload)] if payload is not None else []
+
+    async for event in _stream(profile_id, next_events, poll_interval, heartbeat, is_disconnected):
+        yield event
+
+
+async def all_status_events(
+    owns: Callable[[int], Awaitable[bool]],
+    poll_interval: float = 5.0,
+    heartbeat: float = 15.0,
+    is_disconnected: Optional[Callable[[], Awaitable[bool]]] = None,
+) -> AsyncIterator[str]:
+    """Yield SSE messages for every profile *owns* accepts.
+
+    Each event carries the deltas of the profiles that changed, keyed by
+    profile id, and ``removed`` for statuses that were cleared.  There is no
+    resume: a reconnecting client gets full snapshots again.
+    """
+    diffs: Dict[int, _StatusDiff] = {}
+    owned: Dict[int, bool] = {}
+    first = True
+
+    async def next_events() -> List[str]:
+        nonlocal first
+        statuses = await _read(get_all_statuses)
+        profiles = {}
+        for profile_id, status in statuses.items():
+            if profile_id not in owned:
+                owned[profile_id] = await owns(profile_id)
+            if not owned[profile_id]:
+                continue
+            payload = diffs.setdefault(profile_id, _StatusDiff()).payload(status)
+            if payload is not None:
+                profiles[profile_id] = payload
+        removed = [profile_id for profile_id in diffs if profile_id not in statuses]
+        for profile_id in removed:
+            del diffs[profile_id]
+        # The first event is sent even when empty: the client then knows it is current
+        if not (first or profiles or removed):
+            return []
+        first = False
+        payload = {"profiles": profiles, "removed": removed}
+        return [f"event: statuses\ndata: {json.dumps(payload, default=str)}\n\n"]
+
+    async for event in _stream(ALL_PROFILES, next_events, poll_interval, heartbeat, is_disconnected):
+        yield event
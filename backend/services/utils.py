@@ -52,3 +52,21 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
         * math.sin(d_lon / 2) ** 2
     )
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def bounding_box(lat: float, lon: float, distance_km: float) -> tuple:
+    """(min_lat, max_lat, min_lon, max_lon) enclosing every point within *distance_km*.
+
+    Cheap pre-filter for ``haversine_distance``: a point outside the box is
+    always farther than *distance_km*.
+    """
+    d_lat = distance_km / 111.32
+    cos_lat = math.cos(math.radians(lat))
+    # Near the poles the box spans every longitude
+    d_lon = 180.0 if cos_lat < 1e-6 else min(180.0, distance_km / (111.32 * cos_lat))
+    return (
+        max(-90.0, lat - d_lat),
+        min(90.0, lat + d_lat),
+        lon - d_lon,
+        lon + d_lon,
+    )
@@ -5,6 +5,27 @@ import { useAuth } from './AuthContext';
 
 const SearchContext = createContext(null);
 
+const RUNNING_STATES = ['generating', 'searching', 'analyzing'];
+const LOG_LIMIT = 100; // same as the backend keeps per status
+const POLL_INTERVAL_MS = 1500;
+const RECONNECT_DELAY_MS = 3000;
+
+// Applies one `statuses` stream event: per-profile deltas (or full snapshots
+// when `reset`) plus the ids of cleared statuses.
+export function applyStatusesEvent(prev, { profiles = {}, removed = [] }) {
+    const next = { ...prev };
+    for (const [id, { reset, status, log }] of Object.entries(profiles)) {
+        const current = reset ? undefined : next[id];
+        next[id] = current
+            ? { ...current, ...status, log: [...(current.log || []), ...log].slice(-LOG_LIMIT) }
+            : { ...status, log };
+    }
+    for (const id of removed) {
+        delete next[String(id)];
+    }
+    return next;
+}
+
 export function SearchProvider({ children }) {
     const { isLoggedIn } = useAuth();
     const [searchStatuses, setSearchStatuses] = useState({});
@@ -20,37 +41,84 @@ export function SearchProvider({ children }) {
 
         const pollStatuses = async () => {
             try {
-                const res = await SearchService.getAllStatuses();
-                setSearchStatuses(res);
-
-                // Auto-hydrate activeProfileIds with any that are actually running (useful on page reload)
-                const runningIds = Object.entries(res)
-                    .filter(([, status]) => status && ['generating', 'searching', 'analyzing'].includes(status.state))
-                    .map(([id]) => String(id));
-                
-                if (runningIds.length > 0) {
-                    setActiveProfileIds(prev => {
-                        const next = [...prev];
-                        let changed = false;
-                        for (const id of runningIds) {
-                            if (!next.includes(id)) {
-                                next.push(id);
-                                changed = true;
-                            }
-                        }
-                        return changed ? next : prev;
-                    });
-                }
+                setSearchStatuses(await SearchService.getAllStatuses());
             } catch (e) {
                 console.error("Failed to poll statuses:", e);
             }
         };
 
-        pollStatuses();
-        const interval = setInterval(pollStatuses, 1500);
-        return () => clearInterval(interval);
+        if (typeof window.EventSource === 'undefined') {
+            pollStatuses();
+            const interval = setInterval(pollStatuses, POLL_INTERVAL_MS);
+            return () => clearInterval(interval);
+        }
+
+        let source = null;
+        let retry = null;
+        let closed = false;
+
+        const reconnect = () => {
+            if (!closed) retry = setTimeout(connect, RECONNECT_DELAY_MS);
+        };
+
+        const connect = async () => {
+            try {
+                const { stream_token } = await SearchService.getStreamToken();
+                if (closed) return;
+                source = new EventSource(SearchService.allStatusesStreamUrl(stream_token));
+                // Every (re)connection starts with snapshots of all statuses
+                let first = true;
+                source.onopen = () => { first = true; };
+                source.addEventListener('statuses', (event) => {
+                    const data = JSON.parse(event.data);
+                    const replace = first;
+                    first = false;
+                    setSearchStatuses(prev => applyStatusesEvent(replace ? {} : prev, data));
+                });
+                source.onerror = () => {
+                    // EventSource retries dropped connections itself; it gives up when
+                    // the server refuses one (e.g. an expired token): start over.
+                    if (source.readyState === EventSource.CLOSED) {
+                        source.close();
+                        reconnect();
+                    }
+                };
+            } catch (e) {
+                console.error("Failed to open status stream:", e);
+                reconnect();
+            }
+        };
+
+        connect();
+        return () => {
+            closed = true;
+            clearTimeout(retry);
+            if (source) source.close();
+        };
     }, [isLoggedIn]);
 
+    // Auto-hydrate activeProfileIds with any that are actually running (useful on page reload)
+    useEffect(() => {
+        const runningIds = Object.entries(searchStatuses)
+            .filter(([, status]) => status && RUNNING_STATES.includes(status.state))
+            .map(([id]) => String(id));
+
+        if (runningIds.length > 0) {
+            // eslint-disable-next-line react-hooks/set-state-in-effect
+            setActiveProfileIds(prev => {
+                const next = [...prev];
+                let changed = false;
+                for (const id of runningIds) {
+                    if (!next.includes(id)) {
+                        next.push(id);
+                        changed = true;
+                    }
+                }
+                return changed ? next : prev;
+            });
+        }
+    }, [searchStatuses]);
+
     const addProfileId = (pid) => {
         setActiveProfileIds(prev => {
             const pidStr = String(pid);
@@ -0,0 +1,27 @@
+import { describe, it, expect } from 'vitest';
+import { applyStatusesEvent } from './SearchContext';
+
+describe('applyStatusesEvent', () => {
+  it('merges deltas and appends new log lines', () => {
+    const prev = { 1: { state: 'searching', jobs_found: 1, log: [{ seq: 1, message: 'a' }] } };
+    const next = applyStatusesEvent(prev, {
+      profiles: { 1: { reset: false, status: { jobs_found: 4 }, log: [{ seq: 2, message: 'b' }] } },
+      removed: [],
+    });
+    expect(next[1].state).toBe('searching');
+    expect(next[1].jobs_found).toBe(4);
+    expect(next[1].log.map(e => e.message)).toEqual(['a', 'b']);
+  });
+
+  it('replaces a status on reset and drops removed ones', () => {
+    const prev = {
+      1: { state: 'completed', jobs_found: 9, log: [{ seq: 5, message: 'old' }] },
+      2: { state: 'completed', log: [] },
+    };
+    const next = applyStatusesEvent(prev, {
+      profiles: { 1: { reset: true, status: { state: 'generating' }, log: [] } },
+      removed: [2],
+    });
+    expect(next).toEqual({ 1: { state: 'generating', log: [] } });
+  });
+});
@@ -92,7 +92,7 @@ export function ProgressPage() {
           <SearchProgress
             profileId={pid}
             status={searchStatuses[pid]}
-            setStatus={() => {}} // Now handled strictly by context polling
+            setStatus={() => {}} // Now handled strictly by the context's status stream
             onStateChange={handleSearchStateChange}
             onClear={() => handleClearSearch(pid)}
           />
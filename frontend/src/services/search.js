@@ -13,6 +13,16 @@ export const SearchService = {
         return ApiClient.get("/search/status/all");
     },
 
+    // EventSource cannot send an Authorization header: streams take a
+    // short-lived stream token in the URL instead.
+    getStreamToken() {
+        return ApiClient.post("/search/status/stream-token");
+    },
+
+    allStatusesStreamUrl(streamToken) {
+        return `${API_BASE}/search/status/all/stream?stream_token=${encodeURIComponent(streamToken)}`;
+    },
+
     getProfiles() {
         return ApiClient.get("/profiles/");
     },
@@ -1,5 +1,6 @@
 import os
 os.environ["TESTING"] = "1"
+os.environ.setdefault("LLM_CACHE_ENABLED", "0")
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -7,7 +8,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from backend.main import app
-from backend.db.base import Base, get_db
+from backend.db.base import Base, get_db, get_session_factory
 from backend.models import User
 from backend.services.auth import get_password_hash
 
@@ -28,6 +29,7 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
 
 @pytest.fixture(scope="function")
 def setup_database():
@@ -25,3 +25,51 @@ def test_profiles_crud_flow(client: TestClient, auth_headers: dict):
     response = client.delete(f"/api/v1/profiles/{profile_id}", headers=auth_headers)
     assert response.status_code == 400
     assert "not allowed" in response.json()["detail"].lower()
+
+
+def test_search_plan_inspect_edit_pin_and_clear(client: TestClient, auth_headers: dict, db_session):
+    response = client.post("/api/v1/profiles/", json={"name": "Plan", "role_description": "DevOps"}, headers=auth_headers)
+    profile_id = response.json()["id"]
+    plan_url = f"/api/v1/profiles/{profile_id}/plan"
+
+    # Nothing generated yet
+    response = client.get(plan_url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["queries"] == [] and response.json()["up_to_date"] is False
+
+    # Pinning needs a plan
+    assert client.put(plan_url, json={"pinned": True}, headers=auth_headers).status_code == 400
+
+    # Edited queries match the profile as it is now
+    queries = [{"query": "DevOps Engineer", "domain": "it", "language": "en"}]
+    response = client.put(plan_url, json={"queries": queries}, headers=auth_headers)
+    assert response.status_code == 200
+    plan = response.json()
+    assert plan["queries"] == queries and plan["up_to_date"] is True and plan["fingerprint"]
+
+    # Changing the profile makes the plan stale unless pinned
+    from backend.models import SearchProfile
+    db_session.query(SearchProfile).filter(SearchProfile.id == profile_id).update({"role_description": "SRE"})
+    db_session.commit()
+    assert client.get(plan_url, headers=auth_headers).json()["up_to_date"] is False
+
+    response = client.put(plan_url, json={"pinned": True}, headers=auth_headers)
+    assert response.json()["pinned"] is True and response.json()["up_to_date"] is True
+
+    # Clearing drops the plan and the pin
+    response = client.delete(plan_url, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["queries"] == [] and response.json()["pinned"] is False
+
+
+def test_search_plan_of_another_users_profile_is_forbidden(client: TestClient, auth_headers: dict, db_session):
+    from backend.models import SearchProfile, User
+    other = User(username="someone_else", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    profile = SearchProfile(user_id=other.id, name="Theirs")
+    db_session.add(profile)
+    db_session.commit()
+
+    assert client.get(f"/api/v1/profiles/{profile.id}/plan", headers=auth_headers).status_code == 403
+    assert client.get("/api/v1/profiles/99999/plan", headers=auth_headers).status_code == 404
@@ -57,6 +57,30 @@ def test_search_unauthorized_access(client, auth_headers, db_session):
     response = client.post("/api/v1/search/start", json=payload, headers=auth_headers)
     assert response.status_code == 403
 
+    # 4. Try to stream its status
+    response = client.get(f"/api/v1/search/status/{other_profile.id}/stream", headers=auth_headers)
+    assert response.status_code == 403
+
+def test_stream_token_authenticates_status_streams(client: TestClient, auth_headers: dict, test_profile):
+    response = client.post("/api/v1/search/status/stream-token", headers=auth_headers)
+    assert response.status_code == 200
+    token = response.json()["stream_token"]
+
+    # EventSource cannot send headers, so the token travels in the URL
+    other_profile_url = "/api/v1/search/status/999999/stream"
+    assert client.get(f"{other_profile_url}?stream_token={token}").status_code == 403
+    assert client.get(f"{other_profile_url}?stream_token=garbage").status_code == 401
+    assert client.get(other_profile_url).status_code == 401
+
+    # An access token is not a stream token
+    access_token = auth_headers["Authorization"].split(" ", 1)[1]
+    assert client.get(f"{other_profile_url}?stream_token={access_token}").status_code == 401
+
+
+def test_stream_token_requires_login(client: TestClient):
+    assert client.post("/api/v1/search/status/stream-token").status_code == 401
+
+
 def test_get_search_status(client: TestClient, auth_headers: dict, test_profile):
     profile_id = test_profile["id"]
     response = client.get(f"/api/v1/search/status/{profile_id}", headers=auth_headers)
@@ -0,0 +1,101 @@
+import pytest
+from unittest.mock import patch
+from backend.models import Job, ScrapedJob
+from backend.providers.jobs.models import (
+    JobListing, JobDescription, CompanyInfo, JobLocation, EmploymentDetails, PublicationInfo,
+)
+from backend.services.search.batch_writer import JobBatchWriter
+
+
+def _listing(job_id: str, source: str = "test", title: str = "Developer"):
+    return JobListing(
+        id=job_id,
+        source=source,
+        title=title,
+        descriptions=[JobDescription(language_code="en", title=title, description="<p>Build things</p>")],
+        company=CompanyInfo(name="Acme"),
+        location=JobLocation(city="Zurich"),
+        employment=EmploymentDetails(workload_min=80, workload_max=100),
+        external_url=f"https://jobs.example/{job_id}",
+        publication=PublicationInfo(start_date="2026-01-01", end_date="2026-02-01"),
+        raw_data={"id": job_id},
+    )
+
+
+@pytest.fixture
+def profile_dict(test_user):
+    return {"id": None, "user_id": test_user.id, "latitude": None, "longitude": None}
+
+
+def test_flush_writes_batch_in_one_transaction(db_session, profile_dict):
+    writer = JobBatchWriter(db_session)
+    for i in range(3):
+        writer.add(_listing(str(i)), {"affinity_score": 70 + i, "worth_applying": True}, profile_dict)
+
+    with patch.object(db_session, "commit", wraps=db_session.commit) as commit:
+        result = writer.flush()
+
+    assert result.saved == 3
+    assert result.failed == []
+    assert commit.call_count == 1
+    assert len(writer) == 0
+    assert db_session.query(ScrapedJob).count() == 3
+    jobs = db_session.query(Job).order_by(Job.affinity_score).all()
+    assert [j.affinity_score for j in jobs] == [70, 71, 72]
+    assert jobs[0].scraped_job.description == "Build things"
+
+
+def test_existing_scraped_jobs_are_reused(db_session, profile_dict):
+    writer = JobBatchWriter(db_session)
+    writer.add(_listing("1"), {"affinity_score": 50}, profile_dict)
+    writer.flush()
+
+    # Same listing again (another profile) plus a duplicate inside one batch
+    writer.add(_listing("1"), {"affinity_score": 60}, profile_dict)
+    writer.add(_listing("2"), {"affinity_score": 60}, profile_dict)
+    writer.add(_listing("2"), {"affinity_score": 65}, profile_dict)
+    result = writer.flush()
+
+    assert result.saved == 3
+    assert db_session.query(ScrapedJob).count() == 2
+    assert db_session.query(Job).count() == 4
+
+
+def test_failed_batch_is_retried_row_by_row(db_session, profile_dict):
+    writer = JobBatchWriter(db_session)
+    good, bad = _listing("1"), _listing("2")
+    bad.source = None  # violates NOT NULL on scraped_jobs.platform
+
+    writer.add(good, {"affinity_score": 80}, profile_dict)
+    writer.add(bad, {"affinity_score": 80}, profile_dict)
+    result = writer.flush()
+
+    assert result.saved == 1
+    assert [listing for listing, _ in result.failed] == [bad]
+    assert db_session.query(Job).count() == 1
+
+
+def test_unbuildable_rows_only_fail_themselves(db_session, profile_dict):
+    writer = JobBatchWriter(db_session)
+    writer.add(_listing("1"), {"affinity_score": 80}, profile_dict)
+    writer.add(_listing("2"), {"affinity_score": 80}, {"id": None})  # no user_id
+    result = writer.flush()
+
+    assert result.saved == 1
+    assert len(result.failed) == 1
+
+
+def test_flush_stores_summary_from_the_shared_normalizer(db_session, profile_dict):
+    from backend.services.search.job_normalizer import NormalizedJobCache
+
+    normalizer = NormalizedJobCache()
+    listing = _listing("1")
+    summary = normalizer.normalize(listing).summary
+
+    writer = JobBatchWriter(db_session, normalizer)
+    writer.add(listing, {"affinity_score": 80}, profile_dict)
+    assert writer.flush().saved == 1
+
+    assert normalizer.hits == 1  # the row was not normalized again
+    stored = db_session.query(ScrapedJob).one().summary
+    assert stored == summary and stored["description"] == "Build things"
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from backend.services.search.governor import ConcurrencyBudgets, SearchGovernor
+
+
+async def _peak(budgets: ConcurrencyBudgets, name: str, n: int) -> int:
+    in_flight, peak = 0, 0
+
+    async def work():
+        nonlocal in_flight, peak
+        async with budgets.slot(name):
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(work() for _ in range(n)))
+    return peak
+
+
+@pytest.mark.asyncio
+async def test_budgets_cap_per_name_with_overrides():
+    budgets = ConcurrencyBudgets({"slow": 1}, default_limit=3)
+    assert await _peak(budgets, "slow", 5) == 1
+    assert await _peak(budgets, "other", 5) == 3
+
+
+@pytest.mark.asyncio
+async def test_zero_limit_is_unlimited():
+    budgets = ConcurrencyBudgets(default_limit=0)
+    assert budgets.semaphore("x") is None
+    assert await _peak(budgets, "x", 5) == 5
+
+
+def test_budgets_rebind_to_a_new_event_loop():
+    budgets = ConcurrencyBudgets(default_limit=2)
+    assert asyncio.run(_peak(budgets, "p", 4)) == 2
+    # A second loop gets fresh semaphores instead of ones bound to the first
+    assert asyncio.run(_peak(budgets, "p", 4)) == 2
+
+
+@pytest.mark.asyncio
+async def test_run_slots_are_granted_in_arrival_order():
+    governor = SearchGovernor(max_concurrent_searches=1)
+    order = []
+
+    async def run(profile_id):
+        async with governor.run_slot(profile_id):
+            order.append(profile_id)
+            await asyncio.sleep(0.01)
+
+    first = asyncio.create_task(run(1))
+    await asyncio.sleep(0)
+    waiting = [asyncio.create_task(run(i)) for i in (2, 3)]
+    await asyncio.sleep(0)
+    assert governor.running == 1
+    assert governor.queued == 2
+
+    await asyncio.gather(first, *waiting)
+    assert order == [1, 2, 3]
+    assert governor.running == governor.queued == 0
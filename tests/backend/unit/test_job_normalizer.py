@@ -0,0 +1,116 @@
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+from backend.providers.jobs.models import (
+    JobListing, JobDescription, CompanyInfo, JobLocation, EmploymentDetails, LanguageSkill, PublicationInfo,
+)
+from backend.services.search.job_normalizer import NormalizedJobCache, normalize_listing
+from backend.services.search.search_executor import analyze_listing
+
+
+def _listing(job_id: str = "1", **overrides):
+    fields = dict(
+        id=job_id,
+        source="job_room",
+        title="<b>Backend</b> Engineer",
+        descriptions=[JobDescription(language_code="en", title="t", description="<p>Build&nbsp;APIs</p>")],
+        company=CompanyInfo(name="Acme"),
+        location=JobLocation(city="Zurich"),
+        employment=EmploymentDetails(workload_min=80, workload_max=100),
+        language_skills=[LanguageSkill(language_code="de", spoken_level="proficient")],
+        publication=PublicationInfo(start_date="2026-09-01T08:00:00Z", end_date="2026-10-01"),
+    )
+    fields.update(overrides)
+    return JobListing(**fields)
+
+
+def test_normalize_listing_builds_row_and_compact_summary():
+    job = normalize_listing(_listing())
+
+    assert job.key == ("job_room", "1")
+    assert job.row["title"] == "Backend Engineer"
+    assert job.row["description"] == "Build APIs"
+    assert job.row["workload"] == "80-100%"
+    assert job.row["publication_date"] == datetime.fromisoformat("2026-09-01T08:00:00+00:00")
+    assert job.row["external_url"] == "https://www.job-room.ch/job-search/1"
+    assert job.row["summary"] is job.summary
+    assert job.summary == {
+        "title": "Backend Engineer",
+        "company": "Acme",
+        "location": "Zurich",
+        "workload": "80-100%",
+        "published": "2026-09-01",
+        "languages": ["de (proficient)"],
+        "description": "Build APIs",
+    }
+
+
+def test_normalize_listing_drops_empty_fields_and_keeps_stored_summary():
+    bare = normalize_listing(_listing(descriptions=[], employment=None, language_skills=[], publication=None, location=None))
+    assert set(bare.summary) == {"title", "company"}
+
+    stored = {"title": "Stored", "description": "From the database"}
+    assert normalize_listing(_listing(summary=stored)).summary == stored
+
+
+def test_cache_normalizes_each_job_once_and_evicts_oldest():
+    cache = NormalizedJobCache(max_entries=2)
+    first = cache.normalize(_listing("1"))
+
+    assert cache.normalize(_listing("1")) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.normalize(_listing("2"))
+    cache.normalize(_listing("3"))
+    assert len(cache) == 2
+    assert cache.normalize(_listing("1")) is not first  # evicted, normalized again
+
+
+def test_cache_renormalizes_a_listing_whose_content_changed():
+    cache = NormalizedJobCache()
+    first = cache.normalize(_listing("1"))
+
+    updated = cache.normalize(_listing("1", title="Senior Backend Engineer"))
+    assert updated is not first
+    assert updated.summary["title"] == "Senior Backend Engineer"
+    assert cache.normalize(_listing("1", title="Senior Backend Engineer")) is updated
+    assert len(cache) == 1
+
+
+def test_cache_is_safe_to_share_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = NormalizedJobCache(max_entries=8)
+    listings = [_listing(str(i % 20)) for i in range(400)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        jobs = list(pool.map(cache.normalize, listings))
+
+    assert [job.key for job in jobs] == [("job_room", listing.id) for listing in listings]
+    assert len(cache) <= 8
+    assert cache.hits + cache.misses == 400
+
+
+@pytest.mark.asyncio
+async def test_match_prompt_uses_the_cached_summary():
+    cache = NormalizedJobCache()
+    listing = _listing()
+    with patch("backend.services.search.search_executor.llm_service") as llm:
+        llm.aanalyze_job_match = AsyncMock(return_value={"affinity_score": 70})
+        await analyze_listing(listing, {"role_description": "Dev"}, cache)
+        await analyze_listing(listing, {"role_description": "Ops"}, cache)
+
+    summaries = [call.args[0] for call in llm.aanalyze_job_match.await_args_list]
+    assert summaries[0] is summaries[1] is cache.normalize(listing).summary
+    assert cache.misses == 1
+
+
+def test_cache_trims_the_summary_description_to_the_budget():
+    long_description = "<p>" + "We build reliable APIs. " * 300 + "</p>"
+    listing = _listing(descriptions=[JobDescription(language_code="en", title="t", description=long_description)])
+
+    job = NormalizedJobCache(description_token_budget=200).normalize(listing)
+
+    assert len(job.summary["description"]) < 200 * 4
+    assert job.row["summary"] is job.summary
+    # The stored column keeps the full text
+    assert len(job.row["description"]) > 5000
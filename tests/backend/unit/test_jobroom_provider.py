@@ -0,0 +1,199 @@
+import pytest
+import asyncio
+import httpx
+from unittest.mock import AsyncMock
+from backend.providers.jobs.exceptions import ProviderError
+from backend.providers.jobs.jobroom.client import JobRoomProvider
+from backend.providers.jobs.models import JobListing, JobSearchRequest, JobSearchResponse
+from backend.providers.jobs.session import ScraperSession
+
+
+def _page(request: JobSearchRequest, total: int) -> JobSearchResponse:
+    start = request.page * request.page_size
+    items = [
+        JobListing(id=str(i), title=f"Job {i}", source="job_room")
+        for i in range(start, min(start + request.page_size, total))
+    ]
+    return JobSearchResponse(
+        items=items, total_count=total, page=request.page, page_size=request.page_size,
+        total_pages=(total + request.page_size - 1) // request.page_size,
+        source="job_room", search_time_ms=0, request=request,
+    )
+
+
+def _provider(total: int, **kwargs) -> JobRoomProvider:
+    provider = JobRoomProvider(**kwargs)
+    provider.search = AsyncMock(side_effect=lambda request: _page(request, total))
+    return provider
+
+
+async def _collect(provider, request):
+    return [page async for page in provider.iter_search(request)]
+
+
+@pytest.mark.asyncio
+async def test_without_harvest_only_first_page_is_returned():
+    provider = _provider(1000)
+    pages = await _collect(provider, JobSearchRequest(query="dev", page_size=50))
+
+    assert len(pages) == 1
+    assert len(pages[0]) == 50
+    provider.search.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_harvest_fetches_remaining_pages_up_to_cap():
+    provider = _provider(1000, harvest=True, harvest_max_results=350)
+    pages = await _collect(provider, JobSearchRequest(query="dev", page_size=50))
+
+    ids = [job.id for page in pages for job in page]
+    assert len(ids) == 350
+    assert len(set(ids)) == 350
+    # Page size is raised to the API maximum: 4 pages of 100 for a cap of 350
+    assert provider.search.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_harvest_stops_at_total_count():
+    provider = _provider(130, harvest=True, harvest_max_results=1000)
+    pages = await _collect(provider, JobSearchRequest(query="dev"))
+
+    assert sum(len(p) for p in pages) == 130
+    assert provider.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_harvest_bounds_concurrency_and_skips_failed_pages():
+    in_flight = {"now": 0, "peak": 0}
+
+    async def search(request):
+        if request.page == 0:
+            return _page(request, 600)
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            await asyncio.sleep(0.01)
+            if request.page == 2:
+                raise ProviderError("job_room", "boom")
+            return _page(request, 600)
+        finally:
+            in_flight["now"] -= 1
+
+    provider = JobRoomProvider(harvest=True, harvest_max_results=600, harvest_concurrency=2)
+    provider.search = AsyncMock(side_effect=search)
+    pages = await _collect(provider, JobSearchRequest(query="dev"))
+
+    assert in_flight["peak"] == 2
+    assert sum(len(p) for p in pages) == 500
+
+
+
+@pytest.mark.asyncio
+async def test_harvest_yields_pages_in_page_order():
+    async def search(request):
+        # Later pages answer first
+        await asyncio.sleep(0.01 * (5 - request.page))
+        return _page(request, 500)
+
+    provider = JobRoomProvider(harvest=True, harvest_max_results=500, harvest_concurrency=4)
+    provider.search = AsyncMock(side_effect=search)
+    pages = await _collect(provider, JobSearchRequest(query="dev"))
+
+    assert [page[0].id for page in pages] == ["0", "100", "200", "300", "400"]
+
+# ─── shared session / CSRF token ───
+
+class CsrfServer:
+    """Home page sets an XSRF cookie; the API rejects requests with an old token."""
+
+    def __init__(self):
+        self.homepage_hits = 0
+        self.valid_token = "t1"
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "GET":
+            self.homepage_hits += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, headers={"Set-Cookie": f"XSRF-TOKEN={self.valid_token}; Path=/"})
+        if request.headers.get("X-XSRF-TOKEN") != self.valid_token:
+            return httpx.Response(403)
+        return httpx.Response(200, json={"ok": True})
+
+
+def _session(server: CsrfServer) -> ScraperSession:
+    session = ScraperSession(base_url="https://www.job-room.ch")
+    session.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(server.handler), base_url="https://www.job-room.ch"
+    )
+    return session
+
+
+async def _post_many(session: ScraperSession, n: int):
+    return await asyncio.gather(*[
+        session.with_retry_csrf("POST", "https://www.job-room.ch/api", "https://www.job-room.ch/", json={})
+        for _ in range(n)
+    ])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_share_one_csrf_bootstrap():
+    server = CsrfServer()
+    session = _session(server)
+
+    responses = await _post_many(session, 5)
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert server.homepage_hits == 1
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_is_refreshed_once_for_all_waiters():
+    server = CsrfServer()
+    session = _session(server)
+    await _post_many(session, 1)
+
+    server.valid_token = "t2"
+    responses = await _post_many(session, 5)
+
+    assert [r.status_code for r in responses] == [200] * 5
+    assert server.homepage_hits == 2
+    assert session.csrf_token == "t2"
+    await session.close()
+
+
+def test_online_since_narrows_to_days_since_last_run():
+    from datetime import datetime, timedelta, timezone
+    from backend.providers.jobs.jobroom.request_builder import online_since_days
+
+    now = datetime.now(timezone.utc)
+    assert online_since_days(JobSearchRequest(posted_within_days=30)) == 30
+    assert online_since_days(JobSearchRequest(posted_within_days=30, posted_since=now - timedelta(hours=5))) == 1
+    assert online_since_days(JobSearchRequest(posted_within_days=30, posted_since=now - timedelta(days=2, hours=1))) == 3
+    # Never wider than the profile's own window
+    assert online_since_days(JobSearchRequest(posted_within_days=30, posted_since=now - timedelta(days=90))) == 30
+
+
+@pytest.mark.asyncio
+async def test_harvest_pages_count_against_executor_provider_limit():
+    from backend.services.search.query_executor import ProviderCall, QueryExecutor
+
+    in_flight = {"now": 0, "peak": 0}
+
+    async def search(request):
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            await asyncio.sleep(0.01)
+            return _page(request, 600)
+        finally:
+            in_flight["now"] -= 1
+
+    provider = JobRoomProvider(harvest=True, harvest_max_results=600, harvest_concurrency=4)
+    provider.search = AsyncMock(side_effect=search)
+    executor = QueryExecutor({"job_room": provider}, limits={"job_room": 2})
+    calls = [ProviderCall(q, "it", "job_room", JobSearchRequest(query=q)) for q in ("a", "b", "c")]
+    results = [r async for r in executor.run(calls)]
+
+    assert in_flight["peak"] == 2
+    assert sum(len(r.items) for r in results) == 1800
@@ -0,0 +1,25 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.main import app, lifespan
+
+
+@pytest.mark.asyncio
+async def test_providers_outlive_the_scheduler_and_running_searches():
+    calls = MagicMock()
+    with patch("backend.providers.jobs.registry.open_provider_registry", calls.open_providers), \
+         patch("backend.providers.jobs.registry.close_provider_registry", AsyncMock(side_effect=calls.close_providers)), \
+         patch("backend.services.scheduler.start_scheduler", calls.start_scheduler), \
+         patch("backend.services.scheduler.pause_scheduler", calls.pause_scheduler), \
+         patch("backend.services.scheduler.stop_scheduler", calls.stop_scheduler), \
+         patch("backend.services.search_status.stop_active_searches", AsyncMock(side_effect=calls.stop_searches)), \
+         patch("backend.services.search_status.close_status_backend"), \
+         patch("backend.providers.llm.factory.close_providers", AsyncMock()):
+        async with lifespan(app):
+            assert [c[0] for c in calls.mock_calls] == ["open_providers", "start_scheduler"]
+
+    assert [c[0] for c in calls.mock_calls] == [
+        "open_providers", "start_scheduler",
+        "pause_scheduler", "stop_searches", "stop_scheduler", "close_providers",
+    ]
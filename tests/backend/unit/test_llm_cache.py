@@ -0,0 +1,188 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, AsyncMock, patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.db.base import Base
+from backend.models import LLMCacheEntry
+from backend.services.llm_cache import LLMResponseCache
+from backend.services.llm_service import LLMService
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def cache(session_factory):
+    return LLMResponseCache(session_factory=session_factory, ttl_hours=1, max_entries=100)
+
+
+def test_key_depends_on_every_component():
+    base = LLMResponseCache.make_key("match", "groq/m", "sys", "user")
+    assert base == LLMResponseCache.make_key("match", "groq/m", "sys", "user")
+    assert base != LLMResponseCache.make_key("relevance", "groq/m", "sys", "user")
+    assert base != LLMResponseCache.make_key("match", "openai/m", "sys", "user")
+    assert base != LLMResponseCache.make_key("match", "groq/m", "sys2", "user")
+    assert base != LLMResponseCache.make_key("match", "groq/m", "sys", "user2")
+
+
+def test_set_then_get_counts_hits_and_misses(cache):
+    key = cache.make_key("match", "m", "s", "u")
+    assert cache.get(key) is None
+
+    cache.set(key, "match", "m", {"affinity_score": 80})
+    assert cache.get(key) == {"affinity_score": 80}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_expired_entries_are_misses_and_evicted(cache, session_factory):
+    key = cache.make_key("match", "m", "s", "u")
+    cache.set(key, "match", "m", {"ok": True})
+
+    db = session_factory()
+    db.query(LLMCacheEntry).update({"expires_at": datetime.now(timezone.utc) - timedelta(minutes=1)})
+    db.commit()
+    db.close()
+
+    assert cache.get(key) is None
+    assert cache.evict() == 1
+
+
+def test_eviction_drops_least_recently_used(session_factory):
+    cache = LLMResponseCache(session_factory=session_factory, max_entries=2)
+    keys = [cache.make_key("match", "m", "s", str(i)) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.set(key, "match", "m", {"i": i})
+    cache.get(keys[0])  # refresh the first entry
+    cache.set(keys[2], "match", "m", {"i": 2})
+    cache.evict()
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == {"i": 0}
+    assert cache.get(keys[2]) == {"i": 2}
+
+
+def test_store_failures_are_not_fatal():
+    cache = LLMResponseCache(session_factory=MagicMock(side_effect=None))
+    cache.session_factory.return_value.query.side_effect = RuntimeError("db down")
+
+    cache.set("k", "match", "m", {})
+    assert cache.get("k") is None
+    assert cache.stats()["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_service_answers_repeated_prompts_from_cache(cache):
+    provider = MagicMock(model_id="groq/test-model")
+    provider.agenerate_json = AsyncMock(return_value={"relevant": False, "reason": "Different field"})
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=provider):
+        service = LLMService(cache=cache)
+        first = await service.acheck_title_relevance("Chef", "Developer")
+        second = await service.acheck_title_relevance("Chef", "Developer")
+
+    assert first == second == {"relevant": False, "reason": "Different field"}
+    assert provider.agenerate_json.await_count == 1
+    assert service.cache_stats()["hits"] == 1
+
+
+def test_service_skips_cache_for_uncached_steps_and_errors(cache):
+    provider = MagicMock(model_id="groq/test-model")
+    provider.generate_json.side_effect = [
+        {"searches": [{"domain": "it", "query": "Dev"}]},
+        {"searches": [{"domain": "it", "query": "Dev"}]},
+        Exception("timeout"),
+        {"relevant": True, "reason": "ok"},
+    ]
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=provider):
+        service = LLMService(cache=cache, cached_steps={"relevance"})
+        service.generate_search_plan({}, [])
+        service.generate_search_plan({}, [])
+        service.check_title_relevance("Dev", "Dev")
+        result = service.check_title_relevance("Dev", "Dev")
+
+    assert result == {"relevant": True, "reason": "ok"}
+    assert provider.generate_json.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_calls_use_the_cache_off_the_event_loop(cache):
+    import threading
+    loop_thread = threading.current_thread()
+    threads = []
+
+    class RecordingCache(LLMResponseCache):
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return super().get(key)
+
+        def set(self, *args):
+            threads.append(threading.current_thread())
+            super().set(*args)
+
+    provider = MagicMock(model_id="groq/test-model")
+    provider.agenerate_json = AsyncMock(return_value={"relevant": True})
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=provider):
+        service = LLMService(cache=RecordingCache(session_factory=cache.session_factory))
+        await service.acheck_title_relevance("Dev", "Developer")
+
+    assert len(threads) == 2
+    assert all(t is not loop_thread for t in threads)
+
+
+@pytest.mark.asyncio
+async def test_batch_relevance_is_cached_per_title(cache):
+    prompts = []
+
+    async def answer(system_prompt, user_prompt):
+        prompts.append(user_prompt)
+        count = sum(1 for line in user_prompt.splitlines() if line[:1].isdigit())
+        return {"results": [{"index": i, "relevant": True, "reason": "r"} for i in range(count)]}
+
+    provider = MagicMock(model_id="groq/test-model", max_tokens=16384)
+    provider.agenerate_json = AsyncMock(side_effect=answer)
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=provider):
+        service = LLMService(cache=cache)
+        await service.acheck_titles_relevance(["Dev", "Ops"], "Developer")
+        # A different batch composition still finds the verdicts of known titles
+        results = await service.acheck_titles_relevance(["Ops", "QA"], "Developer")
+        # ...and so does the single-title check
+        single = await service.acheck_title_relevance("Dev", "Developer")
+
+    assert [r["relevant"] for r in results] == [True, True]
+    assert single == {"relevant": True, "reason": "r"}
+    assert len(prompts) == 2
+    assert '"QA"' in prompts[1] and '"Ops"' not in prompts[1]
+
+
+@pytest.mark.asyncio
+async def test_unparseable_relevance_answers_are_not_cached(cache):
+    provider = MagicMock(model_id="groq/test-model", max_tokens=16384)
+    provider.agenerate_json = AsyncMock(side_effect=[
+        {"results": "garbled"},
+        {"relevant": "maybe"},
+        {"results": [{"index": 0, "relevant": False, "reason": "no"}]},
+    ])
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=provider):
+        service = LLMService(cache=cache)
+        await service.acheck_titles_relevance(["Chef"], "Developer")
+        second = await service.acheck_titles_relevance(["Chef"], "Developer")
+
+    assert second == [{"relevant": False, "reason": "no"}]
+    assert provider.agenerate_json.await_count == 3
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from backend.providers.llm.base import LLMProvider
 from backend.providers.llm.openai_compatible import OpenAICompatibleProvider
 from backend.providers.llm.ollama import OllamaProvider
@@ -87,6 +87,44 @@ def test_openai_compatible_generate_json():
         assert result == {"hello": "world"}
 
 
+@pytest.mark.asyncio
+async def test_openai_compatible_agenerate_json_uses_async_client():
+    provider = OpenAICompatibleProvider(
+        api_key="dummy_key",
+        base_url="https://api.example.com",
+        model="llama3-8b",
+        provider_name="groq",
+    )
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content='```json\n{"hello": "async"}\n```'))]
+
+    with patch.object(provider.async_client.chat.completions, "create", AsyncMock(return_value=mock_response)) as mock_create, \
+         patch.object(provider.client.chat.completions, "create") as mock_sync_create:
+        result = await provider.agenerate_json("System", "User")
+
+    assert result == {"hello": "async"}
+    mock_create.assert_awaited_once()
+    assert mock_create.call_args.kwargs["response_format"] == {"type": "json_object"}
+    mock_sync_create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_base_provider_async_fallback():
+    class SyncOnlyProvider(LLMProvider):
+        model_id = "sync/only"
+
+        def generate_text(self, system_prompt, user_prompt, max_tokens=None):
+            return f"{system_prompt}:{user_prompt}"
+
+        def generate_json(self, system_prompt, user_prompt, max_tokens=None):
+            return {"max_tokens": max_tokens}
+
+    provider = SyncOnlyProvider()
+    assert await provider.agenerate_text("a", "b") == "a:b"
+    assert await provider.agenerate_json("a", "b", 42) == {"max_tokens": 42}
+
+
 def test_ollama_provider_initialization():
     provider = OllamaProvider(
         api_key="ollama",
@@ -100,6 +138,33 @@ def test_ollama_provider_initialization():
 
 # ─── Factory Tests ────────────────────────────────────────────────────────────
 
+@pytest.fixture(autouse=True)
+def clear_provider_cache():
+    from backend.providers.llm.factory import invalidate_provider_cache
+    invalidate_provider_cache()
+    yield
+    invalidate_provider_cache()
+
+
+def _set_pool_settings(mock_settings):
+    mock_settings.LLM_HTTP_MAX_CONNECTIONS = 100
+    mock_settings.LLM_HTTP_MAX_KEEPALIVE = 20
+    mock_settings.LLM_HTTP_KEEPALIVE_EXPIRY = 30.0
+
+
+def _set_global_settings(mock_settings, model="llama3-70b"):
+    mock_settings.LLM_PROVIDER = "groq"
+    mock_settings.LLM_API_KEY = "key123"
+    mock_settings.LLM_BASE_URL = "https://api.groq.com/openai/v1"
+    mock_settings.LLM_MODEL = model
+    mock_settings.LLM_TEMPERATURE = 0.7
+    mock_settings.LLM_TOP_P = 0.95
+    mock_settings.LLM_MAX_TOKENS = 8192
+    mock_settings.LLM_THINKING = False
+    mock_settings.LLM_THINKING_LEVEL = "OFF"
+    _set_pool_settings(mock_settings)
+
+
 def test_factory_default_returns_global_provider():
     from backend.providers.llm.factory import get_llm_provider, get_provider_for_step
 
@@ -113,6 +178,7 @@ def test_factory_default_returns_global_provider():
         mock_settings.LLM_MAX_TOKENS = 8192
         mock_settings.LLM_THINKING = False
         mock_settings.LLM_THINKING_LEVEL = "OFF"
+        _set_pool_settings(mock_settings)
 
         # Per-step vars all empty → should fallback to global
         mock_settings.LLM_PLAN_PROVIDER = ""
@@ -150,6 +216,7 @@ def test_factory_per_step_overrides():
         mock_settings.LLM_MAX_TOKENS = 8192
         mock_settings.LLM_THINKING = False
         mock_settings.LLM_THINKING_LEVEL = "OFF"
+        _set_pool_settings(mock_settings)
 
         # RELEVANCE step: override to a small model with lower temp
         mock_settings.LLM_RELEVANCE_PROVIDER = "groq"
@@ -182,6 +249,7 @@ def test_factory_gemini_provider():
         mock_settings.LLM_MAX_TOKENS = 4096
         mock_settings.LLM_THINKING = False
         mock_settings.LLM_THINKING_LEVEL = "OFF"
+        _set_pool_settings(mock_settings)
 
         mock_settings.LLM_MATCH_PROVIDER = ""
         mock_settings.LLM_MATCH_MODEL = ""
@@ -201,3 +269,89 @@ def test_factory_gemini_provider():
                     provider = get_provider_for_step("match")
                 except Exception:
                     pass  # Gemini SDK not installed, but resolution was correct
+
+
+def test_factory_reuses_provider_for_same_config():
+    from backend.providers.llm.factory import get_provider_for_step
+
+    with patch("backend.providers.llm.factory.settings") as mock_settings:
+        _set_global_settings(mock_settings)
+
+        first = get_provider_for_step("default")
+        second = get_provider_for_step("default")
+
+        assert first is second
+        assert first.client is second.client
+
+
+def test_factory_builds_new_provider_when_settings_change():
+    from backend.providers.llm.factory import get_provider_for_step
+
+    with patch("backend.providers.llm.factory.settings") as mock_settings:
+        _set_global_settings(mock_settings, model="model-a")
+        first = get_provider_for_step("default")
+
+        mock_settings.LLM_MODEL = "model-b"
+        second = get_provider_for_step("default")
+
+        assert first is not second
+        assert second.model == "model-b"
+
+
+@pytest.mark.asyncio
+async def test_factory_closes_the_provider_a_settings_change_replaced():
+    import asyncio
+    from backend.providers.llm.factory import get_provider_for_step
+
+    with patch("backend.providers.llm.factory.settings") as mock_settings:
+        _set_global_settings(mock_settings, model="model-a")
+        first = get_provider_for_step("default")
+        # An unknown step name resolves to the global settings as well
+        assert get_provider_for_step("other") is first
+
+        with patch.object(first, "aclose", AsyncMock()) as mock_close:
+            # Another step still resolves to the old config: keep it open
+            mock_settings.LLM_MODEL = "model-b"
+            second = get_provider_for_step("default")
+            await asyncio.sleep(0)
+            mock_close.assert_not_awaited()
+
+            assert get_provider_for_step("other") is second
+            await asyncio.sleep(0)
+            mock_close.assert_awaited_once()
+
+
+def test_factory_gives_each_event_loop_its_own_provider():
+    import asyncio
+    from backend.providers.llm import factory
+
+    async def resolve():
+        return factory.get_provider_for_step("default")
+
+    with patch("backend.providers.llm.factory.settings") as mock_settings:
+        _set_global_settings(mock_settings)
+        first = asyncio.run(resolve())
+        second = asyncio.run(resolve())
+
+        assert first is not second
+        # Sync callers (no loop) share another one; closed loops' are dropped
+        assert factory.get_provider_for_step("default") not in (first, second)
+        assert first not in factory._provider_cache.values()
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_close_providers():
+    from backend.providers.llm.factory import get_provider_for_step, invalidate_provider_cache, close_providers
+
+    with patch("backend.providers.llm.factory.settings") as mock_settings:
+        _set_global_settings(mock_settings)
+        first = get_provider_for_step("default")
+
+        assert invalidate_provider_cache() == [first]
+        second = get_provider_for_step("default")
+        assert second is not first
+
+        with patch.object(second, "aclose", AsyncMock()) as mock_close:
+            await close_providers()
+        mock_close.assert_awaited_once()
+        assert invalidate_provider_cache() == []
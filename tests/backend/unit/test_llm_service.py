@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, patch, AsyncMock
 from backend.services.llm_service import LLMService
 
 
@@ -104,3 +104,144 @@ def test_generate_search_plan_respects_max_queries(mock_provider):
         service = LLMService()
         plan = service.generate_search_plan({}, [], max_queries=3)
         assert len(plan) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_variants_use_native_provider_calls(mock_provider):
+    mock_provider.model_id = "groq/test-model"
+    mock_provider.agenerate_json = AsyncMock(side_effect=[
+        {"searches": [{"domain": "it", "query": f"Job {i}"} for i in range(5)]},
+        {"relevant": False, "reason": "Different field"},
+        {"affinity_score": 70, "affinity_analysis": "Good", "worth_applying": True},
+    ])
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider):
+        service = LLMService()
+        plan = await service.agenerate_search_plan({}, [], max_queries=2)
+        relevance = await service.acheck_title_relevance("Chef", "Dev")
+        match = await service.aanalyze_job_match({"title": "Dev"}, {"role_description": "Dev"})
+
+    assert len(plan) == 2
+    assert relevance["relevant"] is False
+    assert match["affinity_score"] == 70
+    assert mock_provider.agenerate_json.await_count == 3
+    mock_provider.generate_json.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_relevance_error_defaults_to_relevant(mock_provider):
+    mock_provider.agenerate_json = AsyncMock(side_effect=Exception("timeout"))
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider):
+        res = await LLMService().acheck_title_relevance("Dev", "Dev")
+
+    assert res["relevant"] is True
+
+
+@pytest.mark.asyncio
+async def test_batch_relevance_classifies_many_titles_per_call(mock_provider):
+    mock_provider.max_tokens = 16384
+
+    async def answer(system_prompt, user_prompt):
+        count = user_prompt.count('\n') - 3
+        return {"results": [{"index": i, "relevant": i % 2 == 0, "reason": "r"} for i in range(count)]}
+
+    mock_provider.agenerate_json = AsyncMock(side_effect=answer)
+    titles = [f"Title {i}" for i in range(30)]
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider), \
+         patch("backend.services.llm_service.settings") as mock_settings:
+        mock_settings.LLM_RELEVANCE_BATCH_SIZE = 20
+        mock_settings.LLM_RELEVANCE_TOKENS_PER_TITLE = 60
+        results = await LLMService().acheck_titles_relevance(titles, "Developer")
+
+    assert len(results) == 30
+    assert mock_provider.agenerate_json.await_count == 2
+    assert [r["relevant"] for r in results[:4]] == [True, False, True, False]
+    assert results[20]["relevant"] is True
+
+
+@pytest.mark.asyncio
+async def test_batch_relevance_chunks_by_max_tokens(mock_provider):
+    mock_provider.max_tokens = 120
+    mock_provider.agenerate_json = AsyncMock(return_value={
+        "results": [{"index": 0, "relevant": True}, {"index": 1, "relevant": True}]
+    })
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider), \
+         patch("backend.services.llm_service.settings") as mock_settings:
+        mock_settings.LLM_RELEVANCE_BATCH_SIZE = 25
+        mock_settings.LLM_RELEVANCE_TOKENS_PER_TITLE = 60
+        results = await LLMService().acheck_titles_relevance(["A", "B", "C", "D", "E"], "Dev")
+
+    assert len(results) == 5
+    assert mock_provider.agenerate_json.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_relevance_falls_back_per_item_on_malformed_answer(mock_provider):
+    mock_provider.max_tokens = 16384
+    mock_provider.agenerate_json = AsyncMock(side_effect=[
+        {"results": [{"index": 0, "relevant": False, "reason": "no"}, {"index": 1, "relevant": "maybe"}]},
+        {"relevant": True, "reason": "single"},
+        {"relevant": False, "reason": "single"},
+    ])
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider):
+        results = await LLMService().acheck_titles_relevance(["Chef", "Dev", "Baker"], "Developer")
+
+    assert results[0] == {"relevant": False, "reason": "no"}
+    assert results[1]["reason"] == "single"
+    assert results[2]["reason"] == "single"
+    assert mock_provider.agenerate_json.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_async_calls_share_the_per_model_budget(mock_provider):
+    import asyncio
+    from backend.services.search.governor import ConcurrencyBudgets
+    in_flight, peak = 0, 0
+
+    async def answer(system_prompt, user_prompt):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"relevant": True, "reason": "r"}
+
+    mock_provider.model_id = "groq/model"
+    mock_provider.agenerate_json = AsyncMock(side_effect=answer)
+    service = LLMService(budgets=ConcurrencyBudgets(default_limit=2))
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider):
+        await asyncio.gather(*(service.acheck_title_relevance(f"T{i}", "Dev") for i in range(6)))
+
+    assert mock_provider.agenerate_json.await_count == 6
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cv_digest_uses_its_own_step_and_returns_none_on_error(mock_provider):
+    mock_provider.model_id = "groq/test-model"
+    mock_provider.agenerate_json = AsyncMock(return_value={"headline": "Senior Python developer"})
+
+    with patch("backend.services.llm_service.get_provider_for_step", return_value=mock_provider) as get_step:
+        service = LLMService()
+        digest = await service.agenerate_cv_digest("A long CV", 600)
+        get_step.assert_called_with("digest")
+        assert digest == {"headline": "Senior Python developer"}
+        assert "about 600 tokens" in mock_provider.agenerate_json.await_args.args[1]
+
+        mock_provider.agenerate_json = AsyncMock(side_effect=Exception("LLM Error"))
+        assert await service.agenerate_cv_digest("A long CV", 600) is None
+
+
+def test_match_prompt_prefers_the_cv_digest():
+    profile = {"role_description": "Dev", "cv_content": "FULL CV TEXT", "cv_digest": {"skills": ["Python"]}}
+    _, prompt = LLMService._job_match_prompts({"title": "Engineer"}, profile)
+    assert '{"skills": ["Python"]}' in prompt
+    assert "FULL CV TEXT" not in prompt
+
+    _, prompt = LLMService._job_match_prompts({"title": "Engineer"}, {"cv_content": "FULL CV TEXT"})
+    assert "FULL CV TEXT" in prompt
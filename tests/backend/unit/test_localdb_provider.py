@@ -1,7 +1,8 @@
 import pytest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 from backend.providers.jobs.localdb.client import LocalDbProvider
-from backend.providers.jobs.models import JobSearchRequest, JobLocation
+from backend.providers.jobs.models import JobSearchRequest, JobLocation, RadiusSearchRequest, Coordinates
 from backend.models import ScrapedJob
 
 @pytest.fixture
@@ -24,7 +25,6 @@ async def test_search_builds_query_correctly(local_db_provider, mock_db_session)
     mock_db_session.query.return_value = mock_query
     mock_query.filter.return_value = mock_query
     mock_query.limit.return_value = mock_query
-    mock_query.count.return_value = 1
     
     # Mock data exactly one row
     mock_scraped_job = ScrapedJob(
@@ -36,7 +36,7 @@ async def test_search_builds_query_correctly(local_db_provider, mock_db_session)
         external_url="http://example.com/123",
         workload="80-100%"
     )
-    mock_query.all.return_value = [mock_scraped_job]
+    mock_query.all.return_value = [(mock_scraped_job, 1)]
 
     req = JobSearchRequest(
         query="Software Engineer",
@@ -85,3 +85,186 @@ def test_db_job_to_listing_parsing(local_db_provider):
     assert listing3.employment is None
     assert listing3.company.name == "Cmp"
 
+
+
+def _add_jobs(db_session, *specs):
+    for i, (title, company, description) in enumerate(specs):
+        db_session.add(ScrapedJob(
+            platform="job_room", platform_job_id=str(i), title=title, company=company,
+            description=description, location="Zurich", external_url=f"http://example.com/{i}",
+        ))
+    db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search_ranks_title_matches_first(db_session):
+    _add_jobs(
+        db_session,
+        ("Office Manager", "Acme", "We use Python for reporting."),
+        ("Python Developer", "Globex", "Backend services."),
+        ("Chef", "Initech", "Kitchen work."),
+    )
+
+    result = await LocalDbProvider(db=db_session).search(JobSearchRequest(query="python", page_size=10))
+
+    assert [job.title for job in result.items] == ["Python Developer", "Office Manager"]
+    assert result.total_count == 2
+
+
+@pytest.mark.asyncio
+async def test_fulltext_search_matches_prefixes_and_counts_beyond_page(db_session):
+    _add_jobs(db_session, *[(f"Softwareentwickler {i}", "Acme", None) for i in range(5)])
+
+    provider = LocalDbProvider(db=db_session)
+    result = await provider.search(JobSearchRequest(query="software", page_size=2))
+
+    assert len(result.items) == 2
+    assert result.total_count == 5
+    assert result.total_pages == 3
+    assert (await provider.search(JobSearchRequest(query="nothing", page_size=2))).total_count == 0
+
+
+@pytest.mark.asyncio
+async def test_fulltext_index_follows_updates_and_deletes(db_session):
+    _add_jobs(db_session, ("Java Developer", "Acme", None))
+    job = db_session.query(ScrapedJob).one()
+    provider = LocalDbProvider(db=db_session)
+
+    job.title = "Kotlin Developer"
+    db_session.commit()
+    assert (await provider.search(JobSearchRequest(query="java"))).total_count == 0
+    assert (await provider.search(JobSearchRequest(query="kotlin"))).total_count == 1
+
+    db_session.delete(job)
+    db_session.commit()
+    assert (await provider.search(JobSearchRequest(query="kotlin"))).total_count == 0
+
+
+@pytest.mark.asyncio
+async def test_query_without_words_falls_back_to_ilike(db_session):
+    _add_jobs(db_session, ("C++ Developer", "Acme", None), ("C Developer", "Globex", None))
+
+    result = await LocalDbProvider(db=db_session).search(JobSearchRequest(query="++"))
+
+    assert [job.title for job in result.items] == ["C++ Developer"]
+
+
+def _add_located(db_session, *specs):
+    for i, (title, city, lat, lon) in enumerate(specs):
+        db_session.add(ScrapedJob(
+            platform="job_room", platform_job_id=f"geo-{i}", title=title, company="Acme",
+            location=city, latitude=lat, longitude=lon, external_url=f"http://example.com/geo-{i}",
+        ))
+    db_session.commit()
+
+
+def _near_zurich(km: int, **kwargs):
+    return JobSearchRequest(
+        radius_search=RadiusSearchRequest(geo_point=Coordinates(lat=47.3769, lon=8.5417), distance=km),
+        page_size=10,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_radius_search_returns_nearest_jobs_first(db_session):
+    _add_located(
+        db_session,
+        ("Developer Bern", "Bern", 46.9480, 7.4474),        # ~95 km
+        ("Developer Winterthur", "Winterthur", 47.4988, 8.7237),  # ~19 km
+        ("Developer Geneva", "Geneva", 46.2044, 6.1432),    # ~225 km
+        ("Developer Zurich", "Zurich", 47.3769, 8.5417),    # 0 km
+        ("Developer Nowhere", "Unknown", None, None),
+    )
+    provider = LocalDbProvider(db=db_session)
+
+    result = await provider.search(_near_zurich(100))
+
+    assert [job.title for job in result.items] == ["Developer Zurich", "Developer Winterthur", "Developer Bern"]
+    assert result.total_count == 3
+    assert result.items[1].location.coordinates.lat == pytest.approx(47.4988)
+
+
+@pytest.mark.asyncio
+async def test_radius_search_combines_with_keywords_and_pages(db_session):
+    _add_located(
+        db_session,
+        ("Python Developer", "Zurich", 47.38, 8.54),
+        ("Python Engineer", "Baden", 47.47, 8.31),
+        ("Chef", "Zurich", 47.37, 8.54),
+    )
+
+    result = await LocalDbProvider(db=db_session).search(
+        JobSearchRequest(
+            query="python", location="Somewhere else", page_size=1,
+            radius_search=RadiusSearchRequest(geo_point=Coordinates(lat=47.3769, lon=8.5417), distance=40),
+        )
+    )
+
+    assert [job.title for job in result.items] == ["Python Developer"]
+    assert result.total_count == 2
+
+
+@pytest.mark.asyncio
+async def test_posted_since_keeps_only_newer_listings(db_session):
+    now = datetime.now(timezone.utc)
+    db_session.add_all([
+        ScrapedJob(platform="job_room", platform_job_id="old", title="Python Dev old", company="A",
+                   external_url="http://example.com/old", publication_date=now - timedelta(days=10)),
+        ScrapedJob(platform="job_room", platform_job_id="new", title="Python Dev new", company="A",
+                   external_url="http://example.com/new", publication_date=now - timedelta(hours=2)),
+    ])
+    db_session.commit()
+
+    result = await LocalDbProvider(db=db_session).search(
+        JobSearchRequest(query="python", page_size=10, posted_since=now - timedelta(days=1))
+    )
+
+    assert [job.title for job in result.items] == ["Python Dev new"]
+
+
+def test_db_job_to_listing_carries_stored_summary(local_db_provider):
+    summary = {"title": "A", "description": "Clean text"}
+    job = ScrapedJob(platform="x", platform_job_id="1", title="A", external_url="a", summary=summary)
+    assert local_db_provider._db_job_to_listing(job).summary == summary
+
+    bare = ScrapedJob(platform="x", platform_job_id="2", title="B", external_url="b")
+    assert local_db_provider._db_job_to_listing(bare).summary is None
+
+
+@pytest.mark.asyncio
+async def test_words_inside_compounds_are_matched_alongside_the_index(db_session):
+    _add_jobs(
+        db_session,
+        ("Softwareentwickler Java", "Acme", None),
+        ("Entwickler (m/w/d)", "Globex", None),
+        ("Java Architekt", "Initech", None),
+    )
+    provider = LocalDbProvider(db=db_session)
+
+    # The index match ranks first; the compound is still found by substring
+    result = await provider.search(JobSearchRequest(query="entwickler", page_size=10))
+    assert [job.title for job in result.items] == ["Entwickler (m/w/d)", "Softwareentwickler Java"]
+    assert result.total_count == 2
+
+    result = await provider.search(JobSearchRequest(query="java entwickler", page_size=10))
+    assert [job.title for job in result.items] == ["Softwareentwickler Java"]
+
+
+@pytest.mark.asyncio
+async def test_radius_search_finds_rows_once_their_coordinates_are_backfilled(db_session):
+    from backend.repositories.job_repository import JobRepository
+
+    _add_located(db_session, ("Legacy Job", "Zurich", None, None))
+    provider = LocalDbProvider(db=db_session)
+    assert (await provider.search(_near_zurich(10))).total_count == 0
+
+    # A provider returns the listing again, now with coordinates
+    JobRepository(db_session).bulk_upsert_scraped_jobs([{
+        "platform": "job_room", "platform_job_id": "geo-0", "title": "Legacy Job", "company": "Acme",
+        "external_url": "http://example.com/geo-0", "latitude": 47.38, "longitude": 8.54,
+    }])
+    db_session.commit()
+
+    result = await provider.search(_near_zurich(10))
+    assert [job.title for job in result.items] == ["Legacy Job"]
@@ -0,0 +1,244 @@
+import pytest
+import asyncio
+from unittest.mock import MagicMock, patch, AsyncMock
+from backend.services.search.pipeline import SearchPipeline, Deduplicator
+from backend.services.search.title_prefilter import TitlePrefilter
+from backend.services.search.batch_writer import FlushResult
+from backend.services.search.query_executor import ProviderCall, ProviderResult
+from backend.providers.jobs.models import JobSearchRequest
+
+
+def _listing(job_id: str, title: str = "Dev"):
+    return MagicMock(id=job_id, source="test", external_url=f"url-{job_id}", title=title)
+
+
+def _result(items, error=None):
+    call = ProviderCall(query="q", domain="it", provider_name="p", request=JobSearchRequest(query="q"))
+    return ProviderResult(call=call, items=items, error=error)
+
+
+async def _stream(results, delay: float = 0):
+    for r in results:
+        if delay:
+            await asyncio.sleep(delay)
+        yield r
+
+
+@pytest.fixture(autouse=True)
+def silence_status():
+    with patch("backend.services.search.pipeline.update_status"), \
+         patch("backend.services.search.pipeline.add_log"):
+        yield
+
+
+def _all_relevant():
+    return AsyncMock(side_effect=lambda listings, profile: [True] * len(listings))
+
+
+class FakeWriter:
+    """Records flushed batches instead of touching the database."""
+
+    def __init__(self, on_flush=None):
+        self.pending = []
+        self.batches = []
+        self.on_flush = on_flush
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, listing, analysis, profile_dict):
+        self.pending.append(listing)
+
+    def flush(self):
+        batch, self.pending = self.pending, []
+        self.batches.append(batch)
+        if self.on_flush:
+            self.on_flush(batch)
+        return FlushResult(saved=len(batch))
+
+    @property
+    def saved(self):
+        return [listing for batch in self.batches for listing in batch]
+
+
+def _pipeline(**kwargs):
+    kwargs.setdefault("writer", FakeWriter())
+    return SearchPipeline(1, {"id": 1, "user_id": 1}, MagicMock(), Deduplicator([]), **kwargs)
+
+
+def test_deduplicator_skips_known_and_repeated_listings():
+    existing = [MagicMock(platform="test", platform_job_id="1", external_url="url-1")]
+    dedup = Deduplicator(existing)
+
+    assert dedup.is_new(_listing("1")) is False
+    assert dedup.is_new(_listing("2")) is True
+    assert dedup.is_new(_listing("2")) is False
+
+
+def test_deduplicator_is_known_only_reports_stored_listings():
+    dedup = Deduplicator([MagicMock(platform="test", platform_job_id="1", external_url="url-1")])
+
+    assert dedup.is_known(_listing("1")) is True
+    assert dedup.is_known(_listing("2")) is False
+    # Checking does not mark the listing as seen
+    assert dedup.is_new(_listing("2")) is True
+
+
+@pytest.mark.asyncio
+async def test_pipeline_counts_and_saves():
+    results = [
+        _result([_listing("1"), _listing("2", "Chef")]),
+        _result([_listing("1"), _listing("3")]),
+        _result([], error=RuntimeError("down")),
+    ]
+
+    async def relevance(listings, profile):
+        return [listing.title != "Chef" for listing in listings]
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", side_effect=relevance), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={"affinity_score": 70})):
+        writer = FakeWriter()
+        stats = await _pipeline(writer=writer).run(_stream(results))
+
+    assert stats.provider_calls == 3
+    assert stats.jobs_found == 4
+    assert stats.jobs_duplicates == 1
+    assert stats.jobs_irrelevant == 1
+    assert stats.jobs_saved == 2
+    assert len(writer.saved) == 2
+
+
+@pytest.mark.asyncio
+async def test_first_job_is_saved_before_fetch_finishes():
+    saved_at = []
+    fetch_done = asyncio.Event()
+
+    async def results():
+        yield _result([_listing("1")])
+        await asyncio.sleep(0.1)
+        fetch_done.set()
+        yield _result([_listing("2")])
+
+    def on_flush(batch):
+        saved_at.extend(fetch_done.is_set() for _ in batch)
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        await _pipeline(writer=FakeWriter(on_flush), persist_flush_interval=0.01).run(results())
+
+    assert saved_at == [False, True]
+
+
+@pytest.mark.asyncio
+async def test_failures_do_not_stall_the_pipeline():
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(side_effect=RuntimeError("llm"))):
+        writer = FakeWriter()
+        stats = await asyncio.wait_for(
+            _pipeline(queue_size=1, analysis_concurrency=1, writer=writer).run(
+                _stream([_result([_listing(str(i)) for i in range(5)])])
+            ),
+            timeout=2,
+        )
+
+    assert stats.jobs_failed == 5
+    assert writer.saved == []
+
+
+@pytest.mark.asyncio
+async def test_stop_skips_remaining_analysis():
+    pipeline = _pipeline(should_stop=lambda: True)
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()) as mock_rel, \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        stats = await pipeline.run(_stream([_result([_listing("1"), _listing("2")])]))
+
+    assert pipeline.stopped is True
+    assert stats.jobs_saved == 0
+    mock_rel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_relevance_is_checked_in_batches():
+    batches = []
+
+    async def relevance(listings, profile):
+        batches.append(len(listings))
+        return [True] * len(listings)
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", side_effect=relevance), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        stats = await _pipeline(analysis_concurrency=1, relevance_batch_size=4).run(
+            _stream([_result([_listing(str(i)) for i in range(10)])])
+        )
+
+    assert stats.jobs_saved == 10
+    assert sum(batches) == 10
+    assert max(batches) <= 4
+    assert len(batches) < 10
+
+
+@pytest.mark.asyncio
+async def test_prefilter_decides_obvious_titles_without_llm():
+    prefilter = TitlePrefilter("Software Engineer", ["Softwareentwickler"], reject_below=0.35)
+    listings = [_listing("1", "Koch/Köchin"), _listing("2", "Software Engineer"), _listing("3", "Data Engineer")]
+    rel = _all_relevant()
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", rel), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        stats = await _pipeline(prefilter=prefilter).run(_stream([_result(listings)]))
+
+    assert stats.llm_calls_saved == 2
+    assert stats.jobs_irrelevant == 1
+    assert stats.jobs_saved == 2
+    assert [l.title for call in rel.await_args_list for l in call.args[0]] == ["Data Engineer"]
+
+
+@pytest.mark.asyncio
+async def test_persist_flushes_in_batches():
+    writer = FakeWriter()
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        stats = await _pipeline(writer=writer, persist_batch_size=4).run(
+            _stream([_result([_listing(str(i)) for i in range(10)])])
+        )
+
+    assert stats.jobs_saved == 10
+    assert max(len(b) for b in writer.batches) <= 4
+    assert len(writer.batches) < 10
+
+
+@pytest.mark.asyncio
+async def test_partial_flush_failures_are_counted():
+    class HalfFailingWriter(FakeWriter):
+        def flush(self):
+            batch, self.pending = self.pending, []
+            return FlushResult(saved=1, failed=[(listing, RuntimeError("db")) for listing in batch[1:]])
+
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={})):
+        stats = await _pipeline(writer=HalfFailingWriter(), persist_batch_size=3, persist_flush_interval=1).run(
+            _stream([_result([_listing(str(i)) for i in range(3)])])
+        )
+
+    assert stats.jobs_saved == 1
+    assert stats.jobs_failed == 2
+
+
+@pytest.mark.asyncio
+async def test_stop_mid_run_drops_queued_matches_but_saves_finished_ones():
+    stop = asyncio.Event()
+
+    async def analyze(listing, profile, normalizer=None):
+        stop.set()  # the user stops while the first match is running
+        return {}
+
+    writer = FakeWriter()
+    pipeline = _pipeline(writer=writer, analysis_concurrency=1, should_stop=stop.is_set)
+    with patch("backend.services.search.pipeline.check_listings_relevance", _all_relevant()), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(side_effect=analyze)) as mock_match:
+        await pipeline.run(_stream([_result([_listing(str(i)) for i in range(10)])]))
+
+    assert pipeline.stopped is True
+    assert mock_match.await_count == 1
+    assert [listing.id for listing in writer.saved] == ["0"]
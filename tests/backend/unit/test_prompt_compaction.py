@@ -0,0 +1,39 @@
+from backend.services.search.prompt_compaction import (
+    compact_job_summary, cv_digest_key, estimate_tokens, trim_to_tokens,
+)
+
+
+def test_estimate_tokens_rounds_up():
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcd") == 1
+    assert estimate_tokens("abcde") == 2
+
+
+def test_trim_to_tokens_keeps_short_text_and_cuts_long_text_at_a_sentence():
+    assert trim_to_tokens("Short text.", 100) == "Short text."
+    assert trim_to_tokens("x" * 1000, 0) == "x" * 1000
+
+    text = "We build APIs. " * 40
+    trimmed = trim_to_tokens(text, 50)
+    assert estimate_tokens(trimmed) <= 50
+    assert trimmed.endswith("APIs. …")
+    # Trimming is stable, so a stored summary is not cut again
+    assert trim_to_tokens(trimmed, 50) == trimmed
+
+
+def test_compact_job_summary_fits_the_budget_and_keeps_other_fields():
+    summary = {"title": "Engineer", "company": "Acme", "description": "word " * 2000}
+    compact = compact_job_summary(summary, 300)
+
+    assert compact["title"] == "Engineer" and compact["company"] == "Acme"
+    assert estimate_tokens(compact["description"]) < 300
+    assert compact_job_summary(summary, 0) is summary
+    short = {"title": "Engineer", "description": "Small"}
+    assert compact_job_summary(short, 300) is short
+
+
+def test_cv_digest_key_changes_with_content_and_budget():
+    key = cv_digest_key("CV", 600)
+    assert key == cv_digest_key("CV", 600)
+    assert key != cv_digest_key("CV v2", 600)
+    assert key != cv_digest_key("CV", 400)
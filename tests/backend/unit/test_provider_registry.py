@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from backend.providers.jobs.registry import (
+    ProviderRegistry, close_provider_registry, get_provider_registry, open_provider_registry,
+)
+
+
+def _factory():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"job_room": MagicMock(close=AsyncMock()), "swissdevjobs": MagicMock(close=AsyncMock())}
+
+    return build, calls
+
+
+@pytest.mark.asyncio
+async def test_providers_are_built_once_and_closed_on_shutdown():
+    build, calls = _factory()
+    registry = ProviderRegistry(build)
+
+    first = registry.providers
+    assert registry.providers is first
+    assert len(calls) == 1
+
+    await registry.aclose()
+    for provider in first.values():
+        provider.close.assert_awaited_once()
+    with pytest.raises(RuntimeError):
+        registry.providers
+
+
+@pytest.mark.asyncio
+async def test_registry_is_only_visible_on_its_own_loop():
+    build, _ = _factory()
+    registry = open_provider_registry(build)
+    try:
+        assert get_provider_registry() is registry
+
+        # e.g. a script running searches with asyncio.run in another thread
+        other_loop = await asyncio.to_thread(lambda: asyncio.run(_lookup()))
+        assert other_loop is None
+    finally:
+        await close_provider_registry()
+
+    assert get_provider_registry() is None
+    assert registry.closed
+
+
+async def _lookup():
+    return get_provider_registry()
+
+
+@pytest.mark.asyncio
+async def test_run_search_uses_shared_providers_without_closing_them():
+    from backend.services.search_service import SearchService
+
+    shared = MagicMock(close=AsyncMock())
+    shared.get_provider_info.return_value = MagicMock(accepted_domains=["*"])
+    registry = open_provider_registry(lambda: {"job_room": shared})
+    profile_repo = MagicMock()
+    profile_repo.get.return_value = MagicMock(
+        id=1, user_id=1, max_queries=1, is_stopped=False, latitude=None, longitude=None,
+        role_description="Dev", cv_content="", search_strategy="", search_plan=None,
+    )
+    try:
+        service = SearchService(MagicMock(), profile_repo, session_factory=MagicMock())
+        with patch("backend.services.search_service.llm_service") as llm, \
+             patch("backend.services.search_service.init_status"), \
+             patch("backend.services.search_service.add_log"), \
+             patch("backend.services.search_service.update_status"), \
+             patch("backend.services.search_service.ProfileRepository", return_value=profile_repo), \
+             patch("backend.services.search_service.JobRoomProvider") as per_run_cls:
+            llm.agenerate_search_plan = AsyncMock(return_value=[])
+            await service.run_search(1)
+
+        infos = llm.agenerate_search_plan.await_args.args[1]
+        assert len(infos) == 2  # shared job_room + per-run local_db
+        per_run_cls.assert_not_called()
+        shared.close.assert_not_called()
+    finally:
+        await close_provider_registry()
+    shared.close.assert_awaited_once()
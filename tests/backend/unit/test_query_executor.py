@@ -0,0 +1,191 @@
+import pytest
+import asyncio
+from unittest.mock import MagicMock
+from backend.services.search.query_executor import QueryExecutor, ProviderCall
+from backend.providers.jobs.base import JobProvider
+from backend.providers.jobs.models import JobSearchRequest
+
+
+class SlowProvider:
+    """Fake provider that records peak concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def search(self, request):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if request.query == self.fail_on:
+                raise RuntimeError("boom")
+            return MagicMock(items=[f"{request.query}-job"])
+        finally:
+            self.in_flight -= 1
+
+
+def _calls(provider_name: str, n: int):
+    return [
+        ProviderCall(query=f"q{i}", domain="it", provider_name=provider_name, request=JobSearchRequest(query=f"q{i}"))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_queries_fan_out_concurrently():
+    provider = SlowProvider(delay=0.05)
+    executor = QueryExecutor({"p": provider}, default_limit=10)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    results = [r async for r in executor.run(_calls("p", 10))]
+    elapsed = loop.time() - started
+
+    assert len(results) == 10
+    assert provider.peak == 10
+    # Ten sequential calls would take ~0.5s
+    assert elapsed < 0.3
+
+
+@pytest.mark.asyncio
+async def test_per_provider_limit_is_respected():
+    fast = SlowProvider(delay=0.02)
+    limited = SlowProvider(delay=0.02)
+    executor = QueryExecutor({"fast": fast, "limited": limited}, limits={"limited": 2}, default_limit=8)
+
+    results = [r async for r in executor.run(_calls("fast", 8) + _calls("limited", 8))]
+
+    assert len(results) == 16
+    assert limited.peak == 2
+    assert fast.peak == 8
+
+
+@pytest.mark.asyncio
+async def test_errors_are_returned_per_call():
+    provider = SlowProvider(delay=0, fail_on="q1")
+    executor = QueryExecutor({"p": provider})
+
+    results = [r async for r in executor.run(_calls("p", 3))]
+
+    errors = [r for r in results if r.error]
+    assert len(errors) == 1
+    assert errors[0].call.query == "q1"
+    assert all(r.items for r in results if not r.error)
+
+
+@pytest.mark.asyncio
+async def test_stop_skips_remaining_calls():
+    provider = SlowProvider(delay=0.01)
+    executor = QueryExecutor({"p": provider}, default_limit=1)
+    checks = {"n": 0}
+
+    def should_stop():
+        checks["n"] += 1
+        return checks["n"] > 2
+
+    results = [r async for r in executor.run(_calls("p", 10), should_stop=should_stop)]
+
+    assert executor.stopped is True
+    assert len(results) == 2
+    assert provider.calls == 2
+
+
+class PagedProvider(JobProvider):
+    """Fake paginating provider yielding three pages per call."""
+
+    name = "paged"
+
+    def get_provider_info(self):
+        return None
+
+    async def search(self, request):
+        raise NotImplementedError
+
+    async def iter_search(self, request, page_slot=None):
+        for page in range(3):
+            async with page_slot():
+                await asyncio.sleep(0)
+            yield [f"{request.query}-{page}"]
+
+
+@pytest.mark.asyncio
+async def test_paginated_providers_stream_pages_and_mark_last():
+    executor = QueryExecutor({"paged": PagedProvider()})
+
+    results = [r async for r in executor.run(_calls("paged", 2))]
+
+    assert len(results) == 6
+    assert sum(r.done for r in results) == 2
+    for query in ("q0", "q1"):
+        pages = [r for r in results if r.call.query == query]
+        assert [r.items[0] for r in pages] == [f"{query}-0", f"{query}-1", f"{query}-2"]
+        assert [r.done for r in pages] == [False, False, True]
+
+
+@pytest.mark.asyncio
+async def test_shared_limits_cap_calls_across_executors():
+    from backend.services.search.governor import ConcurrencyBudgets
+    provider = SlowProvider(delay=0.02)
+    shared = ConcurrencyBudgets(default_limit=3)
+    executors = [QueryExecutor({"p": provider}, default_limit=8, shared_limits=shared) for _ in range(2)]
+
+    async def drain(executor):
+        return [r async for r in executor.run(_calls("p", 6))]
+
+    results = await asyncio.gather(*(drain(e) for e in executors))
+
+    assert sum(len(r) for r in results) == 12
+    assert provider.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_pagination_stops_after_a_page_with_nothing_new():
+    known = {"q0-1"}
+    executor = QueryExecutor({"paged": PagedProvider()}, is_known=known.__contains__)
+
+    results = [r async for r in executor.run(_calls("paged", 1))]
+
+    # q0-1 is already stored, so q0-2 (older) is never fetched
+    assert [r.items[0] for r in results] == ["q0-0", "q0-1"]
+    assert [r.done for r in results] == [False, True]
+
+
+
+class EndlessPagedProvider(JobProvider):
+    def __init__(self):
+        self.fetched = 0
+
+    def name(self):
+        return "endless"
+
+    def get_provider_info(self):
+        return MagicMock(accepted_domains=["*"])
+
+    async def search(self, request):
+        raise NotImplementedError
+
+    async def iter_search(self, request, page_slot=None):
+        for page in range(50):
+            async with page_slot():
+                self.fetched += 1
+            yield [f"{request.query}-{page}"]
+
+
+@pytest.mark.asyncio
+async def test_fetching_waits_for_a_slow_consumer():
+    provider = EndlessPagedProvider()
+    executor = QueryExecutor({"endless": provider}, queue_size=2)
+
+    ahead = []
+    async for _ in executor.run(_calls("endless", 1)):
+        await asyncio.sleep(0.001)  # slow pipeline stage
+        ahead.append(provider.fetched)
+
+    assert len(ahead) == 50
+    # Each step: the page just read, the queued ones and the look-ahead page
+    assert max(fetched - consumed for consumed, fetched in enumerate(ahead, 1)) <= 4
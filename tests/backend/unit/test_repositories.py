@@ -169,3 +169,42 @@ def test_job_repository_get_by_user_pagination(job_repo, test_user, db_session):
     
     jobs = job_repo.get_by_user(test_user.id, skip=1, limit=2)
     assert len(jobs) == 2
+
+
+def test_bulk_upsert_scraped_jobs_returns_ids_for_new_and_existing(job_repo, db_session):
+    existing = _create_scraped_job(db_session, platform="test", platform_job_id="a")
+    rows = [
+        {"platform": "test", "platform_job_id": pid, "title": "T", "company": "C", "external_url": f"u-{pid}"}
+        for pid in ("a", "b", "c")
+    ]
+
+    ids = job_repo.bulk_upsert_scraped_jobs(rows)
+    db_session.commit()
+
+    assert set(ids) == {("test", "a"), ("test", "b"), ("test", "c")}
+    assert ids[("test", "a")] == existing.id
+    assert db_session.query(ScrapedJob).count() == 3
+
+
+@pytest.mark.parametrize("dialect", ["sqlite", "generic"])
+def test_bulk_upsert_scraped_jobs_backfills_missing_summary_and_coordinates(job_repo, db_session, dialect, monkeypatch):
+    old = _create_scraped_job(db_session, platform="test", platform_job_id="old")
+    kept = _create_scraped_job(db_session, platform="test", platform_job_id="kept")
+    kept.summary, kept.latitude, kept.longitude = {"title": "Kept"}, 46.0, 7.0
+    db_session.commit()
+    if dialect == "generic":
+        monkeypatch.setattr(db_session.get_bind().dialect, "name", "generic")
+
+    rows = [
+        {"platform": "test", "platform_job_id": pid, "title": "New title", "company": "C",
+         "external_url": f"u-{pid}", "summary": {"title": "New"}, "latitude": 47.37, "longitude": 8.54}
+        for pid in ("old", "kept")
+    ]
+    job_repo.bulk_upsert_scraped_jobs(rows)
+    db_session.commit()
+    db_session.expire_all()
+
+    old, kept = db_session.get(ScrapedJob, old.id), db_session.get(ScrapedJob, kept.id)
+    assert (old.summary, old.latitude, old.longitude) == ({"title": "New"}, 47.37, 8.54)
+    assert old.title == "Test Job"  # first writer still wins elsewhere
+    assert (kept.summary, kept.latitude, kept.longitude) == ({"title": "Kept"}, 46.0, 7.0)
@@ -1,20 +1,27 @@
+import asyncio
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import sessionmaker
 from backend.services.scheduler import (
     get_scheduler, add_schedule, remove_schedule, 
     get_all_schedules, start_scheduler, stop_scheduler,
-    _run_scheduled_search
+    sync_schedules, _run_scheduled_search, _lead_once
 )
+from backend.models import SearchProfile
 import backend.services.scheduler as scheduler_mod
 
 @pytest.fixture(autouse=True)
-def reset_scheduler_state():
+def reset_scheduler_state(monkeypatch):
+    monkeypatch.setattr(scheduler_mod.settings, "SCHEDULER_JOBSTORE", "memory")
+    monkeypatch.setattr(scheduler_mod.settings, "SCHEDULER_START_JITTER_SECONDS", 0)
     scheduler_mod._scheduler = None
+    scheduler_mod._is_leader = False
     yield
     if scheduler_mod._scheduler and scheduler_mod._scheduler.running:
         scheduler_mod._scheduler.shutdown()
     scheduler_mod._scheduler = None
+    scheduler_mod._is_leader = False
 
 def test_get_scheduler():
     s1 = get_scheduler()
@@ -22,7 +29,8 @@ def test_get_scheduler():
     assert s1 is s2
     assert s1 is not None
 
-def test_add_schedule():
+def test_add_schedule(monkeypatch):
+    monkeypatch.setattr(scheduler_mod.settings, "SCHEDULER_START_JITTER_SECONDS", 600)
     mock_scheduler = MagicMock()
     with patch("backend.services.scheduler.get_scheduler", return_value=mock_scheduler):
         add_schedule(1, 24)
@@ -30,6 +38,8 @@ def test_add_schedule():
         args, kwargs = mock_scheduler.add_job.call_args
         assert kwargs["id"] == "search_profile_1"
         assert kwargs["args"] == [1]
+        # Start jitter is applied once, in next_run_time, not again per interval
+        assert kwargs["trigger"].jitter is None
 
 def test_remove_schedule():
     mock_scheduler = MagicMock()
@@ -60,17 +70,23 @@ async def test_run_scheduled_search_success():
     mock_profile = MagicMock()
     mock_profile.id = 1
     mock_profile.schedule_enabled = True
+    mock_profile.schedule_interval_hours = 24
+    mock_profile.last_scheduled_run = None
+    mock_profile.search_completed_through = None
     mock_db.query.return_value.filter.return_value.first.return_value = mock_profile
     
     mock_search_service = AsyncMock()
+    mock_search_service.run_search.return_value = True
     
     with patch("backend.services.scheduler.SessionLocal", return_value=mock_db), \
          patch("backend.services.scheduler.get_search_service", return_value=mock_search_service):
         await _run_scheduled_search(1)
         
-        mock_search_service.run_search.assert_awaited_once_with(1)
-        mock_db.commit.assert_called_once()
-        assert mock_profile.last_scheduled_run is not None
+        mock_search_service.run_search.assert_awaited_once_with(1, since=None)
+        # The last run time is claimed with a conditional UPDATE, and the
+        # completed run then advances the incremental checkpoint
+        assert mock_db.query.return_value.filter.return_value.update.call_count == 2
+        assert mock_db.commit.call_count == 2
 
 @pytest.mark.asyncio
 async def test_run_scheduled_search_profile_not_found():
@@ -96,21 +112,28 @@ async def test_run_scheduled_search_disabled():
         await _run_scheduled_search(1)
         mock_search_service.run_search.assert_not_awaited()
 
-def test_start_scheduler():
+@pytest.mark.asyncio
+async def test_start_scheduler_starts_paused_and_competes_for_the_lease():
     mock_scheduler = MagicMock()
     mock_scheduler.running = False
-    mock_db = MagicMock()
-    mock_profile = MagicMock()
-    mock_profile.id = 1
-    mock_profile.schedule_interval_hours = 12
-    mock_db.query.return_value.filter.return_value.all.return_value = [mock_profile]
     
     with patch("backend.services.scheduler.get_scheduler", return_value=mock_scheduler), \
-         patch("backend.services.scheduler.SessionLocal", return_value=mock_db), \
-         patch("backend.services.scheduler.add_schedule") as mock_add:
+         patch("backend.services.scheduler._lead", new=AsyncMock()) as mock_lead:
         start_scheduler()
-        mock_scheduler.start.assert_called_once()
-        mock_add.assert_called_once_with(1, 12)
+        mock_scheduler.start.assert_called_once_with(paused=True)
+        await scheduler_mod._lease_task
+        mock_lead.assert_awaited_once()
+        stop_scheduler()
+        assert scheduler_mod._lease_task is None
+
+def test_pause_scheduler_leaves_running_jobs_alone():
+    mock_scheduler = MagicMock()
+    mock_scheduler.running = True
+    scheduler_mod._scheduler = mock_scheduler
+
+    scheduler_mod.pause_scheduler()
+    mock_scheduler.pause.assert_called_once()
+    mock_scheduler.shutdown.assert_not_called()
 
 def test_stop_scheduler():
     mock_scheduler = MagicMock()
@@ -119,3 +142,151 @@ def test_stop_scheduler():
     
     stop_scheduler()
     mock_scheduler.shutdown.assert_called_once()
+
+
+# ── DB-backed behaviour ──
+
+@pytest.fixture
+async def paused_scheduler():
+    scheduler = get_scheduler()
+    scheduler.start(paused=True)
+    yield scheduler
+    scheduler.shutdown(wait=False)
+
+def _profile(db_session, **kwargs):
+    profile = SearchProfile(user_id=1, name="p", role_description="dev", cv_content="cv", **kwargs)
+    db_session.add(profile)
+    db_session.commit()
+    return profile
+
+@pytest.mark.asyncio
+async def test_sync_schedules_catches_up_missed_runs_once(db_session, paused_scheduler):
+    now = datetime.now(timezone.utc)
+    overdue = _profile(db_session, schedule_enabled=True, schedule_interval_hours=24,
+                       last_scheduled_run=now - timedelta(hours=30))
+    recent = _profile(db_session, schedule_enabled=True, schedule_interval_hours=12,
+                      last_scheduled_run=now - timedelta(hours=1))
+    never = _profile(db_session, schedule_enabled=True, schedule_interval_hours=6)
+    disabled = _profile(db_session, schedule_enabled=False)
+
+    scheduler = paused_scheduler
+    add_schedule(disabled.id, 24)
+
+    with patch("backend.services.scheduler.SessionLocal", sessionmaker(bind=db_session.get_bind())):
+        sync_schedules()
+
+    jobs = {job.id: job for job in scheduler.get_jobs()}
+    assert set(jobs) == {f"search_profile_{p.id}" for p in (overdue, recent, never)}
+    # A missed interval is one run now, not one per missed interval
+    assert jobs[f"search_profile_{overdue.id}"].next_run_time <= datetime.now(timezone.utc)
+    assert abs(jobs[f"search_profile_{recent.id}"].next_run_time - (now + timedelta(hours=11))) < timedelta(minutes=1)
+    assert jobs[f"search_profile_{never.id}"].next_run_time > now + timedelta(hours=5)
+
+@pytest.mark.asyncio
+async def test_run_scheduled_search_skips_a_run_already_claimed(db_session):
+    recent = datetime.now(timezone.utc) - timedelta(hours=1)
+    profile = _profile(db_session, schedule_enabled=True, schedule_interval_hours=24, last_scheduled_run=recent,
+                       search_completed_through=recent - timedelta(hours=24))
+    mock_search_service = AsyncMock()
+
+    with patch("backend.services.scheduler.SessionLocal", sessionmaker(bind=db_session.get_bind())), \
+         patch("backend.services.scheduler.get_search_service", return_value=mock_search_service):
+        await _run_scheduled_search(profile.id)
+        mock_search_service.run_search.assert_not_awaited()
+
+        db_session.query(SearchProfile).filter(SearchProfile.id == profile.id).update(
+            {SearchProfile.last_scheduled_run: recent - timedelta(hours=24)}
+        )
+        db_session.commit()
+        await _run_scheduled_search(profile.id)
+        # Incremental: postings since the last completed run (with some overlap)
+        mock_search_service.run_search.assert_awaited_once_with(
+            profile.id, since=recent - timedelta(hours=24) - scheduler_mod.INCREMENTAL_OVERLAP
+        )
+
+    db_session.expire_all()
+    assert db_session.get(SearchProfile, profile.id).last_scheduled_run.replace(tzinfo=timezone.utc) > recent
+
+@pytest.mark.asyncio
+async def test_lead_once_resumes_only_while_holding_the_lease(paused_scheduler):
+    lease = MagicMock(holder="me")
+    scheduler = paused_scheduler
+
+    with patch("backend.services.scheduler.sync_schedules") as mock_sync:
+        lease.acquire.return_value = True
+        await _lead_once(lease)
+        assert scheduler_mod.is_leader()
+        assert scheduler.state == 1  # running
+        mock_sync.assert_called_once()
+
+        lease.acquire.return_value = False
+        await _lead_once(lease)
+        assert not scheduler_mod.is_leader()
+        assert scheduler.state == 2  # paused
+
+        lease.acquire.side_effect = RuntimeError("db down")
+        await _lead_once(lease)
+        assert not scheduler_mod.is_leader()
+
+def test_next_run_time_spreads_due_runs_with_jitter(monkeypatch):
+    monkeypatch.setattr(scheduler_mod.settings, "SCHEDULER_START_JITTER_SECONDS", 600)
+    now = datetime.now(timezone.utc)
+    overdue = now - timedelta(hours=48)
+    times = {scheduler_mod._next_run_time(24, overdue) for _ in range(20)}
+    assert len(times) > 1
+    assert all(now <= t <= now + timedelta(seconds=601) for t in times)
+
+@pytest.mark.asyncio
+async def test_scheduled_runs_wait_for_a_global_slot(db_session, monkeypatch):
+    from backend.services.search.governor import SearchGovernor
+    governor = SearchGovernor(max_concurrent_searches=1)
+    monkeypatch.setattr(scheduler_mod, "search_governor", governor)
+    profiles = [_profile(db_session, schedule_enabled=True, schedule_interval_hours=24) for _ in range(3)]
+
+    in_flight, peak = 0, 0
+    async def run_search(profile_id, since=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+    service = MagicMock(run_search=run_search)
+
+    with patch("backend.services.scheduler.SessionLocal", sessionmaker(bind=db_session.get_bind())), \
+         patch("backend.services.scheduler.get_search_service", return_value=service):
+        await asyncio.gather(*(_run_scheduled_search(p.id) for p in profiles))
+
+    assert peak == 1
+    assert governor.running == governor.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_only_completed_runs_advance_the_incremental_checkpoint(db_session):
+    checkpoint = datetime.now(timezone.utc) - timedelta(hours=48)
+    profile = _profile(db_session, schedule_enabled=True, schedule_interval_hours=24,
+                       last_scheduled_run=checkpoint, search_completed_through=checkpoint)
+    mock_search_service = AsyncMock()
+    mock_search_service.run_search.return_value = False  # failed or stopped
+
+    def reset_claim():
+        db_session.query(SearchProfile).filter(SearchProfile.id == profile.id).update(
+            {SearchProfile.last_scheduled_run: checkpoint}
+        )
+        db_session.commit()
+
+    def stored_checkpoint():
+        db_session.expire_all()
+        return db_session.get(SearchProfile, profile.id).search_completed_through.replace(tzinfo=timezone.utc)
+
+    with patch("backend.services.scheduler.SessionLocal", sessionmaker(bind=db_session.get_bind())), \
+         patch("backend.services.scheduler.get_search_service", return_value=mock_search_service):
+        await _run_scheduled_search(profile.id)
+        assert stored_checkpoint() == checkpoint
+
+        # The next run still covers the window the failed one missed
+        reset_claim()
+        mock_search_service.run_search.return_value = True
+        await _run_scheduled_search(profile.id)
+        since = checkpoint - scheduler_mod.INCREMENTAL_OVERLAP
+        assert mock_search_service.run_search.await_args_list[-1].kwargs == {"since": since}
+        assert stored_checkpoint() > checkpoint
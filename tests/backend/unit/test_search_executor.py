@@ -1,11 +1,9 @@
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
-from datetime import datetime
-from backend.services.search.search_executor import process_job_listing
+from backend.services.search.search_executor import save_job_analysis, check_listings_relevance
 from backend.models import Job, ScrapedJob
 
-@pytest.mark.asyncio
-async def test_process_job_listing_relevant():
+def test_save_job_analysis_creates_scraped_job_and_job():
     # Setup mocks
     mock_listing = MagicMock()
     mock_listing.title = "Software Engineer"
@@ -32,47 +30,26 @@ async def test_process_job_listing_relevant():
     mock_db = MagicMock()
     # Simulate that no existing ScrapedJob is found (single-filter query: .query().filter(*args).first())
     mock_db.query.return_value.filter.return_value.first.return_value = None
-    
-    with patch("backend.services.search.search_executor.llm_service") as mock_llm:
-        mock_llm.check_title_relevance.return_value = {"relevant": True}
-        mock_llm.analyze_job_match.return_value = {
-            "affinity_score": 85,
-            "affinity_analysis": "Great",
-            "worth_applying": True
-        }
-        
-        result = await process_job_listing(mock_listing, profile_dict, mock_db)
-        
-        assert result is True
-        # Now we expect two add() calls: one for ScrapedJob, one for Job
-        assert mock_db.add.call_count == 2
-        
-        # The first add() is for ScrapedJob
-        scraped_job = mock_db.add.call_args_list[0][0][0]
-        assert isinstance(scraped_job, ScrapedJob)
-        assert scraped_job.title == "Software Engineer"
-        
-        # The second add() is for Job
-        job = mock_db.add.call_args_list[1][0][0]
-        assert isinstance(job, Job)
-        assert job.affinity_score == 85
 
-@pytest.mark.asyncio
-async def test_process_job_listing_irrelevant():
-    mock_listing = MagicMock(title="Chef")
-    profile_dict = {"role_description": "Dev"}
-    mock_db = MagicMock()
-    
-    with patch("backend.services.search.search_executor.llm_service") as mock_llm:
-        mock_llm.check_title_relevance.return_value = {"relevant": False}
-        
-        result = await process_job_listing(mock_listing, profile_dict, mock_db)
-        
-        assert result is False
-        mock_db.add.assert_not_called()
+    analysis = {"affinity_score": 85, "affinity_analysis": "Great", "worth_applying": True}
 
-@pytest.mark.asyncio
-async def test_process_job_listing_jobroom_fallback_url():
+    result = save_job_analysis(mock_listing, analysis, profile_dict, mock_db)
+
+    assert result is True
+    # Two add() calls: one for ScrapedJob, one for Job
+    assert mock_db.add.call_count == 2
+
+    # The first add() is for ScrapedJob
+    scraped_job = mock_db.add.call_args_list[0][0][0]
+    assert isinstance(scraped_job, ScrapedJob)
+    assert scraped_job.title == "Software Engineer"
+
+    # The second add() is for Job
+    job = mock_db.add.call_args_list[1][0][0]
+    assert isinstance(job, Job)
+    assert job.affinity_score == 85
+
+def test_save_job_analysis_jobroom_fallback_url():
     mock_listing = MagicMock()
     mock_listing.title = "JobRoom Job"
     mock_listing.source = "job_room"
@@ -90,18 +67,13 @@ async def test_process_job_listing_jobroom_fallback_url():
     mock_db = MagicMock()
     mock_db.query.return_value.filter.return_value.first.return_value = None
 
-    with patch("backend.services.search.search_executor.llm_service") as mock_llm:
-        mock_llm.check_title_relevance.return_value = {"relevant": True}
-        mock_llm.analyze_job_match.return_value = {"affinity_score": 0}
-        
-        await process_job_listing(mock_listing, profile_dict, mock_db)
-        
-        # ScrapedJob should be the first add call with the fallback URL
-        scraped_job = mock_db.add.call_args_list[0][0][0]
-        assert scraped_job.external_url == "https://www.job-room.ch/job-search/JR999"
+    save_job_analysis(mock_listing, {"affinity_score": 0}, profile_dict, mock_db)
 
-@pytest.mark.asyncio
-async def test_process_job_listing_with_distance():
+    # ScrapedJob should be the first add call with the fallback URL
+    scraped_job = mock_db.add.call_args_list[0][0][0]
+    assert scraped_job.external_url == "https://www.job-room.ch/job-search/JR999"
+
+def test_save_job_analysis_with_distance():
     mock_listing = MagicMock()
     mock_listing.title = "Distance Job"
     mock_listing.location = MagicMock()
@@ -126,13 +98,54 @@ async def test_process_job_listing_with_distance():
     mock_db = MagicMock()
     mock_db.query.return_value.filter.return_value.first.return_value = None
 
+    save_job_analysis(mock_listing, {"affinity_score": 0}, profile_dict, mock_db)
+
+    # Job is the second add call
+    job = mock_db.add.call_args_list[1][0][0]
+    assert job.distance_km is not None
+    assert job.distance_km > 0
+
+    # Listing coordinates are kept on the shared row for local geo search
+    scraped_job = mock_db.add.call_args_list[0][0][0]
+    assert (scraped_job.latitude, scraped_job.longitude) == (47.37, 8.54)
+
+
+@pytest.mark.asyncio
+async def test_check_listings_relevance_uses_one_batch_call():
+    listings = [MagicMock(title="Developer"), MagicMock(title="Chef"), MagicMock(title="Engineer")]
+
     with patch("backend.services.search.search_executor.llm_service") as mock_llm:
-        mock_llm.check_title_relevance.return_value = {"relevant": True}
-        mock_llm.analyze_job_match.return_value = {"affinity_score": 0}
-        
-        await process_job_listing(mock_listing, profile_dict, mock_db)
-        
-        # Job is the second add call
-        job = mock_db.add.call_args_list[1][0][0]
-        assert job.distance_km is not None
-        assert job.distance_km > 0
+        mock_llm.acheck_titles_relevance = AsyncMock(return_value=[
+            {"relevant": True}, {"relevant": False}, {},
+        ])
+        result = await check_listings_relevance(listings, {"role_description": "Dev"})
+
+    assert result == [True, False, True]
+    mock_llm.acheck_titles_relevance.assert_awaited_once_with(["Developer", "Chef", "Engineer"], "Dev")
+
+
+def test_save_job_analysis_backfills_existing_scraped_job():
+    mock_listing = MagicMock()
+    mock_listing.title = "Backfill Job"
+    mock_listing.location = MagicMock(city="Zurich")
+    mock_listing.location.coordinates = MagicMock(lat=47.37, lon=8.54)
+    mock_listing.descriptions = []
+    mock_listing.source = "test"
+    mock_listing.id = "1"
+    mock_listing.language_skills = []
+    mock_listing.employment = None
+    mock_listing.application = None
+    mock_listing.publication = None
+    mock_listing.company = None
+    mock_listing.summary = None
+
+    existing = ScrapedJob(id=7, platform="test", platform_job_id="1", title="Old")
+    mock_db = MagicMock()
+    mock_db.query.return_value.filter.return_value.first.return_value = existing
+    profile_dict = {"id": 1, "user_id": 1, "latitude": None, "longitude": None}
+
+    assert save_job_analysis(mock_listing, {"affinity_score": 0}, profile_dict, mock_db) is True
+
+    assert (existing.latitude, existing.longitude) == (47.37, 8.54)
+    assert existing.summary["title"] == "Backfill Job"
+    assert existing.title == "Old"
@@ -1,7 +1,8 @@
 import pytest
 import asyncio
-from unittest.mock import MagicMock, patch, AsyncMock
-from backend.services.search_service import SearchService, get_compatible_providers
+from unittest.mock import ANY, MagicMock, patch, AsyncMock
+from backend.services.search.search_plan import plan_fingerprint, reusable_plan
+from backend.services.search_service import SearchService, get_compatible_providers, search_provider_names
 
 
 # ─── Domain Router Tests ───
@@ -53,7 +54,9 @@ def mock_profile_repo():
 
 @pytest.fixture
 def search_service(mock_job_repo, mock_profile_repo):
-    return SearchService(mock_job_repo, mock_profile_repo)
+    # Stop checks open their own session; route them to the same mocked repo
+    with patch("backend.services.search_service.ProfileRepository", return_value=mock_profile_repo):
+        yield SearchService(mock_job_repo, mock_profile_repo, session_factory=MagicMock())
 
 @pytest.mark.asyncio
 async def test_run_search_success(search_service, mock_profile_repo, mock_job_repo):
@@ -69,33 +72,55 @@ async def test_run_search_success(search_service, mock_profile_repo, mock_job_re
     mock_profile.contract_type = "any"
     mock_profile.latitude = None
     mock_profile.longitude = None
+    mock_profile.role_description = "Software Engineer"
+    mock_profile.search_plan = None
     mock_profile_repo.get.return_value = mock_profile
     
     mock_job_repo.get_user_job_identifiers.return_value = []
     
     mock_provider = MagicMock()
     mock_provider.get_provider_info.return_value = MagicMock(accepted_domains=["*"])
-    mock_provider.search = AsyncMock(return_value=MagicMock(items=[MagicMock(id="job1", source="test", external_url="url1")]))
+    mock_provider.search = AsyncMock(return_value=MagicMock(items=[MagicMock(id="job1", source="test", external_url="url1", title="Software Engineer")]))
     
     with patch("backend.services.search_service.llm_service") as mock_llm, \
-         patch("backend.services.search_service.init_status"), \
+         patch("backend.services.search_service.init_status") as mock_init, \
          patch("backend.services.search_service.add_log"), \
-         patch("backend.services.search_service.update_status"), \
+         patch("backend.services.search_service.update_status") as mock_update, \
          patch("backend.services.search_service.JobRoomProvider", return_value=mock_provider), \
          patch("backend.services.search_service.SwissDevJobsProvider", return_value=mock_provider), \
          patch("backend.services.search_service.LocalDbProvider", return_value=mock_provider), \
-         patch("backend.services.search_service.process_job_listing", return_value=True):
+         patch("backend.services.search.pipeline.update_status"), \
+         patch("backend.services.search.pipeline.add_log"), \
+         patch("backend.services.search.pipeline.check_listings_relevance", AsyncMock(side_effect=lambda listings, profile: [True] * len(listings))), \
+         patch("backend.services.search.pipeline.analyze_listing", AsyncMock(return_value={"affinity_score": 80})), \
+         patch("backend.services.search.pipeline.JobBatchWriter") as mock_writer_cls:
         
         # New format: domain instead of provider
-        mock_llm.generate_search_plan.return_value = [
+        mock_llm.agenerate_search_plan = AsyncMock(return_value=[
             {"domain": "it", "query": "Software Engineer", "type": "occupation", "language": "en"}
-        ]
+        ])
         
-        await search_service.run_search(1)
+        # A run without errors or a stop reports that it completed
+        assert await search_service.run_search(1) is True
+
+        # Initialised once (a re-init would clear a stop requested mid-plan);
+        # the plan's totals are filled in afterwards
+        mock_init.assert_called_once_with(1)
+        mock_update.assert_any_call(1, total_searches=ANY, searches_generated=[
+            {"domain": "it", "query": "Software Engineer", "type": "occupation", "language": "en"}
+        ])
         
-        mock_llm.generate_search_plan.assert_called_once()
+        mock_llm.agenerate_search_plan.assert_awaited_once()
         # All 3 providers should be called since domain=it matches both generalists AND it-only
         assert mock_provider.search.await_count >= 1
+        # The same listing from three providers is deduplicated before persisting
+        mock_writer_cls.return_value.add.assert_called_once()
+        # The generated plan is saved with the fingerprint of its inputs
+        mock_profile_repo.update.assert_any_call(mock_profile, {
+            "search_plan": [{"domain": "it", "query": "Software Engineer", "type": "occupation", "language": "en"}],
+            "search_plan_fingerprint": plan_fingerprint(mock_profile, search_provider_names()),
+            "search_plan_generated_at": ANY,
+        })
 
 @pytest.mark.asyncio
 async def test_run_search_stopped_by_user(search_service, mock_profile_repo):
@@ -116,6 +141,204 @@ async def test_run_search_no_plan(search_service, mock_profile_repo):
          patch("backend.services.search_service.init_status"), \
          patch("backend.services.search_service.add_log"), \
          patch("backend.services.search_service.update_status") as mock_update:
-        mock_llm.generate_search_plan.return_value = []
+        mock_llm.agenerate_search_plan = AsyncMock(return_value=[])
         await search_service.run_search(1)
         mock_update.assert_any_call(1, state="done", jobs_found=0, jobs_new=0)
+
+
+def test_stop_check_reads_committed_flag_from_fresh_session(db_session, test_user):
+    from sqlalchemy.orm import sessionmaker
+    from backend.models import SearchProfile
+    from backend.repositories.profile_repository import ProfileRepository
+
+    profile = SearchProfile(user_id=test_user.id, name="p", is_stopped=False)
+    db_session.add(profile)
+    db_session.commit()
+    session_factory = sessionmaker(bind=db_session.get_bind())
+
+    service = SearchService(MagicMock(), ProfileRepository(db_session), session_factory=session_factory)
+    assert service._is_stopped(profile.id) is False
+
+    other = session_factory()
+    other.query(SearchProfile).filter(SearchProfile.id == profile.id).update({"is_stopped": True})
+    other.commit()
+    other.close()
+
+    assert service._is_stopped(profile.id) is True
+
+
+@pytest.mark.asyncio
+async def test_in_process_stop_token_stops_search_without_db_polling(search_service, mock_profile_repo):
+    from backend.services.search_status import request_stop
+
+    mock_profile = MagicMock(id=1, user_id=42, max_queries=5, is_stopped=False, role_description="Dev",
+                             latitude=None, longitude=None, location_filter=None, workload_filter=None,
+                             posted_within_days=30, contract_type="any", search_plan=None)
+    mock_profile_repo.get.return_value = mock_profile
+
+    async def search(request):
+        request_stop(1)
+        return MagicMock(items=[])
+
+    mock_provider = MagicMock()
+    mock_provider.get_provider_info.return_value = MagicMock(accepted_domains=["*"])
+    mock_provider.search = AsyncMock(side_effect=search)
+
+    with patch("backend.services.search_service.llm_service") as mock_llm, \
+         patch("backend.services.search_service.init_status"), \
+         patch("backend.services.search_service.add_log"), \
+         patch("backend.services.search_service.update_status") as mock_update, \
+         patch("backend.services.search_service.JobRoomProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.SwissDevJobsProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.LocalDbProvider", return_value=mock_provider), \
+         patch("backend.services.search.pipeline.update_status"), \
+         patch("backend.services.search.pipeline.add_log"), \
+         patch("backend.services.search.pipeline.JobBatchWriter"), \
+         patch("backend.services.search_service.settings.SEARCH_PROVIDER_CONCURRENCY", 1), \
+         patch("backend.services.search_service.settings.SEARCH_PROVIDER_CONCURRENCY_OVERRIDES", ""):
+        mock_llm.agenerate_search_plan = AsyncMock(return_value=[
+            {"domain": "it", "query": f"Query {i}"} for i in range(10)
+        ])
+        assert await search_service.run_search(1) is False
+
+    # One search per provider at most before the token is seen
+    assert mock_provider.search.await_count <= 3
+    mock_update.assert_any_call(1, state="stopped", error="Search stopped by user.")
+    # Setup read + the background watcher's first poll; nothing per query
+    assert mock_profile_repo.get.call_count <= 2
+
+
+@pytest.mark.asyncio
+async def test_incremental_run_reuses_saved_plan_and_narrows_requests(search_service, mock_profile_repo, mock_job_repo):
+    from datetime import datetime, timezone
+    since = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    mock_profile = MagicMock(
+        id=1, user_id=42, max_queries=5, is_stopped=False, location_filter="", workload_filter=None,
+        posted_within_days=30, contract_type="any", latitude=None, longitude=None,
+        role_description="Software Engineer", cv_content="", search_strategy="",
+        search_plan=[{"domain": "it", "query": "Software Engineer"}], search_plan_pinned=False,
+    )
+    mock_profile.search_plan_fingerprint = plan_fingerprint(mock_profile, search_provider_names())
+    mock_profile_repo.get.return_value = mock_profile
+    mock_job_repo.get_profile_job_identifiers.return_value = []
+
+    mock_provider = MagicMock()
+    mock_provider.get_provider_info.return_value = MagicMock(accepted_domains=["*"])
+    mock_provider.search = AsyncMock(return_value=MagicMock(items=[]))
+
+    with patch("backend.services.search_service.llm_service") as mock_llm, \
+         patch("backend.services.search_service.get_provider_registry", return_value=None), \
+         patch("backend.services.search_service.init_status"), \
+         patch("backend.services.search_service.add_log"), \
+         patch("backend.services.search_service.update_status"), \
+         patch("backend.services.search_service.JobRoomProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.SwissDevJobsProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.LocalDbProvider", return_value=mock_provider), \
+         patch("backend.services.search.pipeline.update_status"), \
+         patch("backend.services.search.pipeline.add_log"), \
+         patch("backend.services.search.pipeline.JobBatchWriter"):
+        mock_llm.agenerate_search_plan = AsyncMock()
+
+        await search_service.run_search(1, since=since)
+
+        mock_llm.agenerate_search_plan.assert_not_awaited()
+        requests = [call.args[0] for call in mock_provider.search.await_args_list]
+        assert requests and all(r.posted_since == since for r in requests)
+        # The reused plan is not saved again
+        assert not any("search_plan" in c.args[1] for c in mock_profile_repo.update.call_args_list)
+
+
+# ─── Saved Search Plans ───
+
+def _plan_profile(**overrides):
+    fields = dict(cv_content="Python developer", role_description="Backend engineer",
+                  search_strategy="", max_queries=5, search_plan=None,
+                  search_plan_fingerprint=None, search_plan_pinned=False)
+    fields.update(overrides)
+    return MagicMock(**fields)
+
+
+def test_plan_fingerprint_tracks_plan_inputs():
+    providers = ["job_room", "local_db"]
+    base = plan_fingerprint(_plan_profile(), providers)
+
+    assert plan_fingerprint(_plan_profile(), reversed(providers)) == base
+    assert plan_fingerprint(_plan_profile(cv_content="Rust developer"), providers) != base
+    assert plan_fingerprint(_plan_profile(max_queries=6), providers) != base
+    assert plan_fingerprint(_plan_profile(), [*providers, "swissdevjobs"]) != base
+
+
+def test_reusable_plan_requires_matching_fingerprint_or_pin():
+    plan = [{"domain": "it", "query": "Engineer"}]
+    fingerprint = plan_fingerprint(_plan_profile(), ["job_room"])
+
+    assert reusable_plan(_plan_profile(), fingerprint) is None
+    assert reusable_plan(_plan_profile(search_plan=plan, search_plan_fingerprint=fingerprint), fingerprint) == plan
+    assert reusable_plan(_plan_profile(search_plan=plan, search_plan_fingerprint="stale"), fingerprint) is None
+    assert reusable_plan(_plan_profile(search_plan=plan, search_plan_fingerprint="stale",
+                                       search_plan_pinned=True), fingerprint) == plan
+
+
+@pytest.mark.asyncio
+async def test_unchanged_profile_reuses_plan_without_llm_call(search_service, mock_profile_repo, mock_job_repo):
+    mock_profile = _plan_profile(
+        id=1, user_id=42, is_stopped=False, location_filter="", workload_filter=None,
+        posted_within_days=30, contract_type="any", latitude=None, longitude=None,
+        search_plan=[{"domain": "it", "query": "Backend Engineer"}],
+    )
+    mock_profile.search_plan_fingerprint = plan_fingerprint(mock_profile, search_provider_names())
+    mock_profile_repo.get.return_value = mock_profile
+    mock_job_repo.get_profile_job_identifiers.return_value = []
+
+    mock_provider = MagicMock()
+    mock_provider.get_provider_info.return_value = MagicMock(accepted_domains=["*"])
+    mock_provider.search = AsyncMock(return_value=MagicMock(items=[]))
+
+    with patch("backend.services.search_service.llm_service") as mock_llm, \
+         patch("backend.services.search_service.get_provider_registry", return_value=None), \
+         patch("backend.services.search_service.init_status"), \
+         patch("backend.services.search_service.add_log"), \
+         patch("backend.services.search_service.update_status"), \
+         patch("backend.services.search_service.JobRoomProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.SwissDevJobsProvider", return_value=mock_provider), \
+         patch("backend.services.search_service.LocalDbProvider", return_value=mock_provider), \
+         patch("backend.services.search.pipeline.update_status"), \
+         patch("backend.services.search.pipeline.add_log"), \
+         patch("backend.services.search.pipeline.JobBatchWriter"):
+        mock_llm.agenerate_search_plan = AsyncMock()
+
+        await search_service.run_search(1)
+
+        mock_llm.agenerate_search_plan.assert_not_awaited()
+        requests = [call.args[0] for call in mock_provider.search.await_args_list]
+        # A manual run with a reused plan is still a full search
+        assert requests and all(r.posted_since is None and r.query == "Backend Engineer" for r in requests)
+
+
+# ─── CV Digest ───
+
+@pytest.mark.asyncio
+async def test_cv_digest_is_generated_once_per_cv_content(search_service, mock_profile_repo):
+    from backend.services.search.prompt_compaction import cv_digest_key
+
+    long_cv = "Built distributed systems in Python. " * 200
+    profile = MagicMock(cv_content=long_cv, cv_digest=None, cv_digest_hash=None)
+    digest = {"headline": "Senior backend engineer"}
+
+    with patch("backend.services.search_service.llm_service") as mock_llm, \
+         patch("backend.services.search_service.settings.LLM_MATCH_CV_TOKEN_BUDGET", 300):
+        mock_llm.agenerate_cv_digest = AsyncMock(return_value=digest)
+
+        assert await search_service._cv_digest(profile) == digest
+        mock_llm.agenerate_cv_digest.assert_awaited_once_with(long_cv, 300)
+        key = cv_digest_key(long_cv, 300)
+        mock_profile_repo.update.assert_called_once_with(profile, {"cv_digest": digest, "cv_digest_hash": key})
+
+        # Stored digest of the same CV: no new LLM call
+        profile.cv_digest, profile.cv_digest_hash = digest, key
+        assert await search_service._cv_digest(profile) == digest
+        assert mock_llm.agenerate_cv_digest.await_count == 1
+
+        # A CV within the budget is sent as it is
+        assert await search_service._cv_digest(MagicMock(cv_content="Short CV")) is None
+        assert mock_llm.agenerate_cv_digest.await_count == 1
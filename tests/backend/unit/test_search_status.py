@@ -3,17 +3,19 @@ from unittest.mock import MagicMock
 from backend.services.search_status import (
     init_status, add_log, update_status, get_status, 
     get_all_statuses, clear_status, register_task, 
-    unregister_task, cancel_task
+    unregister_task, cancel_task, request_stop, get_stop_event
 )
 import backend.services.search_status as ss
 
 @pytest.fixture(autouse=True)
 def reset_status_registry():
     """Reset the global in-memory dictionaries before each test."""
+    ss.set_status_backend(ss.InMemoryStatusBackend())
     with ss._lock:
-        ss._statuses.clear()
         ss._active_tasks.clear()
+        ss._stop_events.clear()
     yield
+    ss.set_status_backend(None)
 
 def test_init_status():
     init_status(1, total_searches=5, searches=[{"q": "test"}])
@@ -78,3 +80,88 @@ def test_task_lifecycle():
 
 def test_cancel_task_non_existent():
     assert cancel_task(999) is False
+
+
+@pytest.mark.asyncio
+async def test_request_stop_sets_registered_token():
+    event = register_task(1, MagicMock())
+    assert get_stop_event(1) is event
+    assert event.is_set() is False
+
+    assert request_stop(1) is True
+    assert event.is_set() is True
+
+    unregister_task(1)
+    assert get_stop_event(1) is None
+    assert request_stop(1) is False
+
+
+@pytest.mark.asyncio
+async def test_request_stop_from_another_thread():
+    import asyncio
+    event = register_task(1, MagicMock())
+
+    await asyncio.to_thread(request_stop, 1)
+    await asyncio.wait_for(event.wait(), timeout=1)
+
+def test_add_log_numbers_entries_per_run():
+    init_status(1)
+    add_log(1, "a")
+    add_log(1, "b")
+    assert [e["seq"] for e in get_status(1)["log"]] == [1, 2]
+    init_status(1)
+    add_log(1, "c")
+    assert [e["seq"] for e in get_status(1)["log"]] == [1]
+
+def test_reads_do_not_share_the_log_list():
+    init_status(1)
+    add_log(1, "a")
+    snapshot = get_status(1)
+    add_log(1, "b")
+    assert len(snapshot["log"]) == 1
+    assert len(get_all_statuses()[1]["log"]) == 2
+
+
+async def _search(profile_id, honour_stop=True, wind_down=0.0):
+    """Stand-in for run_search: registers itself and runs until stopped."""
+    import asyncio
+    event = register_task(profile_id, asyncio.current_task())
+    try:
+        if honour_stop:
+            await event.wait()
+            await asyncio.sleep(wind_down)  # saving what was analyzed
+            return "stopped"
+        await asyncio.sleep(60)
+    finally:
+        unregister_task(profile_id)
+
+
+@pytest.mark.asyncio
+async def test_stop_active_searches_stops_gracefully_and_cancels_stragglers():
+    import asyncio
+    polite = asyncio.create_task(_search(1))
+    stubborn = asyncio.create_task(_search(2, honour_stop=False))
+    await asyncio.sleep(0)
+
+    await ss.stop_active_searches(timeout=0.1)
+
+    assert polite.result() == "stopped"
+    assert stubborn.cancelled()
+    assert ss._active_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_stop_active_searches_also_stops_searches_started_meanwhile():
+    import asyncio
+
+    async def queued():
+        await asyncio.sleep(0.01)  # e.g. a scheduled run waiting for a slot
+        return await _search(2)
+
+    first = asyncio.create_task(_search(1, wind_down=0.05))
+    late = asyncio.create_task(queued())
+    await asyncio.sleep(0)
+
+    await ss.stop_active_searches(timeout=1)
+    assert first.result() == "stopped"
+    assert late.result() == "stopped"
@@ -0,0 +1,176 @@
+import time
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.db.base import Base
+from backend.models import SearchStatusRecord
+from backend.services.status_backend import DatabaseStatusBackend, InMemoryStatusBackend, LOG_LIMIT
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.drop_all(bind=engine)
+
+
+class ManualFlushBackend(DatabaseStatusBackend):
+    """No background flusher: tests decide when buffered writes hit the DB."""
+
+    def _schedule(self, urgent: bool = False):
+        pass
+
+
+@pytest.fixture
+def backend(session_factory):
+    backend = ManualFlushBackend(session_factory=session_factory)
+    yield backend
+    backend.close()
+
+
+def _entry(i):
+    return {"time": "t", "message": f"line {i}"}
+
+
+def _row(session_factory, profile_id):
+    db = session_factory()
+    try:
+        return db.query(SearchStatusRecord).filter_by(profile_id=profile_id).first()
+    finally:
+        db.close()
+
+
+def test_writes_are_visible_to_the_writer_before_flush(backend, session_factory):
+    backend.init(1, {"state": "generating", "jobs_found": 0})
+    backend.update(1, {"jobs_found": 3})
+    backend.append_log(1, _entry(0))
+
+    status = backend.get(1)
+    assert status["jobs_found"] == 3
+    assert [e["message"] for e in status["log"]] == ["line 0"]
+
+
+def test_many_updates_coalesce_into_one_row_write(backend, session_factory):
+    backend.init(1, {"state": "generating", "jobs_found": 0})
+    backend.flush()
+    for i in range(50):
+        backend.update(1, {"jobs_found": i})
+        backend.append_log(1, _entry(i))
+
+    assert _row(session_factory, 1).status["jobs_found"] == 0
+    backend.flush()
+
+    row = _row(session_factory, 1)
+    assert row.status["jobs_found"] == 49
+    assert len(row.log) == 50
+
+
+def test_other_process_reads_flushed_status(backend, session_factory):
+    other = ManualFlushBackend(session_factory=session_factory)
+    backend.init(7, {"state": "searching"})
+    for i in range(LOG_LIMIT + 10):
+        backend.append_log(7, _entry(i))
+    backend.flush()
+
+    status = other.get(7)
+    assert status["state"] == "searching"
+    assert len(status["log"]) == LOG_LIMIT
+    assert status["log"][-1]["message"] == f"line {LOG_LIMIT + 9}"
+    assert set(other.get_all()) == {7}
+    other.close()
+
+
+def test_reads_do_not_wait_for_a_flush_in_progress(backend):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    backend.init(1, {"state": "searching", "jobs_found": 0})
+    backend.flush()
+    backend.update(1, {"jobs_found": 2})
+    backend.append_log(1, {**_entry(0), "seq": 1})
+
+    applying, release = threading.Event(), threading.Event()
+    apply = backend._apply
+
+    def slow_apply(*args):
+        applying.set()
+        release.wait(5)
+        apply(*args)
+
+    backend._apply = slow_apply
+    flusher = threading.Thread(target=backend.flush)
+    flusher.start()
+    assert applying.wait(5)
+
+    # The flush holds its lock and has not committed: the read neither waits
+    # for it nor misses the batch
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        try:
+            status = pool.submit(backend.get, 1).result(timeout=2)
+        finally:
+            release.set()
+            flusher.join(5)
+    assert status["jobs_found"] == 2
+    assert [e["message"] for e in status["log"]] == ["line 0"]
+
+    # Committed now; the batch is not laid over the row a second time
+    assert [e["message"] for e in backend.get(1)["log"]] == ["line 0"]
+    assert backend.get_all()[1]["jobs_found"] == 2
+
+
+def test_stop_signal_crosses_processes_and_resets_on_init(backend, session_factory):
+    other = ManualFlushBackend(session_factory=session_factory)
+    backend.init(3, {"state": "searching"})
+    backend.flush()
+
+    other.signal_stop(3)
+    assert backend.stop_signalled(3) is True
+
+    backend.init(3, {"state": "generating"})
+    backend.flush()
+    assert backend.stop_signalled(3) is False
+    other.close()
+
+
+def test_terminal_state_is_flushed_by_background_thread(session_factory):
+    backend = DatabaseStatusBackend(session_factory=session_factory, flush_interval=60)
+    backend.init(2, {"state": "searching"})
+    backend.update(2, {"state": "done"})
+
+    for _ in range(100):
+        row = _row(session_factory, 2)
+        if row is not None and row.status["state"] == "done":
+            break
+        time.sleep(0.01)
+    assert row.status["state"] == "done"
+    backend.close()
+
+
+def test_clear_and_updates_without_init(backend):
+    backend.update(9, {"state": "searching"})
+    backend.flush()
+    assert backend.get(9) is None
+
+    backend.init(9, {"state": "searching"})
+    backend.flush()
+    backend.clear(9)
+    assert backend.get(9) is None
+    backend.flush()
+    assert backend.get_all() == {}
+
+
+def test_in_memory_backend_keeps_last_log_entries():
+    backend = InMemoryStatusBackend()
+    backend.init(1, {"state": "generating"})
+    for i in range(LOG_LIMIT + 5):
+        backend.append_log(1, _entry(i))
+
+    assert len(backend.get(1)["log"]) == LOG_LIMIT
+    assert backend.get(2) is None
@@ -0,0 +1,139 @@
+import asyncio
+import json
+
+import pytest
+
+import backend.services.search_status as ss
+from backend.services.search_status import add_log, clear_status, init_status, update_status
+from backend.services.status_stream import all_status_events, parse_event_id, status_events
+
+
+@pytest.fixture(autouse=True)
+def memory_backend():
+    ss.set_status_backend(ss.InMemoryStatusBackend())
+    yield
+    ss.set_status_backend(None)
+
+
+def _parse(message):
+    lines = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    return lines["id"], json.loads(lines["data"])
+
+
+def test_parse_event_id():
+    assert parse_event_id("2024-01-01T00:00:00+00:00#12") == ("2024-01-01T00:00:00+00:00", 12)
+    assert parse_event_id(None) == (None, 0)
+    assert parse_event_id("garbage") == (None, 0)
+
+
+async def test_first_event_is_a_full_snapshot_then_deltas():
+    init_status(1, total_searches=3)
+    add_log(1, "started")
+    stream = status_events(1, poll_interval=0)
+
+    event_id, data = _parse(await anext(stream))
+    assert data["reset"] is True
+    assert data["status"]["total_searches"] == 3
+    assert [e["message"] for e in data["log"]] == ["started"]
+    assert event_id.endswith("#1")
+
+    update_status(1, jobs_found=7)
+    add_log(1, "found")
+    event_id, data = _parse(await anext(stream))
+    assert data["reset"] is False
+    assert data["status"] == {"jobs_found": 7}
+    assert [e["message"] for e in data["log"]] == ["found"]
+    assert event_id.endswith("#2")
+    await stream.aclose()
+
+
+async def test_resume_sends_only_missed_log_lines():
+    init_status(1)
+    for message in ("a", "b", "c"):
+        add_log(1, message)
+    run = ss.get_status(1)["started_at"]
+
+    stream = status_events(1, last_event_id=f"{run}#2", poll_interval=0)
+    event_id, data = _parse(await anext(stream))
+    assert data["reset"] is False
+    assert data["status"]["state"] == "generating"
+    assert [e["message"] for e in data["log"]] == ["c"]
+    assert event_id == f"{run}#3"
+    await stream.aclose()
+
+
+async def test_new_run_resets_the_stream():
+    stream = status_events(1, last_event_id="2000-01-01T00:00:00+00:00#40", poll_interval=0)
+    init_status(1)
+    add_log(1, "fresh")
+    _, data = _parse(await anext(stream))
+    assert data["reset"] is True
+    assert [e["message"] for e in data["log"]] == ["fresh"]
+    await stream.aclose()
+
+
+async def test_idle_stream_sends_heartbeats_and_stops_on_disconnect():
+    init_status(1)
+    disconnected = False
+
+    async def is_disconnected():
+        return disconnected
+
+    stream = status_events(1, poll_interval=0, heartbeat=0, is_disconnected=is_disconnected)
+    await anext(stream)
+    assert await anext(stream) == ": keep-alive\n\n"
+    disconnected = True
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
+
+
+async def test_stream_wakes_on_change_without_waiting_for_the_poll():
+    init_status(1)
+    stream = status_events(1, poll_interval=60, heartbeat=60)
+    await anext(stream)
+
+    pending = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.01)
+    assert not pending.done()
+    update_status(1, jobs_found=3)
+    event_id, data = _parse(await asyncio.wait_for(pending, timeout=1))
+    assert data["status"] == {"jobs_found": 3}
+    await stream.aclose()
+
+
+def _parse_all(message):
+    lines = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    assert lines["event"] == "statuses"
+    return json.loads(lines["data"])
+
+
+async def test_all_statuses_stream_only_owned_profiles():
+    init_status(1)
+    init_status(2)
+
+    async def owns(profile_id):
+        return profile_id == 1
+
+    stream = all_status_events(owns, poll_interval=60, heartbeat=60)
+    data = _parse_all(await anext(stream))
+    assert list(data["profiles"]) == ["1"]
+    assert data["profiles"]["1"]["reset"] is True
+
+    update_status(2, jobs_found=5)
+    update_status(1, jobs_found=2)
+    data = _parse_all(await asyncio.wait_for(anext(stream), timeout=1))
+    assert data["profiles"] == {"1": {"reset": False, "status": {"jobs_found": 2}, "log": []}}
+
+    clear_status(1)
+    data = _parse_all(await asyncio.wait_for(anext(stream), timeout=1))
+    assert data == {"profiles": {}, "removed": [1]}
+    await stream.aclose()
+
+
+async def test_all_statuses_stream_starts_with_an_empty_event():
+    async def owns(profile_id):
+        return True
+
+    stream = all_status_events(owns, poll_interval=60, heartbeat=60)
+    assert _parse_all(await anext(stream)) == {"profiles": {}, "removed": []}
+    await stream.aclose()
@@ -0,0 +1,168 @@
+import pytest
+import asyncio
+import httpx
+from backend.providers.jobs.swissdevjobs.feed import JobsLightFeed
+from backend.providers.jobs.swissdevjobs.client import SwissDevJobsProvider
+from backend.providers.jobs.models import JobSearchRequest
+
+JOBS = [
+    {"name": "React Developer", "technologies": ["React"], "filterTags": [], "jobUrl": None},
+    {"name": "Java Engineer", "technologies": ["Java"], "filterTags": [], "jobUrl": None},
+]
+
+
+class FakeServer:
+    def __init__(self, delay: float = 0, fail: bool = False):
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            return httpx.Response(503)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=JOBS, headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2026 00:00:00 GMT"})
+
+    def feed(self) -> JobsLightFeed:
+        return JobsLightFeed(
+            "https://example.test/jobsLight",
+            client_factory=lambda: httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+        )
+
+
+@pytest.mark.asyncio
+async def test_fresh_snapshot_is_served_from_memory():
+    server = FakeServer()
+    feed = server.feed()
+
+    first = await feed.get(max_age=60)
+    second = await feed.get(max_age=60)
+
+    assert first is second
+    assert len(server.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_download():
+    server = FakeServer(delay=0.05)
+    feed = server.feed()
+
+    snapshots = await asyncio.gather(*(feed.get() for _ in range(10)))
+
+    assert len(server.requests) == 1
+    assert all(s is snapshots[0] for s in snapshots)
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshot_is_revalidated_with_etag():
+    server = FakeServer()
+    feed = server.feed()
+    first = await feed.get()
+
+    second = await feed.get(max_age=0)
+
+    assert len(server.requests) == 2
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert server.requests[1].headers["If-Modified-Since"] == "Wed, 01 Jan 2026 00:00:00 GMT"
+    assert second.jobs is first.jobs
+    assert second.index is first.index
+    assert second.fetched_at > first.fetched_at
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_serves_stale_snapshot():
+    server = FakeServer()
+    feed = server.feed()
+    first = await feed.get()
+
+    server.fail = True
+    assert await feed.get(max_age=0) is first
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await FakeServer(fail=True).feed().get()
+
+
+@pytest.mark.asyncio
+async def test_provider_filters_cached_feed_for_every_query():
+    server = FakeServer()
+    provider = SwissDevJobsProvider(feed=server.feed())
+
+    react = await provider.search(JobSearchRequest(query="react"))
+    java = await provider.search(JobSearchRequest(query="java"))
+
+    assert react.total_count == 1
+    assert java.total_count == 1
+    assert len(server.requests) == 1
+
+
+class DetailServer(FakeServer):
+    """jobsLight with 20 hydratable jobs plus a slow jobWithUrl endpoint."""
+
+    def __init__(self):
+        super().__init__()
+        self.detail_calls = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/jobsLight"):
+            jobs = [
+                {"_id": str(i), "name": f"Python Dev {i}", "technologies": ["Python"], "filterTags": [],
+                 "jobUrl": f"python-dev-{i}", "activeFrom": "2026-01-01", "company": "Acme"}
+                for i in range(20)
+            ]
+            return httpx.Response(200, json=jobs)
+
+        self.detail_calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            slug = request.url.path.rsplit("/", 1)[-1]
+            return httpx.Response(200, json=[{"name": slug, "description": "<p>Job</p>"}])
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.mark.asyncio
+async def test_details_are_hydrated_concurrently_and_cached():
+    from backend.providers.jobs.swissdevjobs.details import JobDetailCache
+
+    server = DetailServer()
+    cache = JobDetailCache()
+    provider = SwissDevJobsProvider(feed=server.feed(), detail_cache=cache, detail_concurrency=5)
+    provider._client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+
+    try:
+        first = await provider.search(JobSearchRequest(query="python", page_size=20))
+        second = await provider.search(JobSearchRequest(query="python", page_size=20))
+    finally:
+        await provider.close()
+
+    assert len(first.items) == 20
+    assert [job.title for job in first.items] == [f"python-dev-{i}" for i in range(20)]
+    assert server.peak == 5
+    # Second run is answered from the detail cache
+    assert server.detail_calls == 20
+    assert len(second.items) == 20
+    assert len(cache) == 20
+
+
+def test_detail_cache_key_changes_when_listing_is_republished():
+    from backend.providers.jobs.swissdevjobs.details import JobDetailCache, detail_cache_key
+
+    cache = JobDetailCache(max_entries=2)
+    old = detail_cache_key({"jobUrl": "a", "activeFrom": "2026-01-01"})
+    new = detail_cache_key({"jobUrl": "a", "activeFrom": "2026-02-01"})
+    cache.set(old, {"v": 1})
+
+    assert cache.get(new) is None
+    assert detail_cache_key({"name": "no slug"}) is None
+
+    cache.set(new, {"v": 2})
+    cache.set(("b", ""), {"v": 3})
+    assert cache.get(old) is None  # evicted as least recently used
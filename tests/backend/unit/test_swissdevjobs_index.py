@@ -0,0 +1,140 @@
+import random
+import pytest
+from backend.providers.jobs.models import (
+    ContractType, Coordinates, JobSearchRequest, LanguageSkillRequest, RadiusSearchRequest, WorkForm,
+)
+from backend.providers.jobs.swissdevjobs.filters import filter_jobs
+from backend.providers.jobs.swissdevjobs.index import FeedIndex
+from backend.services.utils import haversine_distance
+
+CITIES = [("Zürich", 47.37, 8.54), ("Bern", 46.95, 7.45), ("Geneva", 46.20, 6.14), ("Lugano", 46.00, 8.95)]
+TITLES = ["Senior React Developer", "Java Backend Engineer", "DevOps Engineer", "Data Scientist", "Full-Stack Dev"]
+TECHS = ["React", "Java", "Kubernetes", "Python", "Node.js", "C++"]
+TAGS = ["freelance", "contractor", "startup", "fintech"]
+
+
+def _feed(n: int = 300, seed: int = 7):
+    rng = random.Random(seed)
+    jobs = []
+    for i in range(n):
+        city, lat, lon = rng.choice(CITIES)
+        jobs.append({
+            "_id": str(i),
+            "name": rng.choice(TITLES),
+            "technologies": rng.sample(TECHS, 2),
+            "filterTags": rng.sample(TAGS, rng.randint(0, 2)),
+            "actualCity": city,
+            "cityCategory": city,
+            "company": rng.choice(["Acme AG", "Globex", "Initech"]),
+            "jobType": rng.choice(["Full-Time", "Part-Time", "Freelance"]),
+            "language": rng.choice(["English", "German", ""]),
+            "workplace": rng.choice(["remote", "hybrid", "onsite"]),
+            "latitude": lat + rng.uniform(-0.3, 0.3) if i % 10 else None,
+            "longitude": lon + rng.uniform(-0.3, 0.3) if i % 10 else None,
+        })
+    return jobs
+
+
+def _linear(jobs, request):
+    """The original per-query scan, kept as the reference behaviour."""
+    out = []
+    query = request.query.lower()
+    for job in jobs:
+        combined = f"{job['name'].lower()} {' '.join(t.lower() for t in job['technologies'])} " \
+                   f"{' '.join(t.lower() for t in job['filterTags'])}"
+        if query and not all(t in combined for t in query.split()):
+            continue
+        if request.location and not request.radius_search:
+            loc = request.location.lower()
+            if loc not in job["actualCity"].lower() and loc not in job["cityCategory"].lower():
+                continue
+        if request.radius_search:
+            if not (job["latitude"] and job["longitude"]):
+                continue
+            p = request.radius_search.geo_point
+            if haversine_distance(p.lat, p.lon, job["latitude"], job["longitude"]) > request.radius_search.distance:
+                continue
+        if request.company_name and request.company_name.lower() not in job["company"].lower():
+            continue
+        job_type = job["jobType"].lower()
+        if "part-time" in job_type and request.workload_min >= 90:
+            continue
+        if "full-time" in job_type and request.workload_max <= 80:
+            continue
+        if request.language_skills and job["language"]:
+            names = {"en": "english", "de": "german"}
+            if job["language"].lower() not in [names.get(l.language_code, l.language_code) for l in request.language_skills]:
+                continue
+        if WorkForm.HOME_OFFICE in request.work_forms and job["workplace"] not in ("remote", "hybrid"):
+            continue
+        tags = [t.lower() for t in job["filterTags"]]
+        is_temp = "freelance" in job_type or "freelance" in tags or "contractor" in tags
+        if request.contract_type == ContractType.PERMANENT and is_temp:
+            continue
+        if request.contract_type == ContractType.TEMPORARY and not is_temp:
+            continue
+        out.append(job)
+    return out
+
+
+def _radius(lat, lon, km):
+    return RadiusSearchRequest(geo_point=Coordinates(lat=lat, lon=lon), distance=km)
+
+
+REQUESTS = [
+    JobSearchRequest(),
+    JobSearchRequest(query="react"),
+    JobSearchRequest(query="Dev eng"),
+    JobSearchRequest(query="node.js c++"),
+    JobSearchRequest(query="nothing-matches"),
+    JobSearchRequest(query="java", location="zür"),
+    JobSearchRequest(query="engineer", radius_search=_radius(47.37, 8.54, 30)),
+    JobSearchRequest(radius_search=_radius(46.5, 7.0, 120)),
+    JobSearchRequest(radius_search=_radius(46.95, 7.45, 1000)),
+    JobSearchRequest(company_name="acme", workload_min=90),
+    JobSearchRequest(workload_max=60, work_forms=[WorkForm.HOME_OFFICE]),
+    JobSearchRequest(language_skills=[LanguageSkillRequest(language_code="de")]),
+    JobSearchRequest(query="python", contract_type=ContractType.TEMPORARY),
+    JobSearchRequest(query="data", contract_type=ContractType.PERMANENT),
+]
+
+
+@pytest.mark.parametrize("request_", REQUESTS)
+def test_index_matches_linear_scan(request_):
+    jobs = _feed()
+    expected = [j["_id"] for j in _linear(jobs, request_)]
+    assert [j["_id"] for j in FeedIndex(jobs).search(request_)] == expected
+
+
+def test_token_matches_inside_words():
+    index = FeedIndex([{"name": "Frontend Developer", "technologies": ["TypeScript"], "filterTags": []}])
+
+    assert len(index.search(JobSearchRequest(query="end script"))) == 1
+    assert index.search(JobSearchRequest(query="end scripts")) == []
+
+
+def test_filter_jobs_accepts_index_or_list():
+    jobs = _feed(20)
+    request = JobSearchRequest(query="dev")
+
+    assert filter_jobs(FeedIndex(jobs), request) == filter_jobs(jobs, request)
+
+
+def test_missing_fields_do_not_break_indexing():
+    index = FeedIndex([{"name": None, "latitude": "bad", "longitude": "x"}, {}])
+
+    assert len(index.search(JobSearchRequest())) == 2
+    assert index.search(JobSearchRequest(radius_search=_radius(47, 8, 50))) == []
+
+
+def test_posted_since_filters_on_active_from():
+    from datetime import datetime, timezone
+    jobs = [
+        {"_id": "old", "name": "React Dev", "activeFrom": "2026-01-01T08:00:00.000Z"},
+        {"_id": "new", "name": "React Dev", "activeFrom": "2026-03-01T08:00:00.000Z"},
+        {"_id": "undated", "name": "React Dev"},
+    ]
+    request = JobSearchRequest(query="react", posted_since=datetime(2026, 2, 1, tzinfo=timezone.utc))
+
+    # Listings without a date are kept rather than silently dropped
+    assert [j["_id"] for j in FeedIndex(jobs).search(request)] == ["new", "undated"]
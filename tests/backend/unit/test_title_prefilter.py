@@ -0,0 +1,66 @@
+import pytest
+from backend.services.search.title_prefilter import TitlePrefilter, word_similarity
+
+
+@pytest.fixture
+def prefilter():
+    return TitlePrefilter(
+        "I am looking for a junior backend developer role with Python",
+        ["Software Engineer", "Softwareentwickler", "Backend Developer", "Développeur logiciel"],
+    )
+
+
+def test_word_similarity_is_symmetric_and_bounded():
+    assert word_similarity("entwickler", "entwickler") == 1.0
+    assert word_similarity("koch", "engineer") == 0.0
+    assert word_similarity("developer", "developpeur") == word_similarity("developpeur", "developer")
+    assert 0 < word_similarity("developer", "developpeur") < 1
+
+
+@pytest.mark.parametrize("title", [
+    "Koch/Köchin 100%",
+    # Synonyms, abbreviations and other languages share no trigrams with the
+    # references, so nothing is rejected locally unless asked to
+    "Informatiker EFZ", "Programmierer", "Full-Stack Dev", "Ingénieur logiciel",
+    "SRE", "Cloud Architect", "IT Consultant", "Tech Lead",
+])
+def test_nothing_is_rejected_by_default(title):
+    prefilter = TitlePrefilter(
+        "Software Engineer with Python experience",
+        ["Software Engineer", "Softwareentwickler", "Python Developer", "Backend Developer"],
+    )
+    assert prefilter.classify(title) is not False
+
+
+@pytest.mark.parametrize("title", ["Koch/Köchin 100%", "Pflegefachfrau HF", "Verkäufer/in"])
+def test_obviously_irrelevant_titles_are_rejected_when_enabled(title):
+    prefilter = TitlePrefilter("Backend developer with Python", ["Software Engineer"], reject_below=0.35)
+    assert prefilter.classify(title) is False
+
+
+def test_role_words_like_lead_are_not_stopwords():
+    assert TitlePrefilter("Tech Lead").classify("Tech Lead Payments") is True
+
+
+@pytest.mark.parametrize("title", [
+    "Senior Software Engineer (m/w/d)",
+    "Softwareentwickler/in Java",
+    "Développeur Logiciel 80-100%",
+])
+def test_titles_containing_a_plan_query_are_accepted(prefilter, title):
+    assert prefilter.classify(title) is True
+
+
+@pytest.mark.parametrize("title", ["Data Engineer", "Fullstack Entwickler"])
+def test_partial_matches_are_left_to_the_llm(prefilter, title):
+    assert prefilter.classify(title) is None
+
+
+def test_short_role_description_counts_as_phrase():
+    assert TitlePrefilter("Data Scientist").classify("Senior Data Scientist") is True
+
+
+def test_without_references_everything_is_ambiguous():
+    prefilter = TitlePrefilter("", [])
+    assert prefilter.enabled is False
+    assert prefilter.classify("Koch") is None
@@ -1,7 +1,7 @@
 import math
 import pytest
 from fastapi import UploadFile, HTTPException
-from backend.services.utils import clean_html_tags, haversine_distance
+from backend.services.utils import bounding_box, clean_html_tags, haversine_distance
 
 def test_clean_html_tags_empty():
     assert clean_html_tags("") == ""
@@ -31,6 +31,14 @@ def test_haversine_distance_known_points():
     dist = haversine_distance(zrh_lat, zrh_lon, bern_lat, bern_lon)
     assert 90.0 < dist < 100.0
 
+def test_bounding_box_contains_radius():
+    zrh_lat, zrh_lon = 47.3769, 8.5417
+    min_lat, max_lat, min_lon, max_lon = bounding_box(zrh_lat, zrh_lon, 50)
+    # Points exactly 50 km north / east lie on (or just inside) the box edges
+    assert haversine_distance(zrh_lat, zrh_lon, max_lat, zrh_lon) <= 50.01
+    assert haversine_distance(zrh_lat, zrh_lon, zrh_lat, max_lon) >= 49.9
+    assert min_lat < zrh_lat < max_lat and min_lon < zrh_lon < max_lon
+
 @pytest.mark.asyncio
 async def test_extract_text_from_file_txt():
     from io import BytesIO